@@ -14,8 +14,7 @@ os.environ["PYTHONUNBUFFERED"] = "1"
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-import httpx as _httpx
-
+from grms.config import settings
 from grms.llm.ollama_provider import OllamaProvider
 from grms.models.events import GeopoliticalEvent
 from grms.models.leader import LeaderProfile
@@ -23,31 +22,9 @@ from grms.models.scoring import KnownOutcome
 from grms.services.leader_service import LeaderService
 from grms.services.scoring_service import DIMENSION_WEIGHTS, TONE_SIMILARITY
 
-# Patch OllamaProvider to use a longer timeout for A/B testing
-_orig_generate = OllamaProvider.generate
-
-async def _patched_generate(self, system_prompt: str, user_prompt: str) -> str:
-    from grms.config import settings
-    payload = {
-        "model": self.model,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        "stream": False,
-        "options": {
-            "temperature": settings.llm_temperature,
-            "num_predict": 8192,
-            **({"seed": settings.llm_seed} if settings.llm_seed is not None else {}),
-        },
-    }
-    async with _httpx.AsyncClient(timeout=300.0) as client:
-        resp = await client.post(f"{self.host}/api/chat", json=payload)
-        resp.raise_for_status()
-        data = resp.json()
-        return data["message"]["content"]
-
-OllamaProvider.generate = _patched_generate
+# Longer timeout and completion budget for A/B testing; the providers' shared client picks these up
+settings.llm_timeout = 300.0
+settings.llm_max_tokens = 8192
 
 
 MODELS = ["mistral:7b", "gemma4:31b"]
@@ -101,19 +78,17 @@ class ModelRunner:
         self.service.provider.model = model_name
 
     async def predict(self, leader: LeaderProfile, event: GeopoliticalEvent):
-        return await self.service.predict(leader, event)
+        return await self.service.predict(leader, event, use_cache=False)
 
     async def warmup(self):
         """Load model into VRAM with a trivial request."""
-        import httpx
         payload = {
             "model": self.model_name,
             "messages": [{"role": "user", "content": "Say OK"}],
             "stream": False,
             "options": {"temperature": 0.0, "num_predict": 5},
         }
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            await client.post(f"{self.service.provider.host}/api/chat", json=payload)
+        await self.service.provider.client.post("/api/chat", json=payload)
 
 
 async def run_ab_test():
@@ -230,6 +205,7 @@ async def run_ab_test():
     with open(output_path, "w") as f:
         json.dump({"models": MODELS, "results": results, "timings": timings}, f, indent=2, default=str)
     print(f"\nDetailed results saved to: {output_path}")
+    await OllamaProvider.aclose_clients()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Calibrate cognitive formula weights against the scoring scenarios.
+
+Fits layer and interaction weights to the known outcomes with k-fold
+cross-validation and writes the fitted formula to grms/data/formulas, where the
+engine loads it on startup (select it with formula_version).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from grms.models.scoring import ScoringCase
+from grms.services.calibration_service import CalibrationService
+from grms.services.cognitive_formula import FORMULAS_DIR, write_formula_spec
+
+SCORING_DIR = Path(__file__).parent / "grms" / "data" / "scoring"
+
+
+def load_cases(paths: list[Path]) -> list[ScoringCase]:
+    cases = []
+    for path in paths:
+        cases.extend(ScoringCase(**c) for c in json.loads(path.read_text()))
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", type=Path, help="Scoring case files (default: all in grms/data/scoring)")
+    parser.add_argument("--base", default=None, help="Formula version to start from (default: built-in formula)")
+    parser.add_argument("--name", default=None, help="Name of the fitted formula (default: <base>_calibrated)")
+    parser.add_argument("--folds", type=int, default=5, help="Cross-validation folds; 0 or 1 skips CV")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--maxiter", type=int, default=200)
+    parser.add_argument("--popsize", type=int, default=20)
+    parser.add_argument("--regularization", type=float, default=0.01)
+    parser.add_argument("--output-dir", type=Path, default=FORMULAS_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="Report scores without writing the formula")
+    args = parser.parse_args()
+
+    paths = args.scenarios or sorted(SCORING_DIR.glob("*.json"))
+    cases = load_cases(paths)
+    print(f"Calibrating on {len(cases)} cases from {', '.join(p.name for p in paths)}")
+
+    result = CalibrationService().calibrate(
+        cases,
+        base_version=args.base,
+        name=args.name,
+        folds=args.folds,
+        seed=args.seed,
+        maxiter=args.maxiter,
+        popsize=args.popsize,
+        regularization=args.regularization,
+    )
+
+    if result.folds:
+        print(f"\n{'fold':>4}  {'train':>6}  {'test':>6}  {'base':>6}")
+        for f in result.folds:
+            print(f"{f.fold:>4}  {f.train_score:6.3f}  {f.test_score:6.3f}  {f.baseline_test_score:6.3f}")
+        print(f"\nCV held-out score: {result.cv_test_score:.3f} (base formula {result.baseline_cv_test_score:.3f})")
+    print(f"All-case score:    {result.fitted_score:.3f} (base formula {result.baseline_score:.3f})")
+    print(f"Weight sets evaluated: {result.weight_sets_evaluated} in {result.elapsed_seconds:.1f}s")
+
+    print("\nLayer weights:")
+    for layer, spec in result.formula.layers.items():
+        print(f"  {layer:12s} {spec.weight:.4f}")
+    print("Interaction weights:")
+    for term in result.formula.interaction_terms:
+        print(f"  {' × '.join(term.layers):55s} {term.weight:.4f}")
+
+    if not args.dry_run:
+        path = write_formula_spec(result.formula, args.output_dir)
+        print(f"\nFormula '{result.formula.name}' written to: {path}")
+
+
+if __name__ == "__main__":
+    main()
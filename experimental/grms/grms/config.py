@@ -17,12 +17,34 @@ class Settings(BaseSettings):
 
     llm_seed: int | None = None
 
+    llm_timeout: float = 120.0
+    llm_connect_timeout: float = 10.0
+    llm_max_connections: int = 8
+    llm_max_keepalive_connections: int = 8
+    llm_keepalive_expiry: float = 300.0
+
+    llm_scheduler_initial_limit: int = 2
+    llm_scheduler_min_limit: int = 1
+    llm_scheduler_max_limit: int = 8
+    llm_scheduler_backoff: float = 0.5
+
     openai_api_key: str = ""
     aws_region: str = "us-east-1"
     bedrock_model_id: str = "anthropic.claude-3-sonnet-20240229-v1:0"
+    bedrock_max_concurrency: int = 8
 
     db_path: str = "./data/grms_scoring.db"
 
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_hours: float = 24 * 30
+    llm_cache_max_entries: int = 50_000
+
+    cognitive_leader_cache_size: int = 1024
+    cognitive_batch_chunk_size: int = 2048
+
+    population_max_agents: int = 10_000_000
+    population_response_cache_size: int = 4096
+
     class Config:
         env_prefix = "GRMS_"
         env_file = ".env"
@@ -1,4 +1,4 @@
-"""Async SQLite database for persisting scoring run history."""
+"""Async SQLite database for persisting scoring run history and cached LLM responses."""
 
 import json
 import logging
@@ -87,12 +87,22 @@ CREATE TABLE IF NOT EXISTS predictions (
     scored_at TEXT
 );
 
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+
 CREATE INDEX IF NOT EXISTS idx_case_results_run_id ON case_results(run_id);
 CREATE INDEX IF NOT EXISTS idx_scoring_runs_run_at ON scoring_runs(run_at);
 CREATE INDEX IF NOT EXISTS idx_scoring_runs_era ON scoring_runs(scenario_era);
 CREATE INDEX IF NOT EXISTS idx_predictions_historical_date ON predictions(historical_date);
 CREATE INDEX IF NOT EXISTS idx_predictions_leader_name ON predictions(leader_name);
 CREATE INDEX IF NOT EXISTS idx_predictions_overall_score ON predictions(overall_score);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used_at ON llm_responses(last_used_at);
 """
 
 
@@ -338,6 +348,63 @@ async def get_scored_predictions(leader_name: str | None = None) -> list[dict]:
     return [dict(row) for row in await cursor.fetchall()]
 
 
+async def get_llm_response(key: str, min_created_at: float, now: float) -> str | None:
+    """Cached response for ``key`` if it was stored after ``min_created_at``; marks it used."""
+    db = await get_db()
+    cursor = await db.execute(
+        "SELECT response FROM llm_responses WHERE key = ? AND created_at >= ?", (key, min_created_at)
+    )
+    row = await cursor.fetchone()
+    if row is None:
+        return None
+    await db.execute("UPDATE llm_responses SET last_used_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+    await db.commit()
+    return row["response"]
+
+
+async def persist_llm_response(key: str, model: str, response: str, now: float) -> None:
+    db = await get_db()
+    await db.execute(
+        """INSERT OR REPLACE INTO llm_responses (key, model, response, created_at, last_used_at, hits)
+           VALUES (?, ?, ?, ?, ?, 0)""",
+        (key, model, response, now, now),
+    )
+    await db.commit()
+
+
+async def evict_llm_responses(min_created_at: float, max_entries: int) -> int:
+    """Drop responses stored before ``min_created_at``, then all but the ``max_entries`` most recently used."""
+    db = await get_db()
+    cursor = await db.execute("DELETE FROM llm_responses WHERE created_at < ?", (min_created_at,))
+    evicted = cursor.rowcount
+    cursor = await db.execute(
+        """DELETE FROM llm_responses WHERE key IN (
+               SELECT key FROM llm_responses ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+           )""",
+        (max_entries,),
+    )
+    evicted += cursor.rowcount
+    await db.commit()
+    return evicted
+
+
+async def get_llm_response_stats() -> dict:
+    db = await get_db()
+    cursor = await db.execute(
+        """SELECT COUNT(*) AS entries, COALESCE(SUM(hits), 0) AS stored_hits,
+                  COALESCE(SUM(LENGTH(response)), 0) AS response_bytes
+           FROM llm_responses"""
+    )
+    return dict(await cursor.fetchone())
+
+
+async def clear_llm_responses() -> int:
+    db = await get_db()
+    cursor = await db.execute("DELETE FROM llm_responses")
+    await db.commit()
+    return cursor.rowcount
+
+
 async def close_db() -> None:
     global _db
     if _db is not None:
@@ -9,6 +9,10 @@ class LLMProvider(Protocol):
     async def generate(self, system_prompt: str, user_prompt: str) -> str: ...
 
 
+def provider_model(provider: LLMProvider) -> str:
+    return getattr(provider, "model", None) or getattr(provider, "model_id", None) or type(provider).__name__
+
+
 def get_provider() -> LLMProvider:
     match settings.llm_source:
         case "openai":
@@ -1,17 +1,43 @@
 """AWS Bedrock LLM provider."""
 
+import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+from botocore.config import Config
 
 from grms.config import settings
 
 
 class BedrockProvider:
+    """Bedrock chat client; the blocking boto3 call runs on a shared, bounded thread pool.
+
+    At most ``settings.bedrock_max_concurrency`` calls are in flight, the rest
+    queue. A caller cancelled while its call is still queued never reaches
+    Bedrock; one already running finishes in its thread and is discarded.
+    """
+
+    _executor: ThreadPoolExecutor | None = None
+
     def __init__(self):
-        self.client = boto3.client("bedrock-runtime", region_name=settings.aws_region)
+        self.client = boto3.client(
+            "bedrock-runtime",
+            region_name=settings.aws_region,
+            config=Config(
+                max_pool_connections=settings.bedrock_max_concurrency,
+                connect_timeout=settings.llm_connect_timeout,
+                read_timeout=settings.llm_timeout,
+            ),
+        )
         self.model_id = settings.bedrock_model_id
 
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(settings.bedrock_max_concurrency, thread_name_prefix="bedrock")
+        return cls._executor
+
     async def generate(self, system_prompt: str, user_prompt: str) -> str:
         body = json.dumps({
             "anthropic_version": "bedrock-2023-05-31",
@@ -20,6 +46,16 @@ class BedrockProvider:
             "system": system_prompt,
             "messages": [{"role": "user", "content": user_prompt}],
         })
+        return await asyncio.get_running_loop().run_in_executor(self.executor(), self._invoke, body)
+
+    def _invoke(self, body: str) -> str:
         response = self.client.invoke_model(modelId=self.model_id, body=body)
         result = json.loads(response["body"].read())
         return result["content"][0]["text"]
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Drop queued calls and release the pool's threads without waiting for running ones."""
+        executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
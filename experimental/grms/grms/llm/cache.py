@@ -0,0 +1,109 @@
+"""Content-addressed cache of LLM responses, persisted in the scoring database.
+
+A response is keyed by a hash of the rendered prompts and every setting that
+shapes the completion (provider, model, temperature, max tokens, seed). Only
+deterministic requests are cached: temperature 0 or a fixed seed. Cache errors
+are logged and fall through to the provider, never failing a prediction.
+"""
+
+import hashlib
+import json
+import logging
+import time
+
+from grms import db
+from grms.config import settings
+from grms.llm.base import LLMProvider, provider_model
+from grms.llm.scheduler import Priority, Ticket, scheduler
+
+logger = logging.getLogger("grms.llm.cache")
+
+EVICT_EVERY = 64  # stored responses between TTL/size eviction passes
+
+
+def cache_key(provider: LLMProvider, system_prompt: str, user_prompt: str) -> str:
+    material = json.dumps([
+        type(provider).__name__,
+        provider_model(provider),
+        settings.llm_temperature,
+        settings.llm_max_tokens,
+        settings.llm_seed,
+        system_prompt,
+        user_prompt,
+    ])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._stored = 0
+
+    @staticmethod
+    def cacheable() -> bool:
+        return settings.llm_cache_enabled and (settings.llm_temperature == 0.0 or settings.llm_seed is not None)
+
+    async def generate(
+        self,
+        provider: LLMProvider,
+        system_prompt: str,
+        user_prompt: str,
+        use_cache: bool = True,
+        priority: Priority | Ticket = Priority.INTERACTIVE,
+    ) -> str:
+        """``provider.generate`` through the scheduler, answered from the cache when an identical request was seen.
+
+        With ``use_cache=False`` the provider is always called and its response
+        replaces any cached one. Cache hits never wait in the scheduler's queue.
+        """
+        if not self.cacheable():
+            return await scheduler.generate(provider, system_prompt, user_prompt, priority)
+
+        key = cache_key(provider, system_prompt, user_prompt)
+        if use_cache:
+            try:
+                cached = await db.get_llm_response(key, self._min_created_at(), time.time())
+            except Exception as e:
+                logger.warning("LLM cache lookup failed: %s", e)
+                cached = None
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        response = await scheduler.generate(provider, system_prompt, user_prompt, priority)
+        try:
+            await db.persist_llm_response(key, provider_model(provider), response, time.time())
+            self._stored += 1
+            if self._stored % EVICT_EVERY == 1:
+                await self.evict()
+        except Exception as e:
+            logger.warning("LLM cache store failed: %s", e)
+        return response
+
+    async def evict(self) -> int:
+        return await db.evict_llm_responses(self._min_created_at(), settings.llm_cache_max_entries)
+
+    async def clear(self) -> int:
+        self.hits = self.misses = 0
+        return await db.clear_llm_responses()
+
+    async def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.cacheable(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "ttl_hours": settings.llm_cache_ttl_hours,
+            "max_entries": settings.llm_cache_max_entries,
+            **await db.get_llm_response_stats(),
+        }
+
+    @staticmethod
+    def _min_created_at() -> float:
+        return time.time() - settings.llm_cache_ttl_hours * 3600.0
+
+
+response_cache = LLMResponseCache()
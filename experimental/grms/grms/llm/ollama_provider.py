@@ -1,15 +1,87 @@
 """Ollama LLM provider."""
 
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
 import httpx
 
 from grms.config import settings
 
+LATENCY_WINDOW = 1024  # most recent request latencies kept for percentiles
+
+
+@dataclass
+class ClientStats:
+    """Request latency and connection reuse for one pooled client."""
+
+    requests: int = 0
+    errors: int = 0
+    new_connections: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    async def trace(self, event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.new_connections += 1
+
+    def summary(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(q: float) -> float | None:
+            return latencies[min(int(q * len(latencies)), len(latencies) - 1)] if latencies else None
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "new_connections": self.new_connections,
+            "connection_reuse": 1.0 - self.new_connections / self.requests if self.requests else 0.0,
+            "latency_p50_s": percentile(0.5),
+            "latency_p95_s": percentile(0.95),
+            "latency_max_s": latencies[-1] if latencies else None,
+        }
+
 
 class OllamaProvider:
+    """Ollama chat client; every instance talking to the same host shares one pooled ``httpx.AsyncClient``.
+
+    The pool lives until ``aclose_clients`` (the app's shutdown hook), so
+    keep-alive connections are reused across predictions.
+    """
+
+    _clients: dict[str, httpx.AsyncClient] = {}
+    _stats: dict[str, ClientStats] = {}
+
     def __init__(self):
         self.host = settings.llm_host
         self.model = settings.llm_model
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        client = self._clients.get(self.host)
+        if client is None or client.is_closed:
+            stats = self._stats.setdefault(self.host, ClientStats())
+            client = self._clients[self.host] = httpx.AsyncClient(
+                base_url=self.host,
+                timeout=httpx.Timeout(settings.llm_timeout, connect=settings.llm_connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_keepalive_connections,
+                    keepalive_expiry=settings.llm_keepalive_expiry,
+                ),
+                event_hooks={"request": [self._attach_trace(stats)]},
+            )
+        return client
+
+    @property
+    def stats(self) -> ClientStats:
+        return self._stats.setdefault(self.host, ClientStats())
+
+    @staticmethod
+    def _attach_trace(stats: ClientStats):
+        async def hook(request: httpx.Request) -> None:
+            request.extensions["trace"] = stats.trace
+        return hook
+
     async def generate(self, system_prompt: str, user_prompt: str) -> str:
         payload = {
             "model": self.model,
@@ -24,8 +96,26 @@ class OllamaProvider:
                 **({"seed": settings.llm_seed} if settings.llm_seed is not None else {}),
             },
         }
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.post(f"{self.host}/api/chat", json=payload)
+        stats = self.stats
+        started = time.perf_counter()
+        stats.requests += 1
+        try:
+            resp = await self.client.post("/api/chat", json=payload)
             resp.raise_for_status()
             data = resp.json()
-            return data["message"]["content"]
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.latencies.append(time.perf_counter() - started)
+        return data["message"]["content"]
+
+    @classmethod
+    def client_stats(cls) -> dict[str, dict]:
+        return {host: stats.summary() for host, stats in cls._stats.items()}
+
+    @classmethod
+    async def aclose_clients(cls) -> None:
+        clients, cls._clients = cls._clients, {}
+        for client in clients.values():
+            await client.aclose()
@@ -0,0 +1,202 @@
+"""Priority scheduling and adaptive concurrency for LLM calls.
+
+Each model (provider class + model name) gets its own queue and concurrency
+limit. Waiting calls are served by priority, then arrival, so an interactive
+prediction overtakes a queued scoring batch; a call shared by several
+requests (see ``Ticket``) is promoted when a higher-priority one joins.
+
+The limit follows AIMD. While the recent latency (the median of the last
+RECENT_WINDOW successful calls) stays within LATENCY_TOLERANCE of the baseline
+(the median of the last BASELINE_WINDOW), every completed call grows it by
+1/limit (about one slot per limit's worth of calls); an error, or recent
+latency beyond the tolerance, halves it, at most once per round of calls
+already in flight. Medians ignore single fast or slow calls, so latencies
+that vary without load leave the limit alone.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from enum import IntEnum
+
+from grms.config import settings
+from grms.llm.base import LLMProvider, provider_model
+
+LATENCY_TOLERANCE = 2.0  # recent latency beyond this multiple of the baseline counts as congestion
+RECENT_WINDOW = 16  # successful calls whose median latency is the recent latency
+BASELINE_WINDOW = 512  # successful calls whose median latency is the baseline
+METRICS_WINDOW = 1024  # most recent waits and latencies kept for percentiles
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+def _percentile(values: deque, q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class Ticket:
+    """One call's place in its model's queue.
+
+    Requests sharing a call share its ticket; ``promote`` moves the call up to
+    a joining request's higher priority, even while it is already queued.
+    """
+
+    def __init__(self, priority: Priority = Priority.INTERACTIVE):
+        self.priority = priority
+        self._queue: "ModelQueue | None" = None
+        self._waiter: asyncio.Future | None = None
+        self._order = 0
+
+    def promote(self, priority: Priority) -> None:
+        if priority >= self.priority:
+            return
+        self.priority = priority
+        if self._queue is not None and self._waiter is not None and not self._waiter.done():
+            self._queue._enqueue(self)  # the entry at the old priority is skipped when popped
+
+
+class ModelQueue:
+    """Waiting calls and the AIMD concurrency limit for one model."""
+
+    def __init__(self):
+        self.limit = float(settings.llm_scheduler_initial_limit)
+        self.in_flight = 0
+        self.completed = 0
+        self.errors = 0
+        self.decreases = 0
+        self.baseline: float | None = None
+        self.recent: float | None = None
+        self._successes: deque = deque(maxlen=BASELINE_WINDOW)
+        self._recent: deque = deque(maxlen=RECENT_WINDOW)
+        self._last_decrease = 0.0
+        self._waiting: list[tuple[int, int, Ticket, asyncio.Future]] = []
+        self._pending = 0  # callers still waiting; ``_waiting`` also holds cancelled and superseded entries
+        self._order = itertools.count()
+        self.waits = {p: deque(maxlen=METRICS_WINDOW) for p in Priority}
+        self.latencies = deque(maxlen=METRICS_WINDOW)
+
+    async def acquire(self, ticket: Ticket) -> None:
+        if self.in_flight < int(self.limit) and not self._pending:
+            self.in_flight += 1
+            return
+        ticket._waiter = waiter = asyncio.get_running_loop().create_future()
+        ticket._queue, ticket._order = self, next(self._order)
+        self._pending += 1
+        self._enqueue(ticket)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # the slot was handed over just as the caller went away
+            else:
+                self._pending -= 1
+            raise
+        finally:
+            ticket._queue = ticket._waiter = None
+
+    def _enqueue(self, ticket: Ticket) -> None:
+        heapq.heappush(self._waiting, (ticket.priority, ticket._order, ticket, ticket._waiter))
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        while self._waiting and self.in_flight < int(self.limit):
+            priority, _, ticket, waiter = heapq.heappop(self._waiting)
+            if not waiter.done() and priority == ticket.priority:
+                self._pending -= 1
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def record(self, started: float, latency: float, failed: bool) -> None:
+        """Adjust the limit after a call that started at ``started`` (monotonic) and took ``latency`` seconds."""
+        self.completed += 1
+        self.latencies.append(latency)
+        if failed:
+            self.errors += 1
+        else:
+            self._successes.append(latency)
+            self._recent.append(latency)
+            self.baseline = _percentile(self._successes, 0.5)
+            self.recent = _percentile(self._recent, 0.5)
+
+        congested = failed or (self.baseline is not None and self.recent > LATENCY_TOLERANCE * self.baseline)
+        if congested and started >= self._last_decrease:
+            self.limit = max(float(settings.llm_scheduler_min_limit), self.limit * settings.llm_scheduler_backoff)
+            self._last_decrease = time.monotonic()
+            self.decreases += 1
+        elif not congested:
+            self.limit = min(float(settings.llm_scheduler_max_limit), self.limit + 1.0 / self.limit)
+
+    def queued(self) -> dict[str, int]:
+        depth = {p.name.lower(): 0 for p in Priority}
+        for priority, _, ticket, waiter in self._waiting:
+            if not waiter.done() and priority == ticket.priority:
+                depth[Priority(priority).name.lower()] += 1
+        return depth
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued(),
+            "completed": self.completed,
+            "errors": self.errors,
+            "limit_decreases": self.decreases,
+            "baseline_latency_s": self.baseline,
+            "recent_latency_s": self.recent,
+            "latency_p95_s": _percentile(self.latencies, 0.95),
+            "wait_p50_s": {p.name.lower(): _percentile(w, 0.5) for p, w in self.waits.items()},
+            "wait_p95_s": {p.name.lower(): _percentile(w, 0.95) for p, w in self.waits.items()},
+        }
+
+
+class LLMScheduler:
+    def __init__(self):
+        self.queues: dict[str, ModelQueue] = {}
+
+    async def generate(
+        self,
+        provider: LLMProvider,
+        system_prompt: str,
+        user_prompt: str,
+        priority: Priority | Ticket = Priority.INTERACTIVE,
+    ) -> str:
+        """``provider.generate`` once the model's queue admits the call.
+
+        Pass a ``Ticket`` instead of a priority to be able to promote the call later.
+        """
+        ticket = priority if isinstance(priority, Ticket) else Ticket(priority)
+        key = f"{type(provider).__name__}:{provider_model(provider)}"
+        queue = self.queues.get(key)
+        if queue is None:
+            queue = self.queues[key] = ModelQueue()
+
+        enqueued = time.monotonic()
+        await queue.acquire(ticket)
+        started = time.monotonic()
+        queue.waits[ticket.priority].append(started - enqueued)
+        try:
+            response = await provider.generate(system_prompt, user_prompt)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            queue.record(started, time.monotonic() - started, failed=True)
+            raise
+        else:
+            queue.record(started, time.monotonic() - started, failed=False)
+            return response
+        finally:
+            queue.release()
+
+    def stats(self) -> dict[str, dict]:
+        return {key: queue.stats() for key, queue in self.queues.items()}
+
+
+scheduler = LLMScheduler()
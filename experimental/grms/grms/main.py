@@ -1,27 +1,52 @@
 """GRMS - Geopolitical Response Modeling Service."""
 
+import asyncio
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import Literal
 from uuid import UUID, uuid4, uuid5, NAMESPACE_URL
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+import numpy as np
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from grms.config import settings
 from grms.models import (
     CombinedResponse,
+    CoupledSimulationResponse,
     GeopoliticalEvent,
     LeaderDecisionContext,
     LeaderProfile,
     LeaderResponse,
+    PopulationBatchResponse,
     PopulationProfile,
     PopulationResponse,
+    PopulationSweepAxis,
+    PopulationSweepResult,
+)
+from grms.models.cognitive import (
+    CognitiveDistributionResult,
+    CognitiveFormulaSpec,
+    CognitiveSensitivityResult,
+    CognitiveWhatIfResult,
+    PerturbationSpec,
+    WhatIfDelta,
 )
 from grms.models.scoring import AblationResult, BatchRunResult, BrierDecomposition, ConfidenceCalibration, KnownOutcome, PredictionScore, ScoreDimension, ScoringCase, StakeholderReport
+from grms.llm.cache import response_cache
+from grms.llm.ollama_provider import OllamaProvider
+from grms.llm.scheduler import Priority, scheduler
+from grms.services.baselines import CognitiveOnlyPredictor
+from grms.services.cognitive_analysis_service import CognitiveAnalysisService
+from grms.services.cognitive_engine import CognitiveDecisionEngine
+from grms.services.coupled_simulation import CoupledSimulationService
 from grms.services.leader_service import LeaderService
 from grms.services.population_service import PopulationService
+from grms.services.registry import LeaderRegistry, PopulationRegistry
 from grms.services.scoring_service import ScoringService
 from grms.services.statistics_service import StatisticsService
 from grms import db as scoring_db
@@ -35,8 +60,8 @@ app = FastAPI(
 )
 
 # In-memory stores (swap for persistent storage in production)
-leaders: dict[UUID, LeaderProfile] = {}
-populations: dict[str, PopulationProfile] = {}
+leaders = LeaderRegistry()
+populations = PopulationRegistry()
 scoring_cases: dict[str, ScoringCase] = {}
 
 
@@ -69,17 +94,13 @@ def _seed_leaders():
         try:
             data = json.loads(filepath.read_text())
             profile = LeaderProfile(**data)
-            leaders[profile.id] = profile
+            leaders.put(profile)
             logger.info("Seeded leader: %s (%s)", profile.name, profile.country)
         except Exception as e:
             logger.warning("Failed to load %s: %s", filepath.name, e)
     logger.info("Seeded %d leaders on startup", len(leaders))
 
 
-def _pop_key(country: str, period: str = "current") -> str:
-    return f"{country}:{period}"
-
-
 def _seed_populations():
     """Load population profiles from seed data on startup."""
     seed_dir = Path(__file__).parent / "data" / "sample_populations"
@@ -89,7 +110,7 @@ def _seed_populations():
         try:
             data = json.loads(filepath.read_text())
             profile = PopulationProfile(**data)
-            populations[_pop_key(profile.country, profile.period)] = profile
+            populations.put(profile)
             logger.info("Seeded population: %s (%s)", profile.country, profile.period)
         except Exception as e:
             logger.warning("Failed to load %s: %s", filepath.name, e)
@@ -107,7 +128,7 @@ def _seed_scoring_cases():
             for item in data:
                 case = ScoringCase(**item)
                 scoring_cases[case.id] = case
-                leaders[case.leader.id] = case.leader
+                leaders.put(case.leader)
             logger.info("Seeded %d scoring cases from %s", len(data), filepath.name)
         except Exception as e:
             logger.warning("Failed to load scoring file %s: %s", filepath.name, e)
@@ -241,41 +262,53 @@ def _db_row_to_prediction(row: dict) -> SavedPrediction:
 
 
 async def _run_seeded_predictions():
-    """Run predictions for all seeded scoring cases, score them, and persist."""
-    for case in scoring_cases.values():
-        stable_id = uuid5(NAMESPACE_URL, f"grms:prediction:{case.id}")
-        existing = await scoring_db.get_prediction(str(stable_id))
-        if existing:
-            continue
-        try:
-            response = await leader_service.predict(case.leader, case.event)
-            prediction = SavedPrediction(
-                id=stable_id,
-                label=case.label,
-                historical_date=case.historical_date,
-                prediction_type="leader",
-                event=case.event,
-                leader_id=case.leader.id,
-                leader_name=case.leader.name,
-                country=case.leader.country,
-                llm_model=settings.llm_model,
-                leader_response=response,
-                known_outcome=case.known_outcome,
-            )
-            prediction.score = _score_prediction(prediction)
-            await _persist_prediction(prediction)
-        except Exception as e:
-            logger.warning("Failed to run seeded prediction for '%s': %s", case.label, e)
+    """Run predictions for all seeded scoring cases, score them, and persist.
+
+    Cases run concurrently at batch priority, so interactive requests overtake them.
+    """
+    await asyncio.gather(*(_run_seeded_prediction(case) for case in scoring_cases.values()))
     logger.info("Seeded predictions up to date")
 
 
+async def _run_seeded_prediction(case: ScoringCase):
+    stable_id = uuid5(NAMESPACE_URL, f"grms:prediction:{case.id}")
+    existing = await scoring_db.get_prediction(str(stable_id))
+    if existing:
+        return
+    try:
+        response = await leader_service.predict(case.leader, case.event, priority=Priority.BATCH)
+        prediction = SavedPrediction(
+            id=stable_id,
+            label=case.label,
+            historical_date=case.historical_date,
+            prediction_type="leader",
+            event=case.event,
+            leader_id=case.leader.id,
+            leader_name=case.leader.name,
+            country=case.leader.country,
+            llm_model=settings.llm_model,
+            leader_response=response,
+            known_outcome=case.known_outcome,
+        )
+        prediction.score = _score_prediction(prediction)
+        await _persist_prediction(prediction)
+    except Exception as e:
+        logger.warning("Failed to run seeded prediction for '%s': %s", case.label, e)
+
+
 _seed_leaders()
 _seed_populations()
 _seed_scoring_cases()
 
-leader_service = LeaderService()
+cognitive_engine = CognitiveDecisionEngine()
+cognitive_predictor = CognitiveOnlyPredictor(cognitive_engine)
+cognitive_analysis_service = CognitiveAnalysisService(cognitive_engine)
+leader_service = LeaderService(cognitive_engine)
 population_service = PopulationService()
-scoring_service = ScoringService()
+coupled_simulation_service = CoupledSimulationService(cognitive_engine, population_service)
+leaders.subscribe(cognitive_engine.invalidate)
+populations.subscribe(population_service.invalidate)
+scoring_service = ScoringService(leader_service)
 statistics_service = StatisticsService()
 
 # Scoring run history (in-memory cache; also persisted to SQLite)
@@ -295,6 +328,8 @@ async def health():
         "llm_model": settings.llm_model,
         "leaders_loaded": len(leaders),
         "populations_loaded": len(populations),
+        "population_response_cache": population_service.cache_stats(),
+        "llm_coalescing": leader_service.coalescing_stats(),
     }
 
 
@@ -303,7 +338,7 @@ async def health():
 
 @app.post("/api/v1/leaders", response_model=LeaderProfile)
 async def create_leader(profile: LeaderProfile):
-    leaders[profile.id] = profile
+    leaders.put(profile)
     return profile
 
 
@@ -319,13 +354,16 @@ async def update_leader_context(leader_id: UUID, context: LeaderDecisionContext)
     if leader_id not in leaders:
         raise HTTPException(404, "Leader not found")
     leaders[leader_id].decision_context = context
+    leaders.touch(leader_id)
     return leaders[leader_id]
 
 
 @app.get("/api/v1/leaders", response_model=list[LeaderProfile])
-async def list_leaders(period: str | None = None):
+async def list_leaders(period: str | None = None, name: str | None = None):
+    if name:
+        return [l for l in leaders.by_name(name) if not period or l.period == period]
     if period:
-        return [l for l in leaders.values() if l.period == period]
+        return leaders.by_period(period)
     return list(leaders.values())
 
 
@@ -336,7 +374,8 @@ async def list_leaders(period: str | None = None):
 async def create_population(profile: PopulationProfile):
     if not profile.validate_segments():
         raise HTTPException(400, "Population segments must sum to approximately 1.0")
-    populations[_pop_key(profile.country, profile.period)] = profile
+    populations.put(profile)
+    population_service.columns(profile)
     return profile
 
 
@@ -347,15 +386,10 @@ async def list_populations():
 
 @app.get("/api/v1/populations/{country}", response_model=PopulationProfile)
 async def get_population(country: str, period: str = "current"):
-    key = _pop_key(country, period)
-    if key not in populations:
-        if period != "current":
-            raise HTTPException(404, "Population profile not found")
-        for k, v in populations.items():
-            if k.startswith(f"{country}:"):
-                return v
+    pop = populations.resolve(country, period, fallback=period == "current")
+    if pop is None:
         raise HTTPException(404, "Population profile not found")
-    return populations[key]
+    return pop
 
 
 # --- Prediction ---
@@ -364,13 +398,24 @@ async def get_population(country: str, period: str = "current"):
 class PredictLeaderRequest(BaseModel):
     leader_id: UUID
     event: GeopoliticalEvent
+    formula_version: str | None = Field(None, description="Cognitive formula for hybrid/cognitive-only; default if omitted")
+    use_cache: bool = Field(True, description="Reuse a cached LLM response for an identical prompt; false forces a fresh call")
 
 
 class PredictPopulationRequest(BaseModel):
     country: str
     event: GeopoliticalEvent
     leader_action_summary: str = ""
+    leader_action_types: list[str] | None = Field(
+        None, description="LeaderAction.action_type codes; used instead of leader_action_summary when given",
+    )
     period: str = "current"
+    mode: Literal["segment", "agent"] = Field("segment", description="agent: sample individual agents from the segments")
+    agents: int | None = Field(
+        None, ge=1, le=settings.population_max_agents,
+        description="Agent count in agent mode; defaults to total_population, capped at the configured maximum",
+    )
+    persist_opinions: bool = Field(False, description="Agent mode: keep each agent's updated trust for later events")
 
 
 class PredictCombinedRequest(BaseModel):
@@ -378,6 +423,7 @@ class PredictCombinedRequest(BaseModel):
     country: str
     event: GeopoliticalEvent
     period: str = "current"
+    use_cache: bool = Field(True, description="Reuse a cached LLM response for an identical prompt; false forces a fresh call")
 
 
 @app.post("/api/v1/predict/leader", response_model=LeaderResponse)
@@ -385,52 +431,137 @@ async def predict_leader(request: PredictLeaderRequest):
     if request.leader_id not in leaders:
         raise HTTPException(404, "Leader not found")
     leader = leaders[request.leader_id]
-    response = await leader_service.predict(leader, request.event)
+    response = await leader_service.predict(leader, request.event, request.use_cache)
     return response
 
 
 @app.post("/api/v1/predict/population", response_model=PopulationResponse)
 async def predict_population(request: PredictPopulationRequest):
-    key = _pop_key(request.country, request.period)
-    if key not in populations:
-        for k, v in populations.items():
-            if k.startswith(f"{request.country}:"):
-                pop = v
-                break
-        else:
-            raise HTTPException(404, "Population profile not found")
-    else:
-        pop = populations[key]
-    response = population_service.predict(pop, request.event, request.leader_action_summary)
+    pop = populations.resolve(request.country, request.period)
+    if pop is None:
+        raise HTTPException(404, "Population profile not found")
+    if request.mode == "agent":
+        return await run_in_threadpool(
+            population_service.predict_agents,
+            pop, request.event, request.leader_action_summary, request.agents, request.persist_opinions,
+            request.leader_action_types,
+        )
+    response = population_service.predict(
+        pop, request.event, request.leader_action_summary, request.leader_action_types,
+    )
     return response
 
 
+class PredictPopulationBatchRequest(BaseModel):
+    events: list[GeopoliticalEvent] = Field(..., min_length=1)
+    countries: list[str] | None = Field(None, description="Registered countries to include; all if omitted")
+    period: str | None = Field(None, description="Only profiles with this period tag; every period if omitted")
+    leader_action_summary: str = ""
+    leader_action_types: list[str] | None = Field(
+        None, description="LeaderAction.action_type codes; used instead of leader_action_summary when given",
+    )
+    include_segments: bool = False
+
+
+@app.post("/api/v1/predict/population/batch", response_model=PopulationBatchResponse)
+async def predict_population_batch(request: PredictPopulationBatchRequest):
+    """Every selected population profile against every event, as a populations × events table."""
+    profiles = [
+        p for p in populations.values()
+        if (request.countries is None or p.country in request.countries)
+        and (request.period is None or p.period == request.period)
+    ]
+    if request.countries is not None:
+        missing = sorted(set(request.countries) - {p.country for p in profiles})
+        if missing:
+            raise HTTPException(404, f"Population profiles not found: {', '.join(missing)}")
+    return population_service.predict_many(
+        profiles, request.events, request.leader_action_summary,
+        include_segments=request.include_segments, leader_action_types=request.leader_action_types,
+    )
+
+
+class PredictPopulationSweepRequest(BaseModel):
+    country: str
+    event: GeopoliticalEvent
+    axes: list[PopulationSweepAxis] = Field(..., min_length=1, max_length=2)
+    period: str = "current"
+    leader_action_summary: str = ""
+    leader_action_types: list[str] | None = None
+
+
+@app.post("/api/v1/predict/population/sweep", response_model=PopulationSweepResult)
+async def predict_population_sweep(request: PredictPopulationSweepRequest):
+    """Heatmap of overall support and protest over one or two segment parameters."""
+    pop = populations.resolve(request.country, request.period)
+    if pop is None:
+        raise HTTPException(404, "Population profile not found")
+    try:
+        return population_service.sweep(
+            pop, request.event, request.axes, request.leader_action_summary, request.leader_action_types,
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
 @app.post("/api/v1/predict/combined", response_model=CombinedResponse)
 async def predict_combined(request: PredictCombinedRequest):
     if request.leader_id not in leaders:
         raise HTTPException(404, "Leader not found")
 
-    key = _pop_key(request.country, request.period)
-    if key not in populations:
-        for k, v in populations.items():
-            if k.startswith(f"{request.country}:"):
-                pop = v
-                break
-        else:
-            raise HTTPException(404, "Population profile not found")
-    else:
-        pop = populations[key]
+    pop = populations.resolve(request.country, request.period)
+    if pop is None:
+        raise HTTPException(404, "Population profile not found")
 
     leader = leaders[request.leader_id]
 
-    leader_response = await leader_service.predict(leader, request.event)
+    leader_response = await leader_service.predict(leader, request.event, request.use_cache)
 
     action_summary = "; ".join(a.description for a in leader_response.actions[:3])
-    pop_response = population_service.predict(pop, request.event, action_summary)
+    action_types = [a.action_type for a in leader_response.actions[:3]]
+    pop_response = population_service.predict(pop, request.event, action_summary, action_types)
 
     return CombinedResponse(leader=leader_response, population=pop_response)
 
 
+class CoupledPair(BaseModel):
+    leader_id: UUID
+    country: str
+    period: str = "current"
+
+
+class SimulateCombinedRequest(BaseModel):
+    pairs: list[CoupledPair] = Field(..., min_length=1)
+    events: list[GeopoliticalEvent] = Field(..., min_length=1)
+    rounds: int = Field(10, ge=1, le=520)
+    days_per_round: float = Field(7.0, gt=0.0, le=365.0)
+    formula_version: str | None = None
+
+
+@app.post("/api/v1/predict/combined/simulate", response_model=CoupledSimulationResponse)
+async def simulate_combined(request: SimulateCombinedRequest):
+    """Leader and population feeding back into each other over rounds, for every pair and event.
+
+    Uses the cognitive engine for the leader, so no LLM is called.
+    """
+    pair_leaders, pair_populations = [], []
+    for pair in request.pairs:
+        if pair.leader_id not in leaders:
+            raise HTTPException(404, f"Leader not found: {pair.leader_id}")
+        pop = populations.resolve(pair.country, pair.period)
+        if pop is None:
+            raise HTTPException(404, f"Population profile not found: {pair.country}")
+        pair_leaders.append(leaders[pair.leader_id])
+        pair_populations.append(pop)
+
+    try:
+        return coupled_simulation_service.simulate(
+            pair_leaders, pair_populations, request.events, request.rounds, request.days_per_round, request.formula_version,
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
 # --- Prediction History ---
 
 
@@ -511,28 +642,29 @@ async def get_scoring_case(case_id: str):
 
 class BatchScoreRequest(BaseModel):
     cases: list[ScoringCase]
+    use_cache: bool = Field(True, description="Reuse cached LLM responses; false re-queries the LLM for every case")
 
 
 @app.post("/api/v1/scoring/run", response_model=BatchRunResult)
 async def run_scoring_batch(request: BatchScoreRequest):
     """Run a batch of historical scenarios and score predictions against known outcomes."""
-    result = await scoring_service.run_batch(request.cases)
+    result = await scoring_service.run_batch(request.cases, request.use_cache)
     scoring_runs[result.id] = result
     return result
 
 
 @app.post("/api/v1/scoring/run-all", response_model=BatchRunResult)
-async def run_all_scoring_cases():
+async def run_all_scoring_cases(use_cache: bool = True):
     """Run all loaded scoring cases through the prediction engine."""
     if not scoring_cases:
         raise HTTPException(400, "No scoring cases loaded")
-    result = await scoring_service.run_batch(list(scoring_cases.values()))
+    result = await scoring_service.run_batch(list(scoring_cases.values()), use_cache)
     scoring_runs[result.id] = result
     return result
 
 
 @app.post("/api/v1/scoring/run-file", response_model=BatchRunResult)
-async def run_scoring_from_file(file_path: str):
+async def run_scoring_from_file(file_path: str, use_cache: bool = True):
     """Run scoring from a JSON file containing an array of ScoringCase objects."""
     path = Path(file_path)
     if not path.exists():
@@ -541,7 +673,7 @@ async def run_scoring_from_file(file_path: str):
     if not path.exists():
         raise HTTPException(404, f"Scoring file not found: {file_path}")
     cases = [ScoringCase(**c) for c in json.loads(path.read_text())]
-    result = await scoring_service.run_batch(cases)
+    result = await scoring_service.run_batch(cases, use_cache)
     scoring_runs[result.id] = result
     return result
 
@@ -634,6 +766,7 @@ async def scoring_report():
 class AblationRequest(BaseModel):
     case_ids: list[str] | None = Field(None, description="Specific case IDs to run. If None, runs all loaded cases.")
     include_generic_llm: bool = Field(True, description="Include the GenericLLM baseline (requires LLM call per case)")
+    use_cache: bool = Field(True, description="Reuse cached LLM responses; false re-queries the LLM for every case")
 
 
 @app.post("/api/v1/scoring/ablation", response_model=AblationResult)
@@ -647,7 +780,9 @@ async def run_ablation(request: AblationRequest):
         cases = list(scoring_cases.values())
         if not cases:
             raise HTTPException(400, "No scoring cases loaded")
-    return await scoring_service.run_ablation(cases, include_generic_llm=request.include_generic_llm)
+    return await scoring_service.run_ablation(
+        cases, include_generic_llm=request.include_generic_llm, use_cache=request.use_cache,
+    )
 
 
 @app.get("/api/v1/scoring/brier/{run_id}", response_model=BrierDecomposition)
@@ -666,24 +801,256 @@ async def scoring_confidence_calibration(run_id: str):
 
 
 @app.post("/api/v1/predict/leader/hybrid", response_model=LeaderResponse)
-async def predict_leader_hybrid(request: PredictLeaderRequest):
-    """Hybrid prediction: cognitive engine as structured prior + LLM reasoning."""
+async def predict_leader_hybrid(request: PredictLeaderRequest, trace: Literal["none", "full"] = "none"):
+    """Hybrid prediction: cognitive engine as structured prior + LLM reasoning.
+
+    ``?trace=full`` attaches the cognitive engine's decision trace as ``cognitive_trace``.
+    """
     if request.leader_id not in leaders:
         raise HTTPException(404, "Leader not found")
     leader = leaders[request.leader_id]
-    return await leader_service.predict_hybrid(leader, request.event)
+    try:
+        return await leader_service.predict_hybrid(
+            leader, request.event, request.formula_version, trace=trace == "full", use_cache=request.use_cache,
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
 
 
 @app.post("/api/v1/predict/leader/cognitive-only", response_model=LeaderResponse)
-async def predict_leader_cognitive_only(request: PredictLeaderRequest):
-    """Parametric cognitive engine prediction only (no LLM call)."""
-    from grms.services.baselines import CognitiveOnlyPredictor
+async def predict_leader_cognitive_only(request: PredictLeaderRequest, trace: Literal["none", "full"] = "none"):
+    """Parametric cognitive engine prediction only (no LLM call).
+
+    ``?trace=full`` attaches the per-layer decision trace as ``cognitive_trace``.
+    """
+    if request.leader_id not in leaders:
+        raise HTTPException(404, "Leader not found")
+    leader = leaders[request.leader_id]
+    try:
+        return await cognitive_predictor.predict(leader, request.event, request.formula_version, trace=trace == "full")
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+class PredictLeaderBatchRequest(BaseModel):
+    leader_ids: list[UUID] = Field(..., min_length=1)
+    events: list[GeopoliticalEvent] = Field(..., min_length=1)
+    formula_version: str | None = None
+
+
+class LeaderEventPair(BaseModel):
+    leader_id: UUID
+    event: GeopoliticalEvent
+
 
+@app.post("/api/v1/predict/leader/cognitive-only/batch")
+async def predict_leader_cognitive_only_batch(request: PredictLeaderBatchRequest):
+    """Cognitive-only predictions for every leader × event pair, streamed as NDJSON LeaderResponse lines.
+
+    Lines are leader-major: all events for the first leader, then the next.
+    """
+    missing = [str(lid) for lid in request.leader_ids if lid not in leaders]
+    if missing:
+        raise HTTPException(404, f"Leaders not found: {', '.join(missing)}")
+    try:
+        cognitive_engine.formulas.get(request.formula_version)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    profiles = [leaders[lid] for lid in request.leader_ids]
+
+    def lines():
+        for responses in cognitive_predictor.predict_matrix(
+            profiles, request.events, request.formula_version, settings.cognitive_batch_chunk_size,
+        ):
+            yield "".join(r.model_dump_json() + "\n" for r in responses)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/api/v1/predict/leader/cognitive-only/batch/stream")
+async def predict_leader_cognitive_only_stream(request: Request, formula_version: str | None = None):
+    """Cognitive-only predictions for an NDJSON body of ``{"leader_id", "event"}`` lines.
+
+    Lines are validated as the body arrives, then scored in chunks and streamed back
+    in input order. A line that fails to parse or names an unknown leader yields
+    ``{"line": n, "error": ...}`` in its place.
+    """
+    try:
+        cognitive_engine.formulas.get(formula_version)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    # Read the whole body before responding: StreamingResponse listens on the same
+    # receive channel for disconnects, so the request cannot be read while streaming.
+    entries: list[LeaderEventPair | dict] = []
+    line_no = 0
+    async for line in _ndjson_lines(request):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            pair = LeaderEventPair.model_validate_json(line)
+            if pair.leader_id not in leaders:
+                raise ValueError(f"Leader not found: {pair.leader_id}")
+            entries.append(pair)
+        except ValueError as e:
+            entries.append({"line": line_no, "error": str(e)})
+
+    def predict_lines(pairs: list[LeaderEventPair]) -> str:
+        if not pairs:
+            return ""
+        profiles = {pair.leader_id: leaders[pair.leader_id] for pair in pairs}
+        position = {lid: k for k, lid in enumerate(profiles)}
+        responses = cognitive_predictor.predict_pairs(
+            list(profiles.values()),
+            [pair.event for pair in pairs],
+            np.array([position[pair.leader_id] for pair in pairs]),
+            np.arange(len(pairs)),
+            formula_version,
+        )
+        return "".join(r.model_dump_json() + "\n" for r in responses)
+
+    def lines():
+        pairs: list[LeaderEventPair] = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                yield predict_lines(pairs) + json.dumps(entry) + "\n"
+                pairs = []
+                continue
+            pairs.append(entry)
+            if len(pairs) >= settings.cognitive_batch_chunk_size:
+                yield predict_lines(pairs)
+                pairs = []
+        yield predict_lines(pairs)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+async def _ndjson_lines(request: Request):
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for line in complete:
+            yield line
+    yield buffer
+
+
+class PredictDistributionRequest(BaseModel):
+    leader_id: UUID
+    event: GeopoliticalEvent
+    samples: int = Field(10000, ge=100, le=200000)
+    noise: PerturbationSpec = Field(default_factory=PerturbationSpec)
+    seed: int | None = Field(None, description="RNG seed for reproducible sampling")
+    formula_version: str | None = None
+
+
+@app.post("/api/v1/predict/leader/cognitive-only/distribution", response_model=CognitiveDistributionResult)
+async def predict_leader_cognitive_distribution(request: PredictDistributionRequest):
+    """Monte Carlo uncertainty propagation: action frequencies and escalation spread under profile noise."""
+    if request.leader_id not in leaders:
+        raise HTTPException(404, "Leader not found")
+    leader = leaders[request.leader_id]
+    try:
+        return cognitive_analysis_service.predict_distribution(
+            leader, request.event, samples=request.samples, noise=request.noise, seed=request.seed,
+            formula_version=request.formula_version,
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+class PredictSensitivityRequest(BaseModel):
+    leader_id: UUID
+    event: GeopoliticalEvent
+    base_samples: int = Field(4096, ge=256, le=32768, description="Saltelli base sample size, rounded up to a power of two")
+    grid_points: int = Field(21, ge=3, le=101, description="Points per one-at-a-time sweep")
+    seed: int | None = Field(None, description="Seed for the scrambled Sobol sequence")
+    formula_version: str | None = None
+
+
+@app.post("/api/v1/predict/leader/cognitive-only/sensitivity", response_model=CognitiveSensitivityResult)
+async def predict_leader_cognitive_sensitivity(request: PredictSensitivityRequest):
+    """Global sensitivity: which inputs drive the selected action and escalation estimate."""
+    if request.leader_id not in leaders:
+        raise HTTPException(404, "Leader not found")
+    leader = leaders[request.leader_id]
+    try:
+        return cognitive_analysis_service.sensitivity(
+            leader, request.event, base_samples=request.base_samples, grid_points=request.grid_points,
+            seed=request.seed, formula_version=request.formula_version,
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+class PredictWhatIfRequest(BaseModel):
+    leader_id: UUID
+    event: GeopoliticalEvent
+    deltas: list[WhatIfDelta] = Field(..., min_length=1, max_length=64)
+    formula_version: str | None = None
+
+
+@app.post("/api/v1/predict/leader/cognitive-only/what-if", response_model=CognitiveWhatIfResult)
+async def predict_leader_cognitive_what_if(request: PredictWhatIfRequest, trace: Literal["none", "full"] = "none"):
+    """Counterfactual deltas against a base prediction, recomputing only the layers each delta touches."""
     if request.leader_id not in leaders:
         raise HTTPException(404, "Leader not found")
     leader = leaders[request.leader_id]
-    predictor = CognitiveOnlyPredictor()
-    return await predictor.predict(leader, request.event)
+    try:
+        return cognitive_analysis_service.what_if(
+            leader, request.event, request.deltas,
+            formula_version=request.formula_version, trace=trace == "full",
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+@app.get("/api/v1/cognitive/formulas", response_model=list[CognitiveFormulaSpec])
+async def list_cognitive_formulas():
+    """Formula versions resident in the cognitive engine."""
+    return cognitive_engine.formulas.specs()
+
+
+@app.post("/api/v1/cognitive/formulas", response_model=CognitiveFormulaSpec)
+async def register_cognitive_formula(spec: CognitiveFormulaSpec):
+    """Compile and register a formula; replaces any existing formula with the same name."""
+    try:
+        return cognitive_engine.formulas.register(spec).spec
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+# --- LLM Response Cache ---
+
+
+@app.get("/api/v1/llm/cache")
+async def llm_cache_stats():
+    """Hit rate of the persistent LLM response cache and what it holds."""
+    return await response_cache.stats()
+
+
+@app.post("/api/v1/llm/cache/evict")
+async def evict_llm_cache():
+    """Drop expired responses and trim the cache to its configured size."""
+    return {"evicted": await response_cache.evict()}
+
+
+@app.delete("/api/v1/llm/cache")
+async def clear_llm_cache():
+    return {"deleted": await response_cache.clear()}
+
+
+@app.get("/api/v1/llm/scheduler")
+async def llm_scheduler_stats():
+    """Concurrency limit, queue depth and wait times of the LLM scheduler, by model."""
+    return scheduler.stats()
+
+
+@app.get("/api/v1/llm/clients")
+async def llm_client_stats():
+    """Request latency and connection reuse of the pooled Ollama clients, by host."""
+    return OllamaProvider.client_stats()
 
 
 @app.on_event("shutdown")
@@ -691,9 +1058,31 @@ async def shutdown_db():
     await scoring_db.close_db()
 
 
+@app.on_event("shutdown")
+async def shutdown_llm_clients():
+    await OllamaProvider.aclose_clients()
+    if settings.llm_source == "bedrock":
+        from grms.llm.bedrock_provider import BedrockProvider
+        BedrockProvider.shutdown()
+
+
 # --- WebSocket ---
 
 
+class SimulateScenarioMessage(BaseModel):
+    data: GeopoliticalEvent
+    country: str
+    period: str = "current"
+    days: float = Field(30.0, gt=0.0, le=3650.0)
+    steps_per_day: int = Field(1, ge=1, le=24)
+    snapshot_every: int = Field(1, ge=1, description="Send every n-th step")
+    leader_action_summary: str = ""
+    leader_action_types: list[str] | None = Field(
+        None, description="LeaderAction.action_type codes; used instead of leader_action_summary when given",
+    )
+    include_segments: bool = False
+
+
 @app.websocket("/ws/scenario/{scenario_id}")
 async def websocket_scenario(websocket: WebSocket, scenario_id: str):
     await websocket.accept()
@@ -710,13 +1099,40 @@ async def websocket_scenario(websocket: WebSocket, scenario_id: str):
                     lr = await leader_service.predict(leader, event)
                     await websocket.send_json({"type": "leader_response", "data": lr.model_dump(mode="json")})
 
-                if country and country in populations:
-                    action_summary = ""
+                population = populations.resolve(*country.split(":", 1)) if country else None
+                if population is not None:
+                    action_summary, action_types = "", None
                     if leader_id and UUID(leader_id) in leaders:
                         action_summary = "; ".join(a.description for a in lr.actions[:3])
-                    pr = population_service.predict(populations[country], event, action_summary)
+                        action_types = [a.action_type for a in lr.actions[:3]]
+                    pr = population_service.predict(population, event, action_summary, action_types)
                     await websocket.send_json({"type": "population_response", "data": pr.model_dump(mode="json")})
 
                 await websocket.send_json({"type": "complete", "event_id": str(event.id)})
+
+            elif data.get("type") == "simulate":
+                # Stream a time-stepped population simulation so long horizons animate as they run
+                try:
+                    request = SimulateScenarioMessage(**data)
+                except ValueError as e:
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+                    continue
+                population = populations.resolve(request.country, request.period)
+                if population is None:
+                    await websocket.send_json({"type": "error", "detail": "Population profile not found"})
+                    continue
+                event = request.data
+                last = int(round(request.days * request.steps_per_day))
+                for state in population_service.simulate(
+                    population, [event], request.days, request.steps_per_day, request.leader_action_summary,
+                    request.leader_action_types,
+                ):
+                    if state.step % request.snapshot_every and state.step != last:
+                        continue
+                    snapshot = population_service.simulation_step(
+                        population, event, state, include_segments=request.include_segments,
+                    )
+                    await websocket.send_json({"type": "population_step", "data": snapshot.model_dump(mode="json")})
+                await websocket.send_json({"type": "simulation_complete", "event_id": str(event.id)})
     except WebSocketDisconnect:
         pass
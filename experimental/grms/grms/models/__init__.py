@@ -15,6 +15,7 @@ from grms.models.population import (
     SegmentDemographics,
     SegmentDisposition,
     SegmentResponseParams,
+    PopulationSweepAxis,
 )
 from grms.models.events import GeopoliticalEvent, EventStructured
 from grms.models.responses import (
@@ -23,11 +24,16 @@ from grms.models.responses import (
     VerbalResponse,
     ResponseReasoning,
     PopulationResponse,
+    PopulationBatchResponse,
+    PopulationSimulationStep,
+    PopulationSweepResult,
     PopulationOverall,
     SegmentResponse,
     InformationSpread,
     PopulationTrajectory,
     CombinedResponse,
+    CoupledTrajectory,
+    CoupledSimulationResponse,
 )
 from grms.models.scoring import (
     BatchRunResult,
@@ -33,3 +33,134 @@ class CognitiveDecisionResult(BaseModel):
     action_scores: list[ActionScore] = Field(description="All actions ranked by score")
     interaction_effects: list[InteractionEffect] = Field(default_factory=list)
     formula_version: str = "geopolitical_red_line_response_v1"
+
+
+class FormulaLayerSpec(BaseModel):
+    weight: float = Field(ge=0.0, le=1.0)
+
+
+class FormulaInteractionSpec(BaseModel):
+    layers: list[str] = Field(min_length=2, max_length=2, description="Operand refs, e.g. 'personality.aggression'")
+    method: str = Field("multiply", description="Only 'multiply' is supported")
+    weight: float
+
+
+class CognitiveFormulaSpec(BaseModel):
+    """Declarative formula definition; omitted tables fall back to the engine defaults."""
+    name: str = Field(description="Formula version reported in CognitiveDecisionResult.formula_version")
+    description: str = ""
+    layers: dict[str, FormulaLayerSpec]
+    combination: str = Field("linear", description="Only 'linear' is supported")
+    interaction_terms: list[FormulaInteractionSpec] = Field(default_factory=list)
+    action_affordances: dict[str, dict[str, float]] | None = None
+    role_bias: dict[str, float] | None = None
+    unilateral_role_shift: dict[str, float] | None = None
+    motivation_alignment: dict[str, dict[str, float]] | None = None
+
+
+class PerturbationSpec(BaseModel):
+    personality_sd: float = Field(0.15, ge=0.0, description="Default std dev applied to every personality axis")
+    belief_sd: float = Field(0.10, ge=0.0, description="Default std dev applied to every inferred belief")
+    dimension_sd: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-dimension overrides, e.g. {'personality.aggression': 0.3, 'belief.hostile_intent': 0.05, "
+                    "'context.approval_rating': 10}",
+    )
+
+
+class CognitiveDistributionResult(BaseModel):
+    samples: int
+    point_estimate_action: str = Field(description="Selected action for the unperturbed profile")
+    point_estimate_escalation: float
+    action_frequencies: dict[str, float] = Field(description="Fraction of samples selecting each action")
+    escalation_mean: float
+    escalation_std: float
+    escalation_quantiles: dict[str, float] = Field(description="p05, p25, p50, p75, p95")
+    escalation_histogram: list[int] = Field(description="Sample counts per escalation bin")
+    escalation_bin_edges: list[float]
+    confidence_mean: float
+    formula_version: str = "geopolitical_red_line_response_v1"
+
+
+class CalibrationFold(BaseModel):
+    fold: int
+    train_cases: int
+    test_cases: int
+    train_score: float = Field(description="Mean ScoringService score on the fold's training cases after fitting")
+    test_score: float = Field(description="Mean score on the held-out cases with the fitted weights")
+    baseline_test_score: float = Field(description="Mean score on the held-out cases with the base formula")
+
+
+class CalibrationResult(BaseModel):
+    base_formula_version: str
+    formula: CognitiveFormulaSpec = Field(description="Weights fitted on all cases")
+    total_cases: int
+    baseline_score: float = Field(description="Mean score of the base formula on all cases")
+    fitted_score: float = Field(description="Mean score of the fitted formula on all cases")
+    folds: list[CalibrationFold] = Field(default_factory=list)
+    cv_test_score: float | None = Field(None, description="Mean held-out score across folds")
+    baseline_cv_test_score: float | None = None
+    weight_sets_evaluated: int = Field(0, description="Candidate weight sets scored across all fits")
+    elapsed_seconds: float = 0.0
+
+
+class SensitivityInput(BaseModel):
+    input: str = Field(description="e.g. 'personality.aggression', 'belief.hostile_intent', 'context.approval_rating'")
+    baseline: float = Field(description="Value for the unperturbed leader/event pair")
+    low: float
+    high: float
+    grid: list[float] = Field(description="One-at-a-time sweep values; readiness_level is an index into peacetime/elevated/mobilized")
+    grid_selected_actions: list[str]
+    grid_escalation: list[float]
+    action_switches: int = Field(description="Times the selected action changes along the sweep")
+    escalation_first_order: float = Field(description="Sobol first-order index S_i for escalation_estimate")
+    escalation_total: float = Field(description="Sobol total-effect index S_Ti for escalation_estimate")
+    selection_first_order: float = Field(description="Variance-weighted first-order index over selected-action indicators")
+    selection_total: float
+
+
+class CognitiveSensitivityResult(BaseModel):
+    point_estimate_action: str
+    point_estimate_escalation: float
+    base_samples: int = Field(description="Saltelli base sample size N; Sobol indices use N * (inputs + 2) evaluations")
+    evaluations: int = Field(description="Engine evaluations including the one-at-a-time grid")
+    escalation_variance: float
+    action_frequencies: dict[str, float] = Field(description="Selected-action frequencies over the sampled input space")
+    escalation_drivers: list[str] = Field(description="Inputs ranked by total-effect index on escalation_estimate")
+    selection_drivers: list[str] = Field(description="Inputs ranked by total-effect index on selected_action")
+    inputs: list[SensitivityInput]
+    formula_version: str = "geopolitical_red_line_response_v1"
+
+
+class WhatIfDelta(BaseModel):
+    field: str = Field(description="Input path, e.g. 'decision_context.approval_rating', 'personality.aggression', 'event.severity'")
+    value: float | str
+
+
+class LayerDiff(BaseModel):
+    layer: str = Field(description="A cognitive layer, or 'interactions' for the summed interaction effects")
+    recomputed: bool
+    score_delta: dict[str, float] = Field(description="Change in raw layer score (interaction effect) per action")
+
+
+class WhatIfOutcome(BaseModel):
+    deltas: list[WhatIfDelta]
+    selected_action: str
+    selected_action_changed: bool
+    confidence: float
+    escalation_estimate: float
+    escalation_delta: float
+    final_scores: dict[str, float]
+    final_score_delta: dict[str, float]
+    recomputed: list[str] = Field(description="Stages re-run for these deltas; everything else reused from the base")
+    layer_diffs: list[LayerDiff]
+    trace: CognitiveDecisionResult | None = None
+
+
+class CognitiveWhatIfResult(BaseModel):
+    base_selected_action: str
+    base_confidence: float
+    base_escalation_estimate: float
+    combined: WhatIfOutcome = Field(description="All deltas applied together")
+    individual: list[WhatIfOutcome] = Field(default_factory=list, description="Each delta applied on its own")
+    formula_version: str = "geopolitical_red_line_response_v1"
@@ -1,5 +1,7 @@
 """Population segment models for aggregate response modeling."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -47,3 +49,10 @@ class PopulationProfile(BaseModel):
     def validate_segments(self) -> bool:
         total = sum(s.percentage for s in self.segments)
         return abs(total - 1.0) < 0.01
+
+
+class PopulationSweepAxis(BaseModel):
+    field: str = Field(description="'disposition.<field>' or 'response_params.<field>', e.g. 'disposition.social_media_activity'")
+    values: list[float] = Field(..., min_length=1, max_length=101)
+    segments: list[str] | None = Field(None, description="Segment names to vary; every segment if omitted")
+    mode: Literal["set", "scale"] = Field("set", description="set: use each value; scale: multiply the profile's value. Results are clipped to [0, 1]")
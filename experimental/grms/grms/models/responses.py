@@ -6,6 +6,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from grms.models.population import PopulationSweepAxis
+
 
 class VerbalResponse(BaseModel):
     statement: str
@@ -87,6 +89,81 @@ class PopulationResponse(BaseModel):
     trajectory: PopulationTrajectory
 
 
+class PopulationBatchResponse(BaseModel):
+    """Overall responses of many populations to many events; rows are populations, columns events."""
+
+    countries: list[str]
+    periods: list[str]
+    event_ids: list[UUID]
+    support_leader: list[list[float]]
+    oppose_leader: list[list[float]]
+    neutral: list[list[float]]
+    protest_likelihood: list[list[float]]
+    compliance_likelihood: list[float] = Field(description="Per population; does not depend on the event")
+    viral_probability: list[list[float]]
+    segment_responses: list[list[list[SegmentResponse]]] | None = Field(
+        None, description="Per population, per event segment breakdown when requested",
+    )
+
+
+class PopulationSweepResult(BaseModel):
+    """Overall response over a grid of one or two segment parameters.
+
+    Rows follow ``axes[0].values`` and columns ``axes[1].values``; a single-axis
+    sweep has one column.
+    """
+
+    country: str
+    period: str
+    event_id: UUID
+    axes: list[PopulationSweepAxis]
+    baseline: PopulationOverall
+    support_leader: list[list[float]]
+    oppose_leader: list[list[float]]
+    protest_likelihood: list[list[float]]
+
+
+class PopulationSimulationStep(BaseModel):
+    """One step of a time-stepped population simulation for one event."""
+
+    event_id: UUID
+    country: str
+    step: int
+    day: float
+    overall: PopulationOverall
+    segment_responses: list[SegmentResponse] | None = None
+
+
 class CombinedResponse(BaseModel):
     leader: LeaderResponse
     population: PopulationResponse
+
+
+class CoupledTrajectory(BaseModel):
+    """One leader/population pair reacting to one event over coupled rounds; lists have one entry per round.
+
+    The leader's context (approval, opposition, protest level) is the one it decided
+    with that round; the population fields are the response to that decision.
+    """
+
+    leader_id: UUID
+    country: str
+    period: str
+    event_id: UUID
+    day: list[float]
+    selected_action: list[str]
+    confidence: list[float]
+    escalation_estimate: list[float]
+    approval_rating: list[float]
+    opposition_strength: list[float]
+    protest_level: list[str]
+    support_leader: list[float]
+    oppose_leader: list[float]
+    protest_likelihood: list[float]
+
+
+class CoupledSimulationResponse(BaseModel):
+    formula_version: str
+    rounds: int
+    days_per_round: float
+    trajectories: list[CoupledTrajectory]
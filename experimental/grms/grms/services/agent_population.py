@@ -0,0 +1,197 @@
+"""Agent-level synthetic populations sampled from segment distributions.
+
+Each agent is a row across typed NumPy columns: a segment index, dispositions
+quantized to uint8 (value * 255) and a bitmask of information sources, about
+eight bytes per agent. An event updates the agents block by block through
+per-value lookup tables, and the results are counted back up to segment and
+population level.
+"""
+
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from grms.models.population import PopulationProfile
+
+TRAIT_SPREAD = 0.12  # standard deviation of an agent's dispositions around its segment mean
+SOURCE_KEEP = 0.85  # chance an agent follows each source its segment lists
+SOURCE_EXTRA = 0.05  # chance an agent also follows any other source seen in the population
+STATE_ALIGNED_SOURCE_MARKERS = ("state", "party", "government", "internal_briefings")
+INDEPENDENT_RALLY_SHARE = 0.6  # rally effect felt by agents with no state-aligned source
+OPINION_LEARNING_RATE = 0.2  # how far a persisted update moves trust towards the agent's support
+RESPOND_CHUNK = 1 << 16  # agents updated per block in ``respond``
+
+_QUANTUM = np.float32(1.0 / 255.0)
+
+
+def _quantize(values: np.ndarray) -> np.ndarray:
+    return np.rint(np.clip(values, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+
+def _allocate(shares: np.ndarray, n_agents: int) -> np.ndarray:
+    """Split ``n_agents`` across segments in proportion to ``shares`` (largest remainder)."""
+    total = shares.sum()
+    if total <= 0 or n_agents <= 0:
+        return np.zeros(len(shares), dtype=np.int64)
+    exact = shares / total * n_agents
+    counts = np.floor(exact).astype(np.int64)
+    remainder = n_agents - counts.sum()
+    counts[np.argsort(counts - exact, kind="stable")[:remainder]] += 1
+    return counts
+
+
+@dataclass
+class AgentPopulation:
+    """Synthetic agents for one profile; per-agent arrays are ordered by segment."""
+
+    profile: PopulationProfile
+    sources: tuple[str, ...]  # bit i of ``source_mask`` is sources[i]
+    counts: np.ndarray  # (S,) agents per segment
+    segment: np.ndarray  # uint8/uint16 segment index
+    trust: np.ndarray  # uint8 government_trust
+    nationalism: np.ndarray  # uint8
+    compliance: np.ndarray  # uint8 compliance_baseline
+    protest_propensity: np.ndarray  # uint8
+    mobilization: np.ndarray  # uint8 clip(urbanization * 0.6 + social_media_activity * 0.4)
+    source_mask: np.ndarray  # uint8/16/32 bitmask of followed sources
+    stance: np.ndarray  # int8 after the last event: 1 support, -1 oppose, 0 neutral
+    rng: np.random.Generator
+
+    def __len__(self) -> int:
+        return len(self.segment)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (
+            self.segment, self.trust, self.nationalism, self.compliance,
+            self.protest_propensity, self.mobilization, self.source_mask, self.stance,
+        ))
+
+    @classmethod
+    def sample(cls, profile: PopulationProfile, n_agents: int, seed: int | None = None) -> "AgentPopulation":
+        """Draw ``n_agents`` agents, split across segments by percentage.
+
+        Dispositions are drawn around each segment's value with TRAIT_SPREAD.
+        The default seed is derived from the country and period, so a profile
+        always samples the same agents.
+        """
+        if seed is None:
+            seed = zlib.crc32(f"{profile.country}:{profile.period}".encode())
+        rng = np.random.default_rng(seed)
+        segments = profile.segments
+        counts = _allocate(np.array([s.percentage for s in segments], dtype=float), n_agents)
+        segment = np.repeat(np.arange(len(segments), dtype=np.uint8 if len(segments) <= 256 else np.uint16), counts)
+
+        def trait(values: list[float]) -> np.ndarray:
+            means = np.repeat(np.array(values, dtype=np.float32), counts)
+            return _quantize(means + rng.standard_normal(len(means), dtype=np.float32) * np.float32(TRAIT_SPREAD))
+
+        urbanization = trait([s.demographics.urbanization for s in segments])
+        social_media = trait([s.disposition.social_media_activity for s in segments])
+        mobilization = _quantize(urbanization * (_QUANTUM * 0.6) + social_media * (_QUANTUM * 0.4))
+        del urbanization, social_media
+
+        sources = tuple(sorted({src for s in segments for src in s.disposition.information_sources}))
+        mask_dtype = np.uint8 if len(sources) <= 8 else np.uint16 if len(sources) <= 16 else np.uint32
+        source_mask = np.zeros(len(segment), dtype=mask_dtype)
+        for bit, source in enumerate(sources):
+            listed = np.repeat(np.array([source in s.disposition.information_sources for s in segments]), counts)
+            follows = rng.random(len(segment), dtype=np.float32) < np.where(listed, SOURCE_KEEP, SOURCE_EXTRA)
+            source_mask |= follows.astype(mask_dtype) << mask_dtype(bit)
+
+        return cls(
+            profile=profile,
+            sources=sources,
+            counts=counts,
+            segment=segment,
+            trust=trait([s.disposition.government_trust for s in segments]),
+            nationalism=trait([s.disposition.nationalism for s in segments]),
+            compliance=trait([s.disposition.compliance_baseline for s in segments]),
+            protest_propensity=trait([s.disposition.protest_propensity for s in segments]),
+            mobilization=mobilization,
+            source_mask=source_mask,
+            stance=np.zeros(len(segment), dtype=np.int8),
+            rng=rng,
+        )
+
+    def respond(
+        self,
+        rally: np.ndarray,
+        economic_pain: np.ndarray,
+        alignment_offset: np.ndarray,
+        alignment_slope: np.ndarray,
+        persist: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Update every agent's stance for one event; return per-segment shares.
+
+        ``rally`` and ``economic_pain`` are the per-segment effects of the event;
+        ``alignment_offset`` and ``alignment_slope`` (x nationalism) are indexed by
+        each agent's own nationalism band, as in ``compute_alignment``. Agents with
+        no state-aligned source feel INDEPENDENT_RALLY_SHARE of the rally. Each
+        agent draws a stance from its own support and oppose probabilities. With
+        ``persist``, trust moves towards the agent's support so later events start
+        from the shifted population.
+
+        Every per-agent term depends on one uint8 column, so each is a 256-entry
+        lookup table; agents are processed in RESPOND_CHUNK blocks that never span
+        two segments, which keeps the float32 temporaries cache-sized.
+
+        Returns (support, oppose, neutral, protest) shares per segment.
+        """
+        levels = np.arange(256, dtype=np.float32) * _QUANTUM
+        band = (levels >= 0.3).astype(np.intp) + (levels > 0.5)
+        alignment = alignment_offset.astype(np.float32)[band] + alignment_slope.astype(np.float32)[band] * levels
+        resistance = 1.0 - levels  # 1 - compliance
+        rally = rally.astype(np.float32)
+        economic_pain = economic_pain.astype(np.float32)
+        state_mask = self.source_mask.dtype.type(
+            sum(1 << i for i, src in enumerate(self.sources) if any(m in src for m in STATE_ALIGNED_SOURCE_MARKERS))
+        )
+        rally_share = np.array([INDEPENDENT_RALLY_SHARE, 1.0], dtype=np.float32)
+
+        n_segments = len(self.counts)
+        supporters = np.zeros(n_segments, dtype=np.int64)
+        opposers = np.zeros(n_segments, dtype=np.int64)
+        protest_sum = np.zeros(n_segments)
+        ends = np.cumsum(self.counts)
+        for g in range(n_segments):
+            rally_by_source = rally[g] * rally_share
+            for lo in range(int(ends[g] - self.counts[g]), int(ends[g]), RESPOND_CHUNK):
+                block = slice(lo, min(lo + RESPOND_CHUNK, int(ends[g])))
+                trust = levels.take(self.trust[block])
+                support = trust + rally_by_source.take(((self.source_mask[block] & state_mask) != 0).view(np.uint8))
+                support -= economic_pain[g]
+                support += alignment.take(self.nationalism[block])
+                np.clip(support, 0.0, 1.0, out=support)
+
+                oppose = (1.0 - support) * resistance.take(self.compliance[block])
+                protest = levels.take(self.protest_propensity[block])
+                protest *= oppose
+                protest *= levels.take(self.mobilization[block])
+
+                draw = self.rng.random(len(support), dtype=np.float32)
+                supports = draw < support
+                opposes = (draw < support + oppose) & ~supports
+                stance = self.stance[block]
+                stance[:] = supports
+                stance[opposes] = -1
+
+                if persist:
+                    trust += (support - trust) * np.float32(OPINION_LEARNING_RATE)
+                    self.trust[block] = _quantize(trust)
+
+                supporters[g] += np.count_nonzero(supports)
+                opposers[g] += np.count_nonzero(opposes)
+                protest_sum[g] += protest.sum(dtype=np.float64)
+
+        occupied = self.counts > 0
+        size = np.where(occupied, self.counts, 1)
+        support_share = supporters / size
+        oppose_share = opposers / size
+        return (
+            support_share,
+            oppose_share,
+            np.where(occupied, 1.0 - support_share - oppose_share, 0.0),
+            np.clip(protest_sum / size, 0.0, 1.0),
+        )
@@ -7,12 +7,17 @@ been demonstrated to add predictive value.
 
 import json
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from uuid import uuid4
 
+import numpy as np
 from jinja2 import Environment, FileSystemLoader
 
 from grms.llm.base import get_provider
+from grms.llm.cache import response_cache
+from grms.llm.scheduler import Priority
+from grms.models.cognitive import CognitiveDecisionResult
 from grms.models.events import GeopoliticalEvent
 from grms.models.leader import LeaderProfile
 from grms.models.responses import (
@@ -21,6 +26,7 @@ from grms.models.responses import (
     ResponseReasoning,
     VerbalResponse,
 )
+from grms.services.cognitive_engine import ACTIONS, LAYERS, CognitiveDecisionEngine
 
 logger = logging.getLogger("grms.baselines")
 
@@ -152,8 +158,11 @@ class GenericLLMPredictor:
     general geopolitical reasoning.
     """
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, priority: Priority = Priority.INTERACTIVE):
         self.provider = get_provider()
+        self.response_cache = response_cache
+        self.use_cache = use_cache
+        self.priority = priority
 
     async def predict(self, leader: LeaderProfile, event: GeopoliticalEvent) -> LeaderResponse:
         template = jinja_env.get_template("leader_event_no_profile.jinja2")
@@ -162,7 +171,7 @@ class GenericLLMPredictor:
         system = "You are a geopolitical analyst making predictions about leader behavior based only on event details."
 
         try:
-            raw_response = await self.provider.generate(system, prompt)
+            raw_response = await self.response_cache.generate(self.provider, system, prompt, self.use_cache, self.priority)
         except Exception as e:
             logger.error(f"GenericLLM baseline error: {e}")
             return self._fallback(leader, event)
@@ -229,9 +238,8 @@ class CognitiveOnlyPredictor:
     Tests whether the structured model alone is competitive with the LLM.
     """
 
-    def __init__(self):
-        from grms.services.cognitive_engine import CognitiveDecisionEngine
-        self.engine = CognitiveDecisionEngine()
+    def __init__(self, engine: CognitiveDecisionEngine | None = None):
+        self.engine = engine or CognitiveDecisionEngine()
 
     ACTION_TO_TYPE = {
         "diplomatic_protest": "diplomatic",
@@ -249,20 +257,101 @@ class CognitiveOnlyPredictor:
         "direct_confrontation": "threatening",
     }
 
-    async def predict(self, leader: LeaderProfile, event: GeopoliticalEvent) -> LeaderResponse:
-        result = self.engine.predict(leader, event)
+    async def predict(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        formula_version: str | None = None,
+        trace: bool = False,
+    ) -> LeaderResponse:
+        """Map the engine's top actions onto a LeaderResponse; attach the full trace only if ``trace``."""
+        result = self.engine.predict_compact(leader, event, formula_version)
+        drivers = [(layer, rationale) for layer, _, rationale in result.layer_drivers(result.selected_action, threshold=0.02)]
+        return self._response(
+            leader,
+            event,
+            result.top_actions(3),
+            drivers,
+            result.confidence,
+            result.escalation_estimate,
+            cognitive_trace=result.trace if trace else None,
+        )
 
-        primary_action = result.selected_action
+    def predict_pairs(
+        self,
+        leaders: list[LeaderProfile],
+        events: list[GeopoliticalEvent],
+        leader_index: np.ndarray,
+        event_index: np.ndarray,
+        formula_version: str | None = None,
+    ) -> list[LeaderResponse]:
+        """Responses for each (leaders[leader_index[n]], events[event_index[n]]) pair from one engine pass.
+
+        Scores come from the vectorized engine; rationale text is looked up only for
+        the selected action's leading driver layers.
+        """
+        formula = self.engine.formulas.get(formula_version)
+        inputs = self.engine.build_inputs(leaders, events, leader_index, event_index)
+        layer_scores = self.engine.layer_scores(inputs, formula)
+        final = self.engine.combine(layer_scores, self.engine.interaction_magnitudes(inputs, formula), formula)
+        selected, confidence, escalation = self.engine.summarize(final, inputs.severity, formula)
+        ranking = np.argsort(-final, axis=1, kind="stable")[:, :3]
+        contributions = np.abs(layer_scores[np.arange(len(selected)), :, selected] * formula.layer_weight_vector)
+
+        responses = []
+        for n, (i, j) in enumerate(zip(leader_index, event_index)):
+            leader, event = leaders[i], events[j]
+            action = ACTIONS[selected[n]]
+            driver_layers = [layer for layer, c in zip(LAYERS, contributions[n]) if c > 0.02][:3]
+            drivers = [
+                (layer, self.engine.layer_rationale(leader, event, layer, action, bool(inputs.red_line[n]), formula))
+                for layer in driver_layers
+            ]
+            responses.append(self._response(
+                leader,
+                event,
+                [(ACTIONS[a], float(final[n, a])) for a in ranking[n]],
+                drivers,
+                float(confidence[n]),
+                float(escalation[n]),
+            ))
+        return responses
+
+    def predict_matrix(
+        self,
+        leaders: list[LeaderProfile],
+        events: list[GeopoliticalEvent],
+        formula_version: str | None = None,
+        chunk_size: int = 2048,
+    ) -> Iterator[list[LeaderResponse]]:
+        """Every leader × event pair, leader-major, one engine pass per ``chunk_size`` pairs."""
+        total = len(leaders) * len(events)
+        for start in range(0, total, chunk_size):
+            leader_index, event_index = np.divmod(np.arange(start, min(start + chunk_size, total)), len(events))
+            first, last = leader_index[0], leader_index[-1]
+            yield self.predict_pairs(leaders[first:last + 1], events, leader_index - first, event_index, formula_version)
+
+    def _response(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        top_actions: list[tuple[str, float]],
+        drivers: list[tuple[str, str]],
+        confidence: float,
+        escalation: float,
+        cognitive_trace: CognitiveDecisionResult | None = None,
+    ) -> LeaderResponse:
+        primary_action = top_actions[0][0]
         tone = self.ACTION_TO_TONE.get(primary_action, "measured")
 
         actions = []
-        for action_score in result.action_scores[:3]:
-            if action_score.final_score > 0:
+        for action, final_score in top_actions:
+            if final_score > 0:
                 actions.append(LeaderAction(
-                    action_type=self.ACTION_TO_TYPE.get(action_score.action, "diplomatic"),
-                    description=f"Cognitive engine: {action_score.action.replace('_', ' ')}",
+                    action_type=self.ACTION_TO_TYPE.get(action, "diplomatic"),
+                    description=f"Cognitive engine: {action.replace('_', ' ')}",
                     timeline="days",
-                    likelihood=max(0.1, min(1.0, (action_score.final_score + 1) / 2)),
+                    likelihood=max(0.1, min(1.0, (final_score + 1) / 2)),
                     reversibility="reversible",
                 ))
 
@@ -275,11 +364,7 @@ class CognitiveOnlyPredictor:
                 reversibility="reversible",
             ))
 
-        top_drivers = []
-        if result.action_scores:
-            for contrib in result.action_scores[0].layer_contributions:
-                if abs(contrib.weighted_contribution) > 0.02:
-                    top_drivers.append(f"{contrib.layer}: {contrib.rationale}")
+        top_drivers = [f"{layer}: {rationale}" for layer, rationale in drivers]
 
         return LeaderResponse(
             event_id=event.id,
@@ -291,13 +376,13 @@ class CognitiveOnlyPredictor:
             ),
             actions=actions,
             reasoning=ResponseReasoning(
-                personality_factors=[f"cognitive_engine.{result.selected_action}"],
+                personality_factors=[f"cognitive_engine.{primary_action}"],
                 historical_precedents=[],
                 contextual_drivers=top_drivers[:3],
                 constraints=["parametric model only — no LLM inference"],
-                confidence=result.confidence,
+                confidence=confidence,
             ),
-            escalation_risk=result.escalation_estimate,
+            escalation_risk=escalation,
             de_escalation_openings=[],
-            cognitive_trace=result,
+            cognitive_trace=cognitive_trace,
         )
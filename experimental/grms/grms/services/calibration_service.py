@@ -0,0 +1,213 @@
+"""Fit cognitive formula weights to scoring cases with known outcomes.
+
+Layer scores and interaction magnitudes do not depend on the weights, so they are
+computed once per case. Each candidate weight set then costs one contraction plus
+the ScoringService objective (escalation error, action-type F1, tone similarity)
+evaluated on arrays, which lets the optimizer score a whole population at once.
+"""
+
+import logging
+import time
+
+import numpy as np
+from scipy.optimize import differential_evolution
+
+from grms.models.cognitive import CalibrationFold, CalibrationResult, CognitiveFormulaSpec
+from grms.models.scoring import ScoringCase
+from grms.services.baselines import CognitiveOnlyPredictor
+from grms.services.cognitive_engine import ACTIONS, LAYERS, CognitiveDecisionEngine
+from grms.services.cognitive_formula import CompiledFormula
+from grms.services.scoring_service import DIMENSION_WEIGHTS, TONE_SIMILARITY
+
+logger = logging.getLogger("grms.calibration_service")
+
+INTERACTION_WEIGHT_BOUNDS = (0.0, 0.3)
+DEFAULT_ACTION_TYPE = "diplomatic"
+
+
+class CalibrationObjective:
+    """Per-case ScoringService score of cognitive-only predictions as a function of the weights."""
+
+    def __init__(self, engine: CognitiveDecisionEngine, cases: list[ScoringCase], formula: CompiledFormula):
+        index = np.arange(len(cases))
+        inputs = engine.build_inputs([c.leader for c in cases], [c.event for c in cases], index, index)
+        self.layer_scores = engine.layer_scores(inputs, formula)  # (N, L, A)
+        self.magnitudes = engine.interaction_magnitudes(inputs, formula)  # (N, K)
+        self.severity = inputs.severity
+        self.escalation = formula.escalation
+        self.interaction_profile = formula.interaction_profile
+
+        known = [c.known_outcome for c in cases]
+        action_to_type = CognitiveOnlyPredictor.ACTION_TO_TYPE
+        action_to_tone = CognitiveOnlyPredictor.ACTION_TO_TONE
+        types = sorted(set(action_to_type.values()) | {t for k in known for t in k.action_types} | {DEFAULT_ACTION_TYPE})
+        self.action_types = np.array([[action_to_type[a] == t for t in types] for a in ACTIONS])  # (A, T)
+        self.default_types = np.array([t == DEFAULT_ACTION_TYPE for t in types])
+        self.known_types = np.array([[t in k.action_types for t in types] for k in known])  # (N, T)
+
+        self.known_escalation = np.array([k.escalation_risk if k.escalation_risk is not None else 0.0 for k in known])
+        self.tone_scores = np.array([
+            [
+                1.0 if action_to_tone[a] == k.tone else TONE_SIMILARITY.get((action_to_tone[a], k.tone), 0.0)
+                for a in ACTIONS
+            ]
+            for k in known
+        ])  # (N, A) score if that action is selected
+
+        # Only dimensions with a known value count towards a case's score
+        self.dimension_weights = np.array([
+            [
+                DIMENSION_WEIGHTS["escalation_risk"] if k.escalation_risk is not None else 0.0,
+                DIMENSION_WEIGHTS["action_types"] if k.action_types else 0.0,
+                DIMENSION_WEIGHTS["tone"] if k.tone else 0.0,
+            ]
+            for k in known
+        ])
+        self.dimension_total = np.maximum(self.dimension_weights.sum(axis=1), 0.01)
+
+    def __len__(self) -> int:
+        return len(self.severity)
+
+    def case_scores(self, layer_weights: np.ndarray, interaction_weights: np.ndarray) -> np.ndarray:
+        """Scores for S candidate weight sets, shape (S, N); weights are (S, L) and (S, K)."""
+        final = (
+            np.tensordot(layer_weights, self.layer_scores, axes=([1], [1]))
+            + (interaction_weights @ self.magnitudes.T)[:, :, None] * self.interaction_profile
+        )
+        order = np.argsort(-final, axis=2, kind="stable")
+        selected = order[:, :, 0]
+
+        shifted = final - final.min(axis=2, keepdims=True) + 0.01
+        weighted_escalation = (shifted / shifted.sum(axis=2, keepdims=True)) @ self.escalation
+        escalation = np.clip((weighted_escalation + 1.0) / 2.0 * self.severity + self.severity * 0.2, 0.0, 1.0)
+        escalation_score = np.maximum(0.0, 1.0 - np.abs(escalation - self.known_escalation))
+
+        # CognitiveOnlyPredictor reports the top three actions with a positive score
+        top = order[:, :, :3]
+        chosen = np.zeros(final.shape, dtype=bool)
+        np.put_along_axis(chosen, top, np.take_along_axis(final, top, axis=2) > 0, axis=2)
+        predicted = (chosen.astype(float) @ self.action_types) > 0
+        predicted = np.where(predicted.any(axis=2, keepdims=True), predicted, self.default_types)
+        true_positives = (predicted & self.known_types).sum(axis=2)
+        denominator = predicted.sum(axis=2) + self.known_types.sum(axis=1)
+        action_score = np.where(denominator > 0, 2.0 * true_positives / np.maximum(denominator, 1), 0.0)
+
+        tone_score = np.take_along_axis(self.tone_scores[None], selected[:, :, None], axis=2)[:, :, 0]
+
+        w = self.dimension_weights
+        return (w[:, 0] * escalation_score + w[:, 1] * action_score + w[:, 2] * tone_score) / self.dimension_total
+
+
+class CalibrationService:
+    def __init__(self, engine: CognitiveDecisionEngine | None = None):
+        self.engine = engine or CognitiveDecisionEngine()
+
+    def calibrate(
+        self,
+        cases: list[ScoringCase],
+        base_version: str | None = None,
+        name: str | None = None,
+        folds: int = 5,
+        seed: int = 0,
+        maxiter: int = 200,
+        popsize: int = 20,
+        regularization: float = 0.01,
+    ) -> CalibrationResult:
+        """Fit layer and interaction weights, report k-fold held-out scores, return the fitted spec.
+
+        ``regularization`` pulls weights towards the base formula; the objective is
+        piecewise constant in the selected action, so it also breaks ties between
+        weight sets that score the same.
+        """
+        if not cases:
+            raise ValueError("Calibration needs at least one scoring case")
+        start = time.perf_counter()
+        base = self.engine.formulas.get(base_version)
+        objective = CalibrationObjective(self.engine, cases, base)
+        base_layers = base.layer_weight_vector / base.layer_weight_vector.sum()
+        base_interactions = base.interaction_weights
+        evaluations = 0
+
+        def fit(case_index: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            n_layers = len(LAYERS)
+
+            def loss(x: np.ndarray) -> np.ndarray:
+                nonlocal evaluations
+                layer_w = x[:n_layers].T
+                layer_w = layer_w / np.maximum(layer_w.sum(axis=1, keepdims=True), 1e-9)
+                interaction_w = x[n_layers:].T
+                evaluations += len(layer_w)
+                scores = objective.case_scores(layer_w, interaction_w)[:, case_index].mean(axis=1)
+                penalty = ((layer_w - base_layers) ** 2).sum(axis=1) + ((interaction_w - base_interactions) ** 2).sum(axis=1)
+                return 1.0 - scores + regularization * penalty
+
+            bounds = [(0.0, 1.0)] * n_layers + [INTERACTION_WEIGHT_BOUNDS] * len(base_interactions)
+            result = differential_evolution(
+                loss,
+                bounds,
+                x0=np.concatenate([base_layers, np.clip(base_interactions, *INTERACTION_WEIGHT_BOUNDS)]),
+                seed=seed,
+                maxiter=maxiter,
+                popsize=popsize,
+                tol=1e-6,
+                polish=False,
+                vectorized=True,
+                updating="deferred",
+            )
+            layer_w = result.x[:n_layers] / max(result.x[:n_layers].sum(), 1e-9)
+            return layer_w, result.x[n_layers:]
+
+        def mean_score(layer_w: np.ndarray, interaction_w: np.ndarray, case_index: np.ndarray) -> float:
+            return float(objective.case_scores(layer_w[None], interaction_w[None])[0, case_index].mean())
+
+        all_cases = np.arange(len(objective))
+        fold_results: list[CalibrationFold] = []
+        if 2 <= folds <= len(objective):
+            permutation = np.random.default_rng(seed).permutation(len(objective))
+            for k, test_index in enumerate(np.array_split(permutation, folds)):
+                train_index = np.setdiff1d(all_cases, test_index)
+                layer_w, interaction_w = fit(train_index)
+                fold_results.append(CalibrationFold(
+                    fold=k,
+                    train_cases=len(train_index),
+                    test_cases=len(test_index),
+                    train_score=mean_score(layer_w, interaction_w, train_index),
+                    test_score=mean_score(layer_w, interaction_w, test_index),
+                    baseline_test_score=mean_score(base_layers, base_interactions, test_index),
+                ))
+                logger.info(
+                    "Calibration fold %d: train=%.3f test=%.3f baseline=%.3f",
+                    k, fold_results[-1].train_score, fold_results[-1].test_score, fold_results[-1].baseline_test_score,
+                )
+
+        layer_w, interaction_w = fit(all_cases)
+        spec = self._fitted_spec(base, layer_w, interaction_w, name or f"{base.name}_calibrated")
+
+        return CalibrationResult(
+            base_formula_version=base.name,
+            formula=spec,
+            total_cases=len(objective),
+            baseline_score=mean_score(base_layers, base_interactions, all_cases),
+            fitted_score=mean_score(layer_w, interaction_w, all_cases),
+            folds=fold_results,
+            cv_test_score=float(np.mean([f.test_score for f in fold_results])) if fold_results else None,
+            baseline_cv_test_score=float(np.mean([f.baseline_test_score for f in fold_results])) if fold_results else None,
+            weight_sets_evaluated=evaluations,
+            elapsed_seconds=time.perf_counter() - start,
+        )
+
+    def _fitted_spec(
+        self,
+        base: CompiledFormula,
+        layer_weights: np.ndarray,
+        interaction_weights: np.ndarray,
+        name: str,
+    ) -> CognitiveFormulaSpec:
+        spec = base.spec.model_copy(deep=True)
+        spec.name = name
+        spec.description = f"{base.spec.description} (weights calibrated from {base.name})".strip()
+        for layer, w in zip(LAYERS, layer_weights):
+            spec.layers[layer].weight = round(float(w), 4)
+        for term, w in zip(spec.interaction_terms, interaction_weights):
+            term.weight = round(float(w), 4)
+        return spec
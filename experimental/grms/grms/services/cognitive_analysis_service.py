@@ -0,0 +1,383 @@
+"""Uncertainty and sensitivity analysis on top of the vectorized cognitive decision engine.
+
+Every analysis here packs one leader/event pair into CognitiveInputs, replicates
+it into many rows, perturbs the rows and evaluates them in a single batched pass.
+"""
+
+import math
+
+import numpy as np
+from pydantic import BaseModel
+from scipy.stats import qmc
+
+from grms.models.cognitive import (
+    CognitiveDistributionResult,
+    CognitiveSensitivityResult,
+    CognitiveWhatIfResult,
+    LayerDiff,
+    PerturbationSpec,
+    SensitivityInput,
+    WhatIfDelta,
+    WhatIfOutcome,
+)
+from grms.models.events import GeopoliticalEvent
+from grms.models.leader import LeaderProfile
+from grms.services.cognitive_engine import (
+    ACTIONS,
+    BELIEF_KEYS,
+    LAYERS,
+    PERSONALITY_AXES,
+    CognitiveDecisionEngine,
+    READINESS_LEVELS,
+    CognitiveInputs,
+    CognitivePrediction,
+)
+
+ESCALATION_QUANTILES = {"p05": 0.05, "p25": 0.25, "p50": 0.50, "p75": 0.75, "p95": 0.95}
+ESCALATION_HISTOGRAM_BINS = 20
+
+# Perturbable context fields: input attribute and valid range
+CONTEXT_DIMENSIONS = {
+    "approval_rating": ("approval", 0.0, 100.0),
+    "opposition_strength": ("opposition", 0.0, 1.0),
+    "inflation": ("inflation", 0.0, None),
+}
+
+# Range swept for inflation in sensitivity analysis, which needs a finite upper bound
+SENSITIVITY_INFLATION_MAX = 30.0
+
+# Engine stages that read each personality axis (layer scores and inferred motivations)
+_PERSONALITY_DEPENDENCIES = {
+    "risk_tolerance": {"personality", "motivations", "motivation"},
+    "authoritarianism": {"motivations", "motivation"},
+    "nationalism": {"personality", "motivations", "motivation"},
+    "pragmatism": {"personality", "motivations", "motivation"},
+    "aggression": {"personality", "motivations", "motivation"},
+    "populism": {"motivations", "motivation"},
+    "transparency": set(),
+    "religiosity": set(),
+}
+
+_EVENT_DEPENDENCIES = {"red_line", "identity", "beliefs", "belief", "context", "history", "interactions"}
+
+# What-if input field -> engine stages to re-run. Interaction terms may read any
+# personality axis, belief, motivation or red-line/approval/opposition value.
+WHAT_IF_DEPENDENCIES = {
+    **{f"personality.{axis}": deps | {"interactions"} for axis, deps in _PERSONALITY_DEPENDENCIES.items()},
+    "decision_context.approval_rating": {"beliefs", "belief", "context", "interactions"},
+    "decision_context.military_posture.readiness_level": {"beliefs", "belief", "context", "interactions"},
+    "decision_context.domestic_pressures.opposition_strength": {"context", "interactions"},
+    "decision_context.economic_conditions.inflation": {"context"},
+    "cultural_context.decision_making_style": {"identity"},
+    "event.severity": _EVENT_DEPENDENCIES,
+    "event.structured.reversibility": _EVENT_DEPENDENCIES,
+}
+
+
+class CognitiveAnalysisService:
+    def __init__(self, engine: CognitiveDecisionEngine | None = None):
+        self.engine = engine or CognitiveDecisionEngine()
+
+    def predict_distribution(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        samples: int = 10000,
+        noise: PerturbationSpec | None = None,
+        seed: int | None = None,
+        formula_version: str | None = None,
+    ) -> CognitiveDistributionResult:
+        """Monte Carlo over perturbed personality, beliefs and context for one leader/event pair."""
+        formula = self.engine.formulas.get(formula_version)
+        noise = noise or PerturbationSpec()
+        sd = self._resolve_noise(noise)
+
+        base = self._single_pair_inputs(leader, event)
+        _, point_selected, _, point_escalation = self.engine.evaluate(base, formula)
+
+        x = base.take(np.zeros(samples, dtype=int))
+        self._perturb(x, sd, np.random.default_rng(seed))
+        _, selected, confidence, escalation = self.engine.evaluate(x, formula)
+
+        counts = np.bincount(selected, minlength=len(ACTIONS))
+        histogram, edges = np.histogram(escalation, bins=ESCALATION_HISTOGRAM_BINS, range=(0.0, 1.0))
+        quantiles = np.quantile(escalation, list(ESCALATION_QUANTILES.values()))
+
+        return CognitiveDistributionResult(
+            samples=samples,
+            point_estimate_action=ACTIONS[int(point_selected[0])],
+            point_estimate_escalation=float(point_escalation[0]),
+            action_frequencies={a: float(c) / samples for a, c in zip(ACTIONS, counts)},
+            escalation_mean=float(escalation.mean()),
+            escalation_std=float(escalation.std()),
+            escalation_quantiles={k: float(q) for k, q in zip(ESCALATION_QUANTILES, quantiles)},
+            escalation_histogram=histogram.tolist(),
+            escalation_bin_edges=edges.tolist(),
+            confidence_mean=float(confidence.mean()),
+            formula_version=formula.name,
+        )
+
+    def what_if(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        deltas: list[WhatIfDelta],
+        formula_version: str | None = None,
+        trace: bool = False,
+    ) -> CognitiveWhatIfResult:
+        """Apply field deltas to a leader/event pair, re-running only the stages each delta reaches."""
+        if not deltas:
+            raise ValueError("At least one delta is required")
+        unknown = sorted({d.field for d in deltas} - set(WHAT_IF_DEPENDENCIES))
+        if unknown:
+            raise ValueError(f"Unsupported what-if fields: {', '.join(unknown)}")
+
+        base = self.engine.predict_compact(leader, event, formula_version)
+        combined = self._what_if_outcome(base, leader, event, deltas, trace)
+        individual = []
+        if len(deltas) > 1:
+            individual = [self._what_if_outcome(base, leader, event, [d], trace) for d in deltas]
+
+        return CognitiveWhatIfResult(
+            base_selected_action=base.selected_action,
+            base_confidence=base.confidence,
+            base_escalation_estimate=base.escalation_estimate,
+            combined=combined,
+            individual=individual,
+            formula_version=base.formula_version,
+        )
+
+    def _what_if_outcome(
+        self,
+        base: CognitivePrediction,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        deltas: list[WhatIfDelta],
+        trace: bool,
+    ) -> WhatIfOutcome:
+        stages: set[str] = set()
+        for delta in deltas:
+            stages |= WHAT_IF_DEPENDENCIES[delta.field]
+            family, _, path = delta.field.partition(".")
+            if family == "event":
+                event = _with_field(event, path, delta.value)
+            else:
+                leader = _with_field(leader, delta.field, delta.value)
+
+        result = self.engine.predict_incremental(base, leader, event, stages)
+
+        layer_diffs = [
+            LayerDiff(
+                layer=layer,
+                recomputed=layer in stages,
+                score_delta={a: result.layer_scores[layer][a] - base.layer_scores[layer][a] for a in ACTIONS},
+            )
+            for layer in LAYERS
+        ]
+        layer_diffs.append(LayerDiff(
+            layer="interactions",
+            recomputed="interactions" in stages,
+            score_delta={
+                a: sum(i["effects"][a] for i in result.interactions) - sum(i["effects"][a] for i in base.interactions)
+                for a in ACTIONS
+            },
+        ))
+
+        return WhatIfOutcome(
+            deltas=deltas,
+            selected_action=result.selected_action,
+            selected_action_changed=result.selected_action != base.selected_action,
+            confidence=result.confidence,
+            escalation_estimate=result.escalation_estimate,
+            escalation_delta=result.escalation_estimate - base.escalation_estimate,
+            final_scores={a: float(v) for a, v in zip(ACTIONS, result.scores)},
+            final_score_delta={a: float(v) for a, v in zip(ACTIONS, result.scores - base.scores)},
+            recomputed=sorted(stages),
+            layer_diffs=layer_diffs,
+            trace=result.trace if trace else None,
+        )
+
+    def _single_pair_inputs(self, leader: LeaderProfile, event: GeopoliticalEvent) -> CognitiveInputs:
+        index = np.zeros(1, dtype=int)
+        return self.engine.build_inputs([leader], [event], index, index)
+
+    def _resolve_noise(self, noise: PerturbationSpec) -> dict[str, float]:
+        sd = {f"personality.{axis}": noise.personality_sd for axis in PERSONALITY_AXES}
+        sd.update({f"belief.{key}": noise.belief_sd for key in BELIEF_KEYS})
+        valid = set(sd) | {f"context.{name}" for name in CONTEXT_DIMENSIONS}
+        unknown = set(noise.dimension_sd) - valid
+        if unknown:
+            raise ValueError(f"Unknown perturbation dimensions: {', '.join(sorted(unknown))}")
+        sd.update(noise.dimension_sd)
+        return sd
+
+    def _perturb(self, x: CognitiveInputs, sd: dict[str, float], rng: np.random.Generator) -> None:
+        n = len(x)
+        personality_sd = np.array([sd[f"personality.{axis}"] for axis in PERSONALITY_AXES])
+        x.personality = np.clip(x.personality + rng.standard_normal((n, len(PERSONALITY_AXES))) * personality_sd, -1.0, 1.0)
+
+        for name, (attr, low, high) in CONTEXT_DIMENSIONS.items():
+            scale = sd.get(f"context.{name}", 0.0)
+            if scale > 0:
+                setattr(x, attr, np.clip(getattr(x, attr) + rng.normal(0.0, scale, n), low, high))
+        # domestic_support is inferred from approval, so approval noise carries through to the belief
+        x.beliefs[:, BELIEF_KEYS.index("domestic_support")] = x.approval / 100.0
+
+        belief_sd = np.array([sd[f"belief.{key}"] for key in BELIEF_KEYS])
+        x.beliefs = np.clip(x.beliefs + rng.standard_normal((n, len(BELIEF_KEYS))) * belief_sd, 0.0, 1.0)
+
+    def sensitivity(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        base_samples: int = 4096,
+        grid_points: int = 21,
+        seed: int | None = None,
+        formula_version: str | None = None,
+    ) -> CognitiveSensitivityResult:
+        """One-at-a-time sweeps plus Saltelli/Sobol indices over personality, beliefs and context.
+
+        Inferred beliefs are treated as free inputs over [0, 1], independent of the
+        context fields they are normally derived from.
+        """
+        formula = self.engine.formulas.get(formula_version)
+        dimensions = self._sensitivity_dimensions()
+        n_dims = len(dimensions)
+        base = self._single_pair_inputs(leader, event)
+        _, point_selected, _, point_escalation = self.engine.evaluate(base, formula)
+        baseline = [self._read_dimension(base, name)[0] for name, _, _ in dimensions]
+
+        # One-at-a-time grid: each input swept across its range, the rest held at baseline
+        grids = [self._grid(name, low, high, grid_points) for name, low, high in dimensions]
+        grid_rows = np.repeat(np.arange(n_dims), [len(g) for g in grids])
+        x = base.take(np.zeros(len(grid_rows), dtype=int))
+        offset = 0
+        for (name, _, _), grid in zip(dimensions, grids):
+            rows = slice(offset, offset + len(grid))
+            column = self._read_dimension(x, name).copy()
+            column[rows] = grid
+            self._assign_dimension(x, name, column)
+            offset += len(grid)
+        _, grid_selected, _, grid_escalation = self.engine.evaluate(x, formula)
+
+        # Saltelli design: A, B and each A with column i taken from B, in one batch
+        n = 2 ** math.ceil(math.log2(max(base_samples, 2)))
+        unit = qmc.Sobol(d=2 * n_dims, scramble=True, seed=seed).random(n)
+        a, b = unit[:, :n_dims], unit[:, n_dims:]
+        ab = np.repeat(a[None], n_dims, axis=0)
+        ab[np.arange(n_dims), :, np.arange(n_dims)] = b.T
+        design = np.concatenate([a, b, ab.reshape(-1, n_dims)])
+        lows = np.array([low for _, low, _ in dimensions])
+        highs = np.array([high for _, _, high in dimensions])
+
+        x = base.take(np.zeros(len(design), dtype=int))
+        for i, (name, _, _) in enumerate(dimensions):
+            self._assign_dimension(x, name, lows[i] + design[:, i] * (highs[i] - lows[i]))
+        _, selected, _, escalation = self.engine.evaluate(x, formula)
+
+        escalation_first, escalation_total = self._sobol_indices(escalation[:, None], n, n_dims)
+        indicators = (selected[:, None] == np.arange(len(ACTIONS))).astype(float)
+        selection_first, selection_total = self._sobol_indices(indicators, n, n_dims)
+        counts = np.bincount(selected[:2 * n], minlength=len(ACTIONS))
+
+        inputs = []
+        offset = 0
+        for i, ((name, low, high), grid) in enumerate(zip(dimensions, grids)):
+            rows = slice(offset, offset + len(grid))
+            actions = grid_selected[rows]
+            inputs.append(SensitivityInput(
+                input=name,
+                baseline=float(baseline[i]),
+                low=low,
+                high=high,
+                grid=grid.tolist(),
+                grid_selected_actions=[ACTIONS[int(k)] for k in actions],
+                grid_escalation=grid_escalation[rows].tolist(),
+                action_switches=int(np.count_nonzero(np.diff(actions))),
+                escalation_first_order=float(escalation_first[i]),
+                escalation_total=float(escalation_total[i]),
+                selection_first_order=float(selection_first[i]),
+                selection_total=float(selection_total[i]),
+            ))
+            offset += len(grid)
+
+        names = [name for name, _, _ in dimensions]
+        return CognitiveSensitivityResult(
+            point_estimate_action=ACTIONS[int(point_selected[0])],
+            point_estimate_escalation=float(point_escalation[0]),
+            base_samples=n,
+            evaluations=len(design) + len(grid_rows) + 1,
+            escalation_variance=float(np.var(escalation[:2 * n])),
+            action_frequencies={a: float(c) / (2 * n) for a, c in zip(ACTIONS, counts)},
+            escalation_drivers=[names[i] for i in np.argsort(-escalation_total, kind="stable")],
+            selection_drivers=[names[i] for i in np.argsort(-selection_total, kind="stable")],
+            inputs=inputs,
+            formula_version=formula.name,
+        )
+
+    @staticmethod
+    def _sensitivity_dimensions() -> list[tuple[str, float, float]]:
+        dims = [(f"personality.{axis}", -1.0, 1.0) for axis in PERSONALITY_AXES]
+        dims += [(f"belief.{key}", 0.0, 1.0) for key in BELIEF_KEYS]
+        for name, (_, low, high) in CONTEXT_DIMENSIONS.items():
+            dims.append((f"context.{name}", low, SENSITIVITY_INFLATION_MAX if high is None else high))
+        dims.append(("context.readiness_level", 0.0, float(len(READINESS_LEVELS) - 1)))
+        return dims
+
+    @staticmethod
+    def _grid(name: str, low: float, high: float, points: int) -> np.ndarray:
+        if name == "context.readiness_level":
+            return np.arange(len(READINESS_LEVELS), dtype=float)
+        return np.linspace(low, high, points)
+
+    @staticmethod
+    def _read_dimension(x: CognitiveInputs, name: str) -> np.ndarray:
+        family, _, key = name.partition(".")
+        if family == "personality":
+            return x.personality[:, PERSONALITY_AXES.index(key)]
+        if family == "belief":
+            return x.beliefs[:, BELIEF_KEYS.index(key)]
+        if key == "readiness_level":
+            return x.readiness.astype(float)
+        return getattr(x, CONTEXT_DIMENSIONS[key][0])
+
+    @staticmethod
+    def _assign_dimension(x: CognitiveInputs, name: str, values: np.ndarray) -> None:
+        family, _, key = name.partition(".")
+        if family == "personality":
+            x.personality[:, PERSONALITY_AXES.index(key)] = values
+        elif family == "belief":
+            x.beliefs[:, BELIEF_KEYS.index(key)] = values
+        elif key == "readiness_level":
+            # Continuous samples over [0, levels - 1] map onto equal-width level bins
+            levels = len(READINESS_LEVELS)
+            x.readiness = np.minimum((values * levels / (levels - 1)).astype(int), levels - 1)
+        else:
+            setattr(x, CONTEXT_DIMENSIONS[key][0], np.asarray(values, dtype=float))
+
+    @staticmethod
+    def _sobol_indices(y: np.ndarray, n: int, n_dims: int) -> tuple[np.ndarray, np.ndarray]:
+        """First-order (Saltelli 2010) and total-effect (Jansen) indices from a Saltelli design.
+
+        ``y`` is (n * (n_dims + 2), outputs); multiple outputs are combined with
+        variance weights, which for one-hot action indicators gives the index of the
+        categorical selection.
+        """
+        y_a, y_b = y[:n], y[n:2 * n]
+        y_ab = y[2 * n:].reshape(n_dims, n, -1)
+        variance = np.concatenate([y_a, y_b]).var(axis=0).sum()
+        if variance <= 0:
+            return np.zeros(n_dims), np.zeros(n_dims)
+        first = (y_b * (y_ab - y_a)).mean(axis=1).sum(axis=1) / variance
+        total = 0.5 * ((y_a - y_ab) ** 2).mean(axis=1).sum(axis=1) / variance
+        return first, total
+
+
+def _with_field(model: BaseModel, path: str, value):
+    """Copy of ``model`` with the dotted ``path`` set to ``value``, validated against the field."""
+    head, _, rest = path.partition(".")
+    if rest:
+        value = _with_field(getattr(model, head), rest, value)
+    updated = model.model_copy()
+    updated.__pydantic_validator__.validate_assignment(updated, head, value)
+    return updated
@@ -4,8 +4,15 @@ Refactored from cognitive_decision_demo.py into a reusable service that takes
 LeaderProfile + GeopoliticalEvent and produces auditable decision traces.
 """
 
-import math
+import hashlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
+from uuid import UUID
 
+import numpy as np
+
+from grms.config import settings
 from grms.models.cognitive import (
     ActionScore,
     CognitiveDecisionResult,
@@ -14,60 +21,384 @@ from grms.models.cognitive import (
 )
 from grms.models.events import GeopoliticalEvent
 from grms.models.leader import LeaderProfile
+from grms.services.cognitive_formula import (
+    ACTIONS,
+    BELIEF_KEYS,
+    LAYERS,
+    MOTIVATION_DIMS,
+    PERSONALITY_AXES,
+    CompiledFormula,
+    FormulaRegistry,
+)
 
-ACTIONS = [
-    "diplomatic_protest",
-    "economic_retaliation",
-    "military_posturing",
-    "hybrid_pressure",
-    "direct_confrontation",
-]
-
-ACTION_AFFORDANCES = {
-    "diplomatic_protest":   {"escalation": -0.8, "strength": -0.5, "sovereignty": 0.2, "risk": -0.9, "visibility": 0.3},
-    "economic_retaliation": {"escalation": -0.2, "strength":  0.3, "sovereignty": 0.6, "risk": -0.3, "visibility": 0.5},
-    "military_posturing":   {"escalation":  0.4, "strength":  0.7, "sovereignty": 0.8, "risk":  0.3, "visibility": 0.8},
-    "hybrid_pressure":      {"escalation":  0.3, "strength":  0.5, "sovereignty": 0.5, "risk":  0.1, "visibility": -0.3},
-    "direct_confrontation": {"escalation":  0.9, "strength":  1.0, "sovereignty": 1.0, "risk":  0.9, "visibility": 1.0},
-}
+READINESS_BONUS = {"peacetime": -0.3, "elevated": 0.2, "mobilized": 0.5}
+READINESS_EFFECTIVENESS = {"peacetime": 0.35, "elevated": 0.6, "mobilized": 0.75}
 
-LAYER_WEIGHTS = {
-    "identity":    0.10,
-    "personality": 0.25,
-    "belief":      0.25,
-    "motivation":  0.15,
-    "context":     0.15,
-    "history":     0.10,
+MILITARY_ACTIONS = ("military_posturing", "direct_confrontation")
+
+HISTORY_KEYWORDS = {
+    "diplomatic_protest": ["diplomatic", "protest", "negotiate", "negotiate"],
+    "economic_retaliation": ["economic", "sanction", "trade", "retaliation"],
+    "military_posturing": ["military", "deploy", "exercise", "postur", "pressure"],
+    "hybrid_pressure": ["cyber", "hybrid", "proxy", "information", "covert"],
+    "direct_confrontation": ["invad", "attack", "war", "confront", "blockade", "ultimatum"],
 }
 
-INTERACTION_TERMS = [
-    {"layers": ["personality.aggression", "belief.hostile_intent"], "weight": 0.08},
-    {"layers": ["personality.nationalism", "context.red_line_triggered"], "weight": 0.10},
-    {"layers": ["motivation.power", "context.approval_rating"], "weight": 0.05},
-]
+READINESS_LEVELS = list(READINESS_BONUS)
+
+# Formula-independent action masks and readiness tables, columns in ACTIONS order
+_PERSONALITY_AXIS_INDEX = [PERSONALITY_AXES.index(k) for k in ("risk_tolerance", "aggression", "nationalism", "pragmatism")]
+_MILITARY_MASK = np.array([a in MILITARY_ACTIONS for a in ACTIONS], dtype=float)
+_DIPLOMATIC_MASK = np.array([a == "diplomatic_protest" for a in ACTIONS], dtype=float)
+_CONFRONTATION_MASK = np.array([a == "direct_confrontation" for a in ACTIONS], dtype=float)
+# readiness index -1 (unknown level) picks the trailing neutral entry
+_READINESS_BONUS = np.array([READINESS_BONUS[r] for r in READINESS_LEVELS] + [0.0])
+_READINESS_EFFECTIVENESS = np.array([READINESS_EFFECTIVENESS[r] for r in READINESS_LEVELS] + [0.5])
+
+
+@dataclass
+class CognitiveInputs:
+    """Struct-of-arrays inputs for N leader/event pairs evaluated in one pass."""
+
+    personality: np.ndarray  # (N, 8) in PERSONALITY_AXES order
+    beliefs: np.ndarray  # (N, 5) in BELIEF_KEYS order
+    approval: np.ndarray  # (N,) 0-100
+    readiness: np.ndarray  # (N,) index into READINESS_LEVELS, -1 if unknown
+    opposition: np.ndarray  # (N,)
+    inflation: np.ndarray  # (N,)
+    unilateral: np.ndarray  # (N,) 1.0 if decision_making_style == "unilateral"
+    precedent: np.ndarray  # (N, A) 1.0 where decision_history matches the action
+    red_line: np.ndarray  # (N,) 1.0 if a red line is triggered
+    severity: np.ndarray  # (N,)
+
+    def __len__(self) -> int:
+        return len(self.severity)
+
+    def take(self, index: np.ndarray) -> "CognitiveInputs":
+        """Row-indexed copy, e.g. ``inputs.take(np.zeros(n, dtype=int))`` to replicate one pair n times."""
+        return CognitiveInputs(**{f.name: getattr(self, f.name)[index] for f in fields(self)})
+
+
+@dataclass
+class CognitivePrediction:
+    """Numeric result of one prediction; the explainable trace is assembled on first access."""
+
+    scores: np.ndarray  # (A,) final scores in ACTIONS order
+    ranking: np.ndarray  # (A,) indices into ACTIONS, best first
+    confidence: float
+    escalation_estimate: float
+    formula: CompiledFormula
+    # Per-layer scores/rationales and interaction effects kept for the trace
+    layer_scores: dict[str, dict[str, float]] = field(repr=False)
+    layer_rationales: dict[str, dict[str, str]] = field(repr=False)
+    interactions: list[dict] = field(repr=False)
+    # Intermediate inputs, reused by ``predict_incremental``
+    red_line_triggered: bool = field(repr=False)
+    beliefs: dict[str, float] = field(repr=False)
+    motivations: dict[str, float] = field(repr=False)
+    _trace: CognitiveDecisionResult | None = field(default=None, init=False, repr=False)
+
+    @property
+    def selected_action(self) -> str:
+        return ACTIONS[int(self.ranking[0])]
+
+    @property
+    def formula_version(self) -> str:
+        return self.formula.name
+
+    def top_actions(self, k: int | None = None) -> list[tuple[str, float]]:
+        """(action, final_score) pairs, best first."""
+        return [(ACTIONS[i], float(self.scores[i])) for i in self.ranking[:k]]
+
+    def layer_drivers(self, action: str, threshold: float = 0.0) -> list[tuple[str, float, str]]:
+        """(layer, weighted_contribution, rationale) for layers whose contribution exceeds ``threshold``."""
+        drivers = []
+        for layer in LAYERS:
+            contribution = self.formula.layer_weights[layer] * self.layer_scores[layer][action]
+            if abs(contribution) > threshold:
+                drivers.append((layer, contribution, self.layer_rationales[layer].get(action, "")))
+        return drivers
+
+    @property
+    def trace(self) -> CognitiveDecisionResult:
+        if self._trace is None:
+            self._trace = self._build_trace()
+        return self._trace
+
+    def _build_trace(self) -> CognitiveDecisionResult:
+        selected = self.selected_action
+        action_results = []
+        for rank, (action, score) in enumerate(self.top_actions(), 1):
+            contributions = []
+            for layer_name in LAYERS:
+                raw = self.layer_scores[layer_name][action]
+                w = self.formula.layer_weights[layer_name]
+                contributions.append(LayerContribution(
+                    layer=layer_name,
+                    weight=w,
+                    raw_score=raw,
+                    weighted_contribution=w * raw,
+                    rationale=self.layer_rationales[layer_name].get(action, ""),
+                ))
+            i_effects = [inter["effects"].get(action, 0.0) for inter in self.interactions]
+            action_results.append(ActionScore(
+                action=action,
+                final_score=score,
+                layer_contributions=contributions,
+                interaction_effects=i_effects,
+                rank=rank,
+            ))
+
+        interaction_results = []
+        for inter in self.interactions:
+            interaction_results.append(InteractionEffect(
+                description=inter["description"],
+                weight=inter["weight"],
+                magnitude=inter["magnitude"],
+                effect_on_selected=inter["effects"].get(selected, 0.0),
+            ))
+
+        return CognitiveDecisionResult(
+            selected_action=selected,
+            confidence=self.confidence,
+            escalation_estimate=self.escalation_estimate,
+            action_scores=action_results,
+            interaction_effects=interaction_results,
+            formula_version=self.formula.name,
+        )
+
+
+@dataclass
+class CognitiveBatchResult:
+    """Compact output of ``predict_many``; leading axes are (leaders, events)."""
+
+    scores: np.ndarray  # (L, E, A) final action scores in ACTIONS order
+    selected: np.ndarray  # (L, E) index into ACTIONS
+    confidence: np.ndarray  # (L, E)
+    escalation_estimate: np.ndarray  # (L, E)
+    formula_version: str
+
+    def selected_action(self, leader_index: int, event_index: int) -> str:
+        return ACTIONS[int(self.selected[leader_index, event_index])]
+
+
+class RedLineMatcher:
+    """A leader's red lines compiled to lowercase keyword groups with their trigger counts.
+
+    A red line is crossed when at least 40% of its words longer than three letters
+    occur in the event description as substrings.
+    """
+
+    def __init__(self, red_lines: list[str]):
+        self.groups: list[tuple[tuple[str, ...], float]] = []
+        for red_line in red_lines:
+            keywords = tuple(w.lower() for w in red_line.split() if len(w) > 3)
+            self.groups.append((keywords, len(keywords) * 0.4))
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def triggered(self, text: str) -> bool:
+        """Whether any red line reaches its trigger count in ``text``, which must already be lowercase."""
+        for keywords, threshold in self.groups:
+            if sum(1 for kw in keywords if kw in text) >= threshold:
+                return True
+        return False
+
+
+@dataclass
+class StaticLayers:
+    """Leader-only layer (scores, rationales) under one formula; identity is keyed by red_line_triggered."""
+
+    formula: CompiledFormula
+    identity: dict[bool, tuple[dict[str, float], dict[str, str]]]
+    personality: tuple[dict[str, float], dict[str, str]]
+    motivation: tuple[dict[str, float], dict[str, str]]
+
+
+@dataclass
+class LeaderFeatures:
+    """Event-independent inputs and layer scores for one leader profile version."""
+
+    fingerprint: str
+    profile: LeaderProfile
+    personality: np.ndarray  # (8,) in PERSONALITY_AXES order
+    approval: float
+    readiness: int
+    opposition: float
+    inflation: float
+    unilateral: float
+    precedent: np.ndarray  # (A,) in ACTIONS order
+    adversaries: frozenset[str]
+    red_lines: RedLineMatcher
+    motivations: dict[str, float]
+    historical_matches: dict[str, int]
+    static_layers: dict[str, StaticLayers] = field(default_factory=dict)  # keyed by formula name
+
+
+def profile_fingerprint(leader: LeaderProfile) -> str:
+    """Content hash of a leader profile; changes whenever any scored field changes."""
+    return hashlib.sha256(leader.model_dump_json().encode()).hexdigest()[:16]
 
 
 class CognitiveDecisionEngine:
-    def predict(self, leader: LeaderProfile, event: GeopoliticalEvent) -> CognitiveDecisionResult:
-        red_line_triggered = self._check_red_line(leader, event)
-        beliefs = self._infer_beliefs(leader, event)
+    def __init__(self, formulas: FormulaRegistry | None = None):
+        self.formulas = formulas or FormulaRegistry()
+        self._leader_cache: OrderedDict[UUID, LeaderFeatures] = OrderedDict()
+
+    def leader_features(self, leader: LeaderProfile) -> LeaderFeatures:
+        """Return the cached leader-static block, rebuilding it if the profile changed.
+
+        The same profile object is trusted without rehashing; callers that mutate a
+        profile in place (e.g. the context update endpoint) must call ``invalidate``.
+        """
+        cached = self._leader_cache.get(leader.id)
+        if cached is not None and cached.profile is leader:
+            self._leader_cache.move_to_end(leader.id)
+            return cached
+
+        fingerprint = profile_fingerprint(leader)
+        if cached is not None and cached.fingerprint == fingerprint:
+            cached.profile = leader
+            self._leader_cache.move_to_end(leader.id)
+            return cached
+
+        features = self._build_leader_features(leader, fingerprint)
+        self._leader_cache[leader.id] = features
+        while len(self._leader_cache) > settings.cognitive_leader_cache_size:
+            self._leader_cache.popitem(last=False)
+        return features
+
+    def invalidate(self, leader_id: UUID) -> None:
+        """Drop the cached block for a leader whose profile was replaced or edited."""
+        self._leader_cache.pop(leader_id, None)
+
+    def _build_leader_features(self, leader: LeaderProfile, fingerprint: str) -> LeaderFeatures:
+        ctx = leader.decision_context
+        readiness_level = ctx.military_posture.readiness_level
+        historical_matches = self._history_matches(leader)
         motivations = self._infer_motivations(leader)
+        return LeaderFeatures(
+            fingerprint=fingerprint,
+            profile=leader,
+            personality=np.array([getattr(leader.personality, axis) for axis in PERSONALITY_AXES], dtype=float),
+            approval=ctx.approval_rating,
+            readiness=READINESS_LEVELS.index(readiness_level) if readiness_level in READINESS_BONUS else -1,
+            opposition=ctx.domestic_pressures.opposition_strength,
+            inflation=ctx.economic_conditions.inflation,
+            unilateral=float(leader.cultural_context.decision_making_style == "unilateral"),
+            precedent=np.array([historical_matches[a] > 0 for a in ACTIONS], dtype=float),
+            adversaries=frozenset(a.lower() for a in leader.ideology.adversaries),
+            red_lines=RedLineMatcher(leader.ideology.red_lines),
+            motivations=motivations,
+            historical_matches=historical_matches,
+        )
+
+    def _static_layers(self, features: LeaderFeatures, formula: CompiledFormula) -> StaticLayers:
+        """Leader-only layers for a formula, scored on first use and kept with the features."""
+        layers = features.static_layers.get(formula.name)
+        if layers is None or layers.formula is not formula:
+            leader = features.profile
+            layers = StaticLayers(
+                formula=formula,
+                identity={rl: self._score_identity(leader, rl, formula) for rl in (False, True)},
+                personality=self._score_personality(leader, formula),
+                motivation=self._score_motivation(features.motivations, formula),
+            )
+            features.static_layers[formula.name] = layers
+        return layers
+
+    def predict(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        formula_version: str | None = None,
+    ) -> CognitiveDecisionResult:
+        """Full explainable decision trace for one leader/event pair."""
+        return self.predict_compact(leader, event, formula_version).trace
+
+    def predict_compact(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        formula_version: str | None = None,
+    ) -> "CognitivePrediction":
+        """Scores, selection, confidence and escalation; the trace is built only if ``.trace`` is read."""
+        formula = self.formulas.get(formula_version)
+        features = self.leader_features(leader)
+        static = self._static_layers(features, formula)
+        red_line_triggered = self._check_red_line(features.red_lines, event)
+        beliefs = self._infer_beliefs(leader, event, features.adversaries)
+        motivations = features.motivations
 
         layer_scores: dict[str, dict[str, float]] = {}
         layer_rationales: dict[str, dict[str, str]] = {}
 
-        layer_scores["identity"], layer_rationales["identity"] = self._score_identity(leader, red_line_triggered)
-        layer_scores["personality"], layer_rationales["personality"] = self._score_personality(leader)
-        layer_scores["belief"], layer_rationales["belief"] = self._score_belief(beliefs)
-        layer_scores["motivation"], layer_rationales["motivation"] = self._score_motivation(motivations)
-        layer_scores["context"], layer_rationales["context"] = self._score_context(leader, event, red_line_triggered)
-        layer_scores["history"], layer_rationales["history"] = self._score_history(leader, beliefs)
+        layer_scores["identity"], layer_rationales["identity"] = static.identity[red_line_triggered]
+        layer_scores["personality"], layer_rationales["personality"] = static.personality
+        layer_scores["belief"], layer_rationales["belief"] = self._score_belief(beliefs, formula)
+        layer_scores["motivation"], layer_rationales["motivation"] = static.motivation
+        layer_scores["context"], layer_rationales["context"] = self._score_context(leader, event, red_line_triggered, formula)
+        layer_scores["history"], layer_rationales["history"] = self._score_history(features.historical_matches, beliefs)
+
+        interactions = self._compute_interactions(leader, beliefs, motivations, red_line_triggered, formula)
+        return self._finish(formula, event, layer_scores, layer_rationales, interactions, red_line_triggered, beliefs, motivations)
+
+    def predict_incremental(
+        self,
+        base: "CognitivePrediction",
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        stages: set[str],
+    ) -> "CognitivePrediction":
+        """Re-run only ``stages`` for an edited leader/event, reusing everything else from ``base``.
+
+        Stages are layer names plus "red_line", "interactions" and the inferred
+        "beliefs"/"motivations"; callers decide which an edit touches. The leader
+        cache is not consulted, so edited copies never displace the stored profile.
+        """
+        formula = base.formula
+        if "red_line" in stages:
+            red_line_triggered = self._check_red_line(RedLineMatcher(leader.ideology.red_lines), event)
+        else:
+            red_line_triggered = base.red_line_triggered
+        beliefs = self._infer_beliefs(leader, event) if "beliefs" in stages else base.beliefs
+        motivations = self._infer_motivations(leader) if "motivations" in stages else base.motivations
+
+        layer_scores = dict(base.layer_scores)
+        layer_rationales = dict(base.layer_rationales)
+        scorers = {
+            "identity": lambda: self._score_identity(leader, red_line_triggered, formula),
+            "personality": lambda: self._score_personality(leader, formula),
+            "belief": lambda: self._score_belief(beliefs, formula),
+            "motivation": lambda: self._score_motivation(motivations, formula),
+            "context": lambda: self._score_context(leader, event, red_line_triggered, formula),
+            "history": lambda: self._score_history(self._history_matches(leader), beliefs),
+        }
+        for layer in LAYERS:
+            if layer in stages:
+                layer_scores[layer], layer_rationales[layer] = scorers[layer]()
 
-        interactions = self._compute_interactions(leader, beliefs, motivations, red_line_triggered)
+        interactions = base.interactions
+        if "interactions" in stages:
+            interactions = self._compute_interactions(leader, beliefs, motivations, red_line_triggered, formula)
+        return self._finish(formula, event, layer_scores, layer_rationales, interactions, red_line_triggered, beliefs, motivations)
 
+    def _finish(
+        self,
+        formula: CompiledFormula,
+        event: GeopoliticalEvent,
+        layer_scores: dict[str, dict[str, float]],
+        layer_rationales: dict[str, dict[str, str]],
+        interactions: list[dict],
+        red_line_triggered: bool,
+        beliefs: dict[str, float],
+        motivations: dict[str, float],
+    ) -> "CognitivePrediction":
+        """Combine layer scores and interactions into the ranked, compact prediction."""
         final_scores: dict[str, float] = {action: 0.0 for action in ACTIONS}
         for layer_name, scores in layer_scores.items():
-            weight = LAYER_WEIGHTS[layer_name]
+            weight = formula.layer_weights[layer_name]
             for action in ACTIONS:
                 final_scores[action] += weight * scores[action]
         for interaction in interactions:
@@ -75,7 +406,6 @@ class CognitiveDecisionEngine:
                 final_scores[action] += interaction["effects"].get(action, 0.0)
 
         sorted_actions = sorted(final_scores.items(), key=lambda x: x[1], reverse=True)
-        selected = sorted_actions[0][0]
         top_score = sorted_actions[0][1]
         runner_up = sorted_actions[1][1] if len(sorted_actions) > 1 else 0.0
         confidence = min(1.0, max(0.0, (top_score - runner_up) / max(0.01, abs(top_score))))
@@ -87,79 +417,312 @@ class CognitiveDecisionEngine:
         shifted = [(a, s - min_score + 0.01) for a, s in sorted_actions]
         total_weight = sum(s for _, s in shifted)
         weighted_escalation = sum(
-            (s / total_weight) * ACTION_AFFORDANCES[a]["escalation"]
+            (s / total_weight) * formula.affordances[a]["escalation"]
             for a, s in shifted
         )
         # Map from [-1, +1] affordance range to [0, 1] escalation, scaled by event severity
         escalation_estimate = max(0.0, min(1.0, (weighted_escalation + 1.0) / 2.0 * event.severity + event.severity * 0.2))
 
-        action_results = []
-        for rank, (action, score) in enumerate(sorted_actions, 1):
-            contributions = []
-            for layer_name in LAYER_WEIGHTS:
-                raw = layer_scores[layer_name][action]
-                w = LAYER_WEIGHTS[layer_name]
-                contributions.append(LayerContribution(
-                    layer=layer_name,
-                    weight=w,
-                    raw_score=raw,
-                    weighted_contribution=w * raw,
-                    rationale=layer_rationales[layer_name].get(action, ""),
-                ))
-            i_effects = [inter["effects"].get(action, 0.0) for inter in interactions]
-            action_results.append(ActionScore(
-                action=action,
-                final_score=score,
-                layer_contributions=contributions,
-                interaction_effects=i_effects,
-                rank=rank,
-            ))
-
-        interaction_results = []
-        for inter in interactions:
-            interaction_results.append(InteractionEffect(
-                description=inter["description"],
-                weight=inter["weight"],
-                magnitude=inter["magnitude"],
-                effect_on_selected=inter["effects"].get(selected, 0.0),
-            ))
-
-        return CognitiveDecisionResult(
-            selected_action=selected,
+        ranking = np.array([ACTIONS.index(a) for a, _ in sorted_actions])
+        return CognitivePrediction(
+            scores=np.array([final_scores[a] for a in ACTIONS]),
+            ranking=ranking,
             confidence=confidence,
             escalation_estimate=escalation_estimate,
-            action_scores=action_results,
-            interaction_effects=interaction_results,
+            formula=formula,
+            layer_scores=layer_scores,
+            layer_rationales=layer_rationales,
+            interactions=interactions,
+            red_line_triggered=red_line_triggered,
+            beliefs=beliefs,
+            motivations=motivations,
+        )
+
+    def predict_many(
+        self,
+        leaders: list[LeaderProfile],
+        events: list[GeopoliticalEvent],
+        formula_version: str | None = None,
+    ) -> CognitiveBatchResult:
+        """Score every leader against every event in one vectorized pass.
+
+        Produces the same final scores, selection, confidence and escalation
+        estimate as calling ``predict`` for each pair, without the decision trace.
+        """
+        n_leaders, n_events = len(leaders), len(events)
+        leader_index = np.repeat(np.arange(n_leaders), n_events)
+        event_index = np.tile(np.arange(n_events), n_leaders)
+        formula = self.formulas.get(formula_version)
+        inputs = self.build_inputs(leaders, events, leader_index, event_index)
+        final, selected, confidence, escalation = self.evaluate(inputs, formula)
+        return CognitiveBatchResult(
+            scores=final.reshape(n_leaders, n_events, len(ACTIONS)),
+            selected=selected.reshape(n_leaders, n_events),
+            confidence=confidence.reshape(n_leaders, n_events),
+            escalation_estimate=escalation.reshape(n_leaders, n_events),
+            formula_version=formula.name,
+        )
+
+    def layer_rationale(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        layer: str,
+        action: str,
+        red_line_triggered: bool,
+        formula: CompiledFormula,
+    ) -> str:
+        """Rationale one layer gives one action, for callers that scored the pair in a batch."""
+        features = self.leader_features(leader)
+        if layer in ("identity", "personality", "motivation"):
+            static = self._static_layers(features, formula)
+            _, rationales = static.identity[red_line_triggered] if layer == "identity" else getattr(static, layer)
+        elif layer == "context":
+            _, rationales = self._score_context(leader, event, red_line_triggered, formula)
+        else:
+            beliefs = self._infer_beliefs(leader, event, features.adversaries)
+            if layer == "belief":
+                _, rationales = self._score_belief(beliefs, formula)
+            else:
+                _, rationales = self._score_history(features.historical_matches, beliefs)
+        return rationales.get(action, "")
+
+    def build_inputs(
+        self,
+        leaders: list[LeaderProfile],
+        events: list[GeopoliticalEvent],
+        leader_index: np.ndarray,
+        event_index: np.ndarray,
+    ) -> CognitiveInputs:
+        """Pack the (leaders[leader_index[i]], events[event_index[i]]) pairs into arrays."""
+        features = [self.leader_features(l) for l in leaders]
+        personality = np.array([f.personality for f in features], dtype=float).reshape(len(leaders), len(PERSONALITY_AXES))
+        approval = np.array([f.approval for f in features], dtype=float)
+        readiness = np.array([f.readiness for f in features], dtype=int)
+        opposition = np.array([f.opposition for f in features], dtype=float)
+        inflation = np.array([f.inflation for f in features], dtype=float)
+        unilateral = np.array([f.unilateral for f in features], dtype=float)
+        precedent = np.array([f.precedent for f in features], dtype=float).reshape(len(leaders), len(ACTIONS))
+
+        severity = np.array([e.severity for e in events], dtype=float)
+        irreversible = np.array([e.structured.reversibility == "irreversible" for e in events])
+        actors = [e.structured.actor.lower() for e in events]
+        descriptions = [e.description.lower() for e in events]
+
+        red_line = np.array(
+            [
+                self._check_red_line(features[i].red_lines, events[j], descriptions[j])
+                for i, j in zip(leader_index, event_index)
+            ],
+            dtype=float,
+        )
+        is_adversary = np.array(
+            [actors[j] in features[i].adversaries for i, j in zip(leader_index, event_index)], dtype=bool,
+        )
+
+        pair_severity = severity[event_index]
+        pair_irreversible = irreversible[event_index]
+        pair_readiness = readiness[leader_index]
+        pair_approval = approval[leader_index]
+
+        hostile_intent = np.where(
+            is_adversary,
+            np.minimum(1.0, 0.6 + pair_severity * 0.3),
+            np.where(pair_irreversible, np.minimum(1.0, 0.4 + pair_severity * 0.4), 0.5),
+        )
+        diplomatic_viable = np.where(pair_irreversible, 0.2, np.where(pair_severity < 0.4, 0.7, 0.5))
+        escalation_controllable = np.where(pair_severity > 0.8, 0.3, np.where(pair_severity < 0.4, 0.7, 0.5))
+        beliefs = np.stack([
+            hostile_intent,
+            _READINESS_EFFECTIVENESS[pair_readiness],
+            diplomatic_viable,
+            pair_approval / 100.0,
+            escalation_controllable,
+        ], axis=1)
+
+        return CognitiveInputs(
+            personality=personality[leader_index],
+            beliefs=beliefs,
+            approval=pair_approval,
+            readiness=pair_readiness,
+            opposition=opposition[leader_index],
+            inflation=inflation[leader_index],
+            unilateral=unilateral[leader_index],
+            precedent=precedent[leader_index],
+            red_line=red_line,
+            severity=pair_severity,
         )
 
-    def _check_red_line(self, leader: LeaderProfile, event: GeopoliticalEvent) -> bool:
-        if not leader.ideology.red_lines:
+    def evaluate(
+        self,
+        inputs: CognitiveInputs,
+        formula: CompiledFormula | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (final_scores, selected, confidence, escalation_estimate) for packed inputs."""
+        formula = formula or self.formulas.get()
+        final = self.combine(self.layer_scores(inputs, formula), self.interaction_magnitudes(inputs, formula), formula)
+        selected, confidence, escalation = self.summarize(final, inputs.severity, formula)
+        return final, selected, confidence, escalation
+
+    def layer_scores(
+        self,
+        x: CognitiveInputs,
+        formula: CompiledFormula,
+        layers: Sequence[str] = LAYERS,
+    ) -> np.ndarray:
+        """Raw per-layer scores, shape (N, len(layers), len(ACTIONS)); ``layers`` picks a subset."""
+        p = x.personality
+        hostile, mil_effective, diplo_viable, domestic_support, controllable = x.beliefs.T
+        red_line = x.red_line[:, None]
+        escalation = formula.escalation
+        positive_escalation = np.maximum(0.0, escalation)
+
+        def identity() -> np.ndarray:
+            return (
+                formula.role_bias_vector
+                + x.unilateral[:, None] * formula.unilateral_vector
+                + 0.2 * red_line * np.maximum(0.0, escalation + 0.5)
+            )
+
+        def personality() -> np.ndarray:
+            return p[:, _PERSONALITY_AXIS_INDEX] @ formula.personality_affordances / 4.0
+
+        def belief() -> np.ndarray:
+            return (
+                (hostile - 0.5)[:, None] * 2 * np.maximum(0.0, escalation + 0.3)
+                + _MILITARY_MASK * ((mil_effective - 0.5) * 1.5)[:, None]
+                + _DIPLOMATIC_MASK * ((diplo_viable - 0.3) * 2.0)[:, None]
+                + (domestic_support - 0.5)[:, None] * formula.visibility
+                - (escalation > 0.5) * (1.0 - controllable)[:, None] * escalation
+            ) / 2.5
+
+        def motivation() -> np.ndarray:
+            motivations = np.clip(self._motivation_array(p)[:, formula.alignment_index], -1.0, 1.0)
+            return motivations @ formula.motivation_matrix / max(len(formula.alignment_dims), 1)
+
+        def context() -> np.ndarray:
+            inflation_penalty = np.where(x.inflation > 5, (x.inflation / 20.0) * 0.3, 0.0)
+            return (
+                ((x.approval - 50) / 50)[:, None] * positive_escalation * 0.5
+                + red_line * np.where(escalation < 0, -0.4, 0.3)
+                + _MILITARY_MASK * _READINESS_BONUS[x.readiness][:, None]
+                + (1.0 - x.opposition)[:, None] * positive_escalation * 0.2
+                - _CONFRONTATION_MASK * inflation_penalty[:, None]
+            )
+
+        def history() -> np.ndarray:
+            return (
+                np.where(x.precedent > 0, 0.5, -0.15)
+                - _DIPLOMATIC_MASK * (hostile > 0.8)[:, None] * 0.3
+            )
+
+        scorers = {
+            "identity": identity,
+            "personality": personality,
+            "belief": belief,
+            "motivation": motivation,
+            "context": context,
+            "history": history,
+        }
+        return np.clip(np.stack([scorers[name]() for name in layers], axis=1), -1.0, 1.0)
+
+    def interaction_magnitudes(self, x: CognitiveInputs, formula: CompiledFormula) -> np.ndarray:
+        """Products of the formula's interaction operands, shape (N, len(formula.interaction_terms))."""
+        columns = {
+            "personality": lambda key: x.personality[:, PERSONALITY_AXES.index(key)],
+            "belief": lambda key: x.beliefs[:, BELIEF_KEYS.index(key)],
+            "motivation": lambda key: self._motivation_array(x.personality)[:, MOTIVATION_DIMS.index(key)],
+            "context": lambda key: {
+                "red_line_triggered": x.red_line,
+                "approval_rating": x.approval / 100.0,
+                "opposition_strength": x.opposition,
+            }[key],
+        }
+        magnitudes = np.empty((len(x), len(formula.interaction_terms)))
+        for k, term in enumerate(formula.interaction_terms):
+            (family_a, key_a), (family_b, key_b) = term.operands
+            magnitudes[:, k] = columns[family_a](key_a) * columns[family_b](key_b)
+        return magnitudes
+
+    def combine(self, layer_scores: np.ndarray, magnitudes: np.ndarray, formula: CompiledFormula) -> np.ndarray:
+        """Weighted layer sum plus interaction effects, shape (N, len(ACTIONS))."""
+        weighted = np.einsum("nla,l->na", layer_scores, formula.layer_weight_vector)
+        return weighted + magnitudes @ (formula.interaction_weights[:, None] * formula.interaction_profile)
+
+    def summarize(
+        self,
+        final: np.ndarray,
+        severity: np.ndarray,
+        formula: CompiledFormula,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Selected action index, confidence and escalation estimate per row."""
+        order = np.argsort(-final, axis=1, kind="stable")
+        selected = order[:, 0]
+        top = np.take_along_axis(final, order[:, :1], axis=1)[:, 0]
+        runner_up = np.take_along_axis(final, order[:, 1:2], axis=1)[:, 0]
+        confidence = np.clip((top - runner_up) / np.maximum(0.01, np.abs(top)), 0.0, 1.0)
+
+        shifted = final - final.min(axis=1, keepdims=True) + 0.01
+        weighted_escalation = (shifted / shifted.sum(axis=1, keepdims=True)) @ formula.escalation
+        escalation = np.clip((weighted_escalation + 1.0) / 2.0 * severity + severity * 0.2, 0.0, 1.0)
+        return selected, confidence, escalation
+
+    @staticmethod
+    def _motivation_array(p: np.ndarray) -> np.ndarray:
+        """Vectorized ``_infer_motivations`` over personality rows, columns in MOTIVATION_DIMS order."""
+        axis = {name: p[:, i] for i, name in enumerate(PERSONALITY_AXES)}
+        dims = {
+            "power": (axis["authoritarianism"] + axis["aggression"]) / 2.0,
+            "independence": axis["nationalism"],
+            "honor": (axis["nationalism"] + axis["aggression"]) / 2.0,
+            "status": (axis["populism"] + axis["authoritarianism"]) / 2.0,
+            "tranquility": -axis["risk_tolerance"],
+            "order": (axis["authoritarianism"] + axis["pragmatism"]) / 2.0,
+            "vengeance": axis["aggression"] * 0.7,
+        }
+        return np.stack([dims[d] for d in MOTIVATION_DIMS], axis=1)
+
+    def _history_matches(self, leader: LeaderProfile) -> dict[str, int]:
+        historical_matches: dict[str, int] = {a: 0 for a in ACTIONS}
+        for decision in leader.decision_history:
+            text = f"{decision.decision_taken} {decision.outcome}".lower()
+            for action, keywords in HISTORY_KEYWORDS.items():
+                if any(kw in text for kw in keywords):
+                    historical_matches[action] += 1
+        return historical_matches
+
+    def _check_red_line(
+        self,
+        red_lines: RedLineMatcher,
+        event: GeopoliticalEvent,
+        description: str | None = None,
+    ) -> bool:
+        """``description`` is the lowercased event description when the caller already has it."""
+        if not red_lines:
             return False
-        desc_lower = event.description.lower()
-        for red_line in leader.ideology.red_lines:
-            keywords = [w.lower() for w in red_line.split() if len(w) > 3]
-            if sum(1 for kw in keywords if kw in desc_lower) >= len(keywords) * 0.4:
-                return True
+        if red_lines.triggered(description if description is not None else event.description.lower()):
+            return True
         if event.severity >= 0.8 and event.structured.reversibility in ("irreversible", "escalatory"):
             return True
         return False
 
-    def _infer_beliefs(self, leader: LeaderProfile, event: GeopoliticalEvent) -> dict[str, float]:
-        actor_is_adversary = event.structured.actor.lower() in [a.lower() for a in leader.ideology.adversaries]
+    def _infer_beliefs(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        adversaries: frozenset[str] | None = None,
+    ) -> dict[str, float]:
+        if adversaries is None:
+            adversaries = frozenset(a.lower() for a in leader.ideology.adversaries)
+        actor_is_adversary = event.structured.actor.lower() in adversaries
         hostile_intent = 0.5
         if actor_is_adversary:
             hostile_intent = min(1.0, 0.6 + event.severity * 0.3)
         elif event.structured.reversibility == "irreversible":
             hostile_intent = min(1.0, 0.4 + event.severity * 0.4)
 
-        military_effective = 0.5
         readiness = leader.decision_context.military_posture.readiness_level
-        if readiness == "mobilized":
-            military_effective = 0.75
-        elif readiness == "elevated":
-            military_effective = 0.6
-        elif readiness == "peacetime":
-            military_effective = 0.35
+        military_effective = READINESS_EFFECTIVENESS.get(readiness, 0.5)
 
         diplomatic_viable = 0.5
         if event.structured.reversibility == "irreversible":
@@ -194,26 +757,24 @@ class CognitiveDecisionEngine:
             "vengeance": p.aggression * 0.7,
         }
 
-    def _score_identity(self, leader: LeaderProfile, red_line_triggered: bool) -> tuple[dict[str, float], dict[str, str]]:
+    def _score_identity(
+        self,
+        leader: LeaderProfile,
+        red_line_triggered: bool,
+        formula: CompiledFormula,
+    ) -> tuple[dict[str, float], dict[str, str]]:
         style = leader.cultural_context.decision_making_style
         scores = {}
         rationales = {}
-        role_bias = {
-            "diplomatic_protest": 0.4,
-            "economic_retaliation": 0.3,
-            "military_posturing": 0.2,
-            "hybrid_pressure": -0.1,
-            "direct_confrontation": -0.4,
-        }
+        role_bias = dict(formula.role_bias)
         if style == "unilateral":
-            role_bias["direct_confrontation"] += 0.3
-            role_bias["military_posturing"] += 0.2
-            role_bias["diplomatic_protest"] -= 0.2
+            for action, shift in formula.unilateral_shift.items():
+                role_bias[action] += shift
 
         red_line_boost = 0.2 if red_line_triggered else 0.0
         for action in ACTIONS:
             base = role_bias.get(action, 0.0)
-            escalation = ACTION_AFFORDANCES[action]["escalation"]
+            escalation = formula.affordances[action]["escalation"]
             boost = red_line_boost * max(0, escalation + 0.5)
             scores[action] = max(-1.0, min(1.0, base + boost))
             parts = [f"style={style}"]
@@ -222,7 +783,7 @@ class CognitiveDecisionEngine:
             rationales[action] = "; ".join(parts)
         return scores, rationales
 
-    def _score_personality(self, leader: LeaderProfile) -> tuple[dict[str, float], dict[str, str]]:
+    def _score_personality(self, leader: LeaderProfile, formula: CompiledFormula) -> tuple[dict[str, float], dict[str, str]]:
         p = leader.personality
         axis_mapping = {
             "risk_tolerance": ("risk", p.risk_tolerance),
@@ -237,7 +798,7 @@ class CognitiveDecisionEngine:
             count = 0
             drivers = []
             for axis, (affordance_key, val) in axis_mapping.items():
-                action_val = ACTION_AFFORDANCES[action][affordance_key]
+                action_val = formula.affordances[action][affordance_key]
                 if axis == "pragmatism":
                     contrib = val * (-action_val)
                 else:
@@ -250,20 +811,20 @@ class CognitiveDecisionEngine:
             rationales[action] = ", ".join(drivers) if drivers else "weak signal"
         return scores, rationales
 
-    def _score_belief(self, beliefs: dict[str, float]) -> tuple[dict[str, float], dict[str, str]]:
+    def _score_belief(self, beliefs: dict[str, float], formula: CompiledFormula) -> tuple[dict[str, float], dict[str, str]]:
         scores = {}
         rationales = {}
         for action in ACTIONS:
             s = 0.0
             drivers = []
-            escalation = ACTION_AFFORDANCES[action]["escalation"]
+            escalation = formula.affordances[action]["escalation"]
 
             hostile_contrib = (beliefs["hostile_intent"] - 0.5) * 2 * max(0, escalation + 0.3)
             s += hostile_contrib
             if abs(hostile_contrib) > 0.1:
                 drivers.append(f"hostile_intent={beliefs['hostile_intent']:.2f}")
 
-            if action in ("military_posturing", "direct_confrontation"):
+            if action in MILITARY_ACTIONS:
                 mil_contrib = (beliefs["military_effective"] - 0.5) * 1.5
                 s += mil_contrib
                 if abs(mil_contrib) > 0.1:
@@ -275,7 +836,7 @@ class CognitiveDecisionEngine:
                 if abs(dip_contrib) > 0.1:
                     drivers.append(f"diplo_viable={beliefs['diplomatic_viable']:.2f}")
 
-            visibility = ACTION_AFFORDANCES[action]["visibility"]
+            visibility = formula.affordances[action]["visibility"]
             support_contrib = (beliefs["domestic_support"] - 0.5) * visibility
             s += support_contrib
 
@@ -290,18 +851,11 @@ class CognitiveDecisionEngine:
             rationales[action] = ", ".join(drivers) if drivers else "neutral beliefs"
         return scores, rationales
 
-    def _score_motivation(self, motivations: dict[str, float]) -> tuple[dict[str, float], dict[str, str]]:
-        motivation_alignment = {
-            "diplomatic_protest":   {"power": -0.3, "independence": 0.0, "honor": 0.2, "status": 0.1, "tranquility": 0.6, "vengeance": -0.5},
-            "economic_retaliation": {"power": 0.3,  "independence": 0.7, "honor": 0.4, "status": 0.3, "tranquility": 0.1, "vengeance": 0.4},
-            "military_posturing":   {"power": 0.7,  "independence": 0.6, "honor": 0.7, "status": 0.8, "tranquility": -0.4, "vengeance": 0.3},
-            "hybrid_pressure":      {"power": 0.5,  "independence": 0.4, "honor": -0.2, "status": 0.1, "tranquility": -0.1, "vengeance": 0.6},
-            "direct_confrontation": {"power": 0.9,  "independence": 0.8, "honor": 0.5, "status": 0.9, "tranquility": -0.9, "vengeance": 0.8},
-        }
+    def _score_motivation(self, motivations: dict[str, float], formula: CompiledFormula) -> tuple[dict[str, float], dict[str, str]]:
         scores = {}
         rationales = {}
         for action in ACTIONS:
-            alignment = motivation_alignment[action]
+            alignment = formula.motivation_alignment[action]
             total = 0.0
             count = 0
             drivers = []
@@ -317,14 +871,20 @@ class CognitiveDecisionEngine:
             rationales[action] = ", ".join(drivers) if drivers else "weak motivational signal"
         return scores, rationales
 
-    def _score_context(self, leader: LeaderProfile, event: GeopoliticalEvent, red_line_triggered: bool) -> tuple[dict[str, float], dict[str, str]]:
+    def _score_context(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        red_line_triggered: bool,
+        formula: CompiledFormula,
+    ) -> tuple[dict[str, float], dict[str, str]]:
         ctx = leader.decision_context
         scores = {}
         rationales = {}
         for action in ACTIONS:
             s = 0.0
             drivers = []
-            escalation = ACTION_AFFORDANCES[action]["escalation"]
+            escalation = formula.affordances[action]["escalation"]
 
             approval_factor = (ctx.approval_rating - 50) / 50
             approval_contrib = approval_factor * max(0, escalation) * 0.5
@@ -340,9 +900,8 @@ class CognitiveDecisionEngine:
                     s += 0.3
                     drivers.append("red_line_demands_strength")
 
-            readiness_map = {"peacetime": -0.3, "elevated": 0.2, "mobilized": 0.5}
-            if action in ("military_posturing", "direct_confrontation"):
-                readiness_bonus = readiness_map.get(ctx.military_posture.readiness_level, 0.0)
+            if action in MILITARY_ACTIONS:
+                readiness_bonus = READINESS_BONUS.get(ctx.military_posture.readiness_level, 0.0)
                 s += readiness_bonus
                 if abs(readiness_bonus) > 0.1:
                     drivers.append(f"readiness={ctx.military_posture.readiness_level}")
@@ -360,21 +919,7 @@ class CognitiveDecisionEngine:
             rationales[action] = ", ".join(drivers) if drivers else "neutral context"
         return scores, rationales
 
-    def _score_history(self, leader: LeaderProfile, beliefs: dict[str, float]) -> tuple[dict[str, float], dict[str, str]]:
-        action_keywords = {
-            "diplomatic_protest": ["diplomatic", "protest", "negotiate", "negotiate"],
-            "economic_retaliation": ["economic", "sanction", "trade", "retaliation"],
-            "military_posturing": ["military", "deploy", "exercise", "postur", "pressure"],
-            "hybrid_pressure": ["cyber", "hybrid", "proxy", "information", "covert"],
-            "direct_confrontation": ["invad", "attack", "war", "confront", "blockade", "ultimatum"],
-        }
-        historical_matches: dict[str, int] = {a: 0 for a in ACTIONS}
-        for decision in leader.decision_history:
-            text = f"{decision.decision_taken} {decision.outcome}".lower()
-            for action, keywords in action_keywords.items():
-                if any(kw in text for kw in keywords):
-                    historical_matches[action] += 1
-
+    def _score_history(self, historical_matches: dict[str, int], beliefs: dict[str, float]) -> tuple[dict[str, float], dict[str, str]]:
         scores = {}
         rationales = {}
         for action in ACTIONS:
@@ -402,26 +947,30 @@ class CognitiveDecisionEngine:
         beliefs: dict[str, float],
         motivations: dict[str, float],
         red_line_triggered: bool,
+        formula: CompiledFormula,
     ) -> list[dict]:
+        operands = {
+            "personality": lambda key: getattr(leader.personality, key),
+            "belief": lambda key: beliefs[key],
+            "motivation": lambda key: motivations.get(key, 0.0),
+            "context": lambda key: {
+                "red_line_triggered": 1.0 if red_line_triggered else 0.0,
+                "approval_rating": leader.decision_context.approval_rating / 100.0,
+                "opposition_strength": leader.decision_context.domestic_pressures.opposition_strength,
+            }[key],
+        }
+
         results = []
-        interaction_values = [
-            ("personality.aggression × belief.hostile_intent", 0.08,
-             leader.personality.aggression, beliefs["hostile_intent"]),
-            ("personality.nationalism × context.red_line_triggered", 0.10,
-             leader.personality.nationalism, 1.0 if red_line_triggered else 0.0),
-            ("motivation.power × context.approval_rating", 0.05,
-             motivations.get("power", 0.0), leader.decision_context.approval_rating / 100.0),
-        ]
-
-        for description, weight, val_a, val_b in interaction_values:
-            magnitude = val_a * val_b
+        for term in formula.interaction_terms:
+            (family_a, key_a), (family_b, key_b) = term.operands
+            magnitude = operands[family_a](key_a) * operands[family_b](key_b)
             effects = {}
             for action in ACTIONS:
-                escalation = ACTION_AFFORDANCES[action]["escalation"]
-                effects[action] = magnitude * max(0, escalation + 0.3) * weight
+                escalation = formula.affordances[action]["escalation"]
+                effects[action] = magnitude * max(0, escalation + 0.3) * term.weight
             results.append({
-                "description": description,
-                "weight": weight,
+                "description": term.description,
+                "weight": term.weight,
                 "magnitude": magnitude,
                 "effects": effects,
             })
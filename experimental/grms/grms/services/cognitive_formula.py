@@ -0,0 +1,273 @@
+"""Declarative formulas for the cognitive decision engine.
+
+A formula names the layer weights, interaction terms and affordance tables the
+engine combines. Specs are loaded from JSON/YAML files or posted to the API and
+compiled once into the array tables the evaluator multiplies against, so several
+formula versions can stay resident and be selected per request.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from grms.models.cognitive import CognitiveFormulaSpec
+from grms.models.leader import LeaderPersonality
+
+logger = logging.getLogger("grms.cognitive_formula")
+
+FORMULAS_DIR = Path(__file__).parent.parent / "data" / "formulas"
+
+ACTIONS = [
+    "diplomatic_protest",
+    "economic_retaliation",
+    "military_posturing",
+    "hybrid_pressure",
+    "direct_confrontation",
+]
+
+ACTION_AFFORDANCES = {
+    "diplomatic_protest":   {"escalation": -0.8, "strength": -0.5, "sovereignty": 0.2, "risk": -0.9, "visibility": 0.3},
+    "economic_retaliation": {"escalation": -0.2, "strength":  0.3, "sovereignty": 0.6, "risk": -0.3, "visibility": 0.5},
+    "military_posturing":   {"escalation":  0.4, "strength":  0.7, "sovereignty": 0.8, "risk":  0.3, "visibility": 0.8},
+    "hybrid_pressure":      {"escalation":  0.3, "strength":  0.5, "sovereignty": 0.5, "risk":  0.1, "visibility": -0.3},
+    "direct_confrontation": {"escalation":  0.9, "strength":  1.0, "sovereignty": 1.0, "risk":  0.9, "visibility": 1.0},
+}
+
+LAYER_WEIGHTS = {
+    "identity":    0.10,
+    "personality": 0.25,
+    "belief":      0.25,
+    "motivation":  0.15,
+    "context":     0.15,
+    "history":     0.10,
+}
+
+INTERACTION_TERMS = [
+    {"layers": ["personality.aggression", "belief.hostile_intent"], "weight": 0.08},
+    {"layers": ["personality.nationalism", "context.red_line_triggered"], "weight": 0.10},
+    {"layers": ["motivation.power", "context.approval_rating"], "weight": 0.05},
+]
+
+ROLE_BIAS = {
+    "diplomatic_protest": 0.4,
+    "economic_retaliation": 0.3,
+    "military_posturing": 0.2,
+    "hybrid_pressure": -0.1,
+    "direct_confrontation": -0.4,
+}
+
+UNILATERAL_ROLE_SHIFT = {
+    "direct_confrontation": 0.3,
+    "military_posturing": 0.2,
+    "diplomatic_protest": -0.2,
+}
+
+MOTIVATION_ALIGNMENT = {
+    "diplomatic_protest":   {"power": -0.3, "independence": 0.0, "honor": 0.2, "status": 0.1, "tranquility": 0.6, "vengeance": -0.5},
+    "economic_retaliation": {"power": 0.3,  "independence": 0.7, "honor": 0.4, "status": 0.3, "tranquility": 0.1, "vengeance": 0.4},
+    "military_posturing":   {"power": 0.7,  "independence": 0.6, "honor": 0.7, "status": 0.8, "tranquility": -0.4, "vengeance": 0.3},
+    "hybrid_pressure":      {"power": 0.5,  "independence": 0.4, "honor": -0.2, "status": 0.1, "tranquility": -0.1, "vengeance": 0.6},
+    "direct_confrontation": {"power": 0.9,  "independence": 0.8, "honor": 0.5, "status": 0.9, "tranquility": -0.9, "vengeance": 0.8},
+}
+
+DEFAULT_FORMULA_VERSION = "geopolitical_red_line_response_v1"
+
+DEFAULT_FORMULA_SPEC = {
+    "name": DEFAULT_FORMULA_VERSION,
+    "description": "Leader response when a declared red line is crossed by an adversary",
+    "layers": {layer: {"weight": w} for layer, w in LAYER_WEIGHTS.items()},
+    "combination": "linear",
+    "interaction_terms": [{**term, "method": "multiply"} for term in INTERACTION_TERMS],
+}
+
+LAYERS = list(LAYER_WEIGHTS)
+PERSONALITY_AXES = list(LeaderPersonality.model_fields)
+BELIEF_KEYS = [
+    "hostile_intent",
+    "military_effective",
+    "diplomatic_viable",
+    "domestic_support",
+    "escalation_controllable",
+]
+MOTIVATION_DIMS = ["power", "independence", "honor", "status", "tranquility", "order", "vengeance"]
+AFFORDANCE_KEYS = ["escalation", "strength", "sovereignty", "risk", "visibility"]
+
+INTERACTION_OPERANDS = {
+    "personality": set(PERSONALITY_AXES),
+    "belief": set(BELIEF_KEYS),
+    "motivation": set(MOTIVATION_DIMS),
+    "context": {"red_line_triggered", "approval_rating", "opposition_strength"},
+}
+
+
+@dataclass(frozen=True)
+class InteractionTerm:
+    description: str
+    weight: float
+    operands: tuple[tuple[str, str], tuple[str, str]]  # (family, key) pairs
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledFormula:
+    """A formula spec resolved into lookup tables and ACTIONS-ordered arrays."""
+
+    name: str
+    description: str
+    spec: CognitiveFormulaSpec
+    layer_weights: dict[str, float]
+    interaction_terms: tuple[InteractionTerm, ...]
+    affordances: dict[str, dict[str, float]]
+    role_bias: dict[str, float]
+    unilateral_shift: dict[str, float]
+    motivation_alignment: dict[str, dict[str, float]]
+
+    layer_weight_vector: np.ndarray  # (len(LAYERS),)
+    escalation: np.ndarray  # (A,)
+    visibility: np.ndarray  # (A,)
+    personality_affordances: np.ndarray  # (4, A) for risk, aggression, nationalism, pragmatism
+    alignment_dims: tuple[str, ...]
+    alignment_index: np.ndarray  # positions of alignment_dims in MOTIVATION_DIMS
+    motivation_matrix: np.ndarray  # (len(alignment_dims), A)
+    role_bias_vector: np.ndarray  # (A,)
+    unilateral_vector: np.ndarray  # (A,)
+    interaction_weights: np.ndarray  # (K,)
+    interaction_profile: np.ndarray  # (A,) escalation-scaled share of each interaction effect
+
+
+def compile_formula(spec: CognitiveFormulaSpec | dict) -> CompiledFormula:
+    """Validate a spec and precompute the tables the engine evaluates against."""
+    if isinstance(spec, dict):
+        spec = CognitiveFormulaSpec(**spec)
+
+    if set(spec.layers) != set(LAYERS):
+        raise ValueError(f"Formula '{spec.name}' must weight exactly these layers: {', '.join(LAYERS)}")
+    if spec.combination != "linear":
+        raise ValueError(f"Formula '{spec.name}': unsupported combination '{spec.combination}'")
+
+    affordances = spec.action_affordances or ACTION_AFFORDANCES
+    role_bias = spec.role_bias or ROLE_BIAS
+    unilateral_shift = spec.unilateral_role_shift if spec.unilateral_role_shift is not None else UNILATERAL_ROLE_SHIFT
+    alignment = spec.motivation_alignment or MOTIVATION_ALIGNMENT
+
+    for table_name, table in (("action_affordances", affordances), ("role_bias", role_bias), ("motivation_alignment", alignment)):
+        if set(table) != set(ACTIONS):
+            raise ValueError(f"Formula '{spec.name}': {table_name} must cover exactly these actions: {', '.join(ACTIONS)}")
+    if not set(unilateral_shift) <= set(ACTIONS):
+        raise ValueError(f"Formula '{spec.name}': unilateral_role_shift names unknown actions")
+    for action, values in affordances.items():
+        missing = set(AFFORDANCE_KEYS) - set(values)
+        if missing:
+            raise ValueError(f"Formula '{spec.name}': affordances for {action} missing {', '.join(sorted(missing))}")
+    alignment_dims = tuple(alignment[ACTIONS[0]])
+    for action, values in alignment.items():
+        if tuple(values) != alignment_dims or not set(values) <= set(MOTIVATION_DIMS):
+            raise ValueError(f"Formula '{spec.name}': motivation_alignment for {action} must use the same motivation dimensions")
+
+    terms = []
+    for term in spec.interaction_terms:
+        if term.method != "multiply":
+            raise ValueError(f"Formula '{spec.name}': unsupported interaction method '{term.method}'")
+        operands = []
+        for ref in term.layers:
+            family, _, key = ref.partition(".")
+            if key not in INTERACTION_OPERANDS.get(family, ()):
+                raise ValueError(f"Formula '{spec.name}': unknown interaction operand '{ref}'")
+            operands.append((family, key))
+        terms.append(InteractionTerm(
+            description=f"{term.layers[0]} × {term.layers[1]}",
+            weight=term.weight,
+            operands=tuple(operands),
+        ))
+
+    escalation = np.array([affordances[a]["escalation"] for a in ACTIONS])
+    return CompiledFormula(
+        name=spec.name,
+        description=spec.description,
+        spec=spec,
+        layer_weights={layer: spec.layers[layer].weight for layer in LAYERS},
+        interaction_terms=tuple(terms),
+        affordances=affordances,
+        role_bias=role_bias,
+        unilateral_shift=unilateral_shift,
+        motivation_alignment=alignment,
+        layer_weight_vector=np.array([spec.layers[layer].weight for layer in LAYERS]),
+        escalation=escalation,
+        visibility=np.array([affordances[a]["visibility"] for a in ACTIONS]),
+        personality_affordances=np.array([
+            [affordances[a]["risk"] for a in ACTIONS],
+            [affordances[a]["escalation"] for a in ACTIONS],
+            [affordances[a]["sovereignty"] for a in ACTIONS],
+            [-affordances[a]["visibility"] for a in ACTIONS],
+        ]),
+        alignment_dims=alignment_dims,
+        alignment_index=np.array([MOTIVATION_DIMS.index(d) for d in alignment_dims], dtype=int),
+        motivation_matrix=np.array([[alignment[a][d] for a in ACTIONS] for d in alignment_dims]).reshape(len(alignment_dims), len(ACTIONS)),
+        role_bias_vector=np.array([role_bias[a] for a in ACTIONS]),
+        unilateral_vector=np.array([unilateral_shift.get(a, 0.0) for a in ACTIONS]),
+        interaction_weights=np.array([t.weight for t in terms]),
+        interaction_profile=np.maximum(0.0, escalation + 0.3),
+    )
+
+
+def load_formula_spec(path: Path) -> CognitiveFormulaSpec:
+    """Read a formula spec from a .json, .yaml or .yml file."""
+    text = path.read_text()
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as e:
+            raise ValueError(f"PyYAML is required to load {path.name}") from e
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    return CognitiveFormulaSpec(**data)
+
+
+def write_formula_spec(spec: CognitiveFormulaSpec, directory: Path = FORMULAS_DIR) -> Path:
+    """Write a spec as ``<name>.json`` where FormulaRegistry picks it up on startup."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{spec.name}.json"
+    path.write_text(spec.model_dump_json(indent=2, exclude_none=True) + "\n")
+    return path
+
+
+class FormulaRegistry:
+    """Compiled formulas resident side by side, looked up by version name."""
+
+    def __init__(self, directory: Path | None = FORMULAS_DIR):
+        self._formulas: dict[str, CompiledFormula] = {}
+        self.register(DEFAULT_FORMULA_SPEC)
+        if directory is not None:
+            self.load_directory(directory)
+
+    def register(self, spec: CognitiveFormulaSpec | dict) -> CompiledFormula:
+        formula = compile_formula(spec)
+        self._formulas[formula.name] = formula
+        return formula
+
+    def get(self, version: str | None = None) -> CompiledFormula:
+        version = version or DEFAULT_FORMULA_VERSION
+        if version not in self._formulas:
+            raise ValueError(f"Unknown formula version: {version}")
+        return self._formulas[version]
+
+    def versions(self) -> list[str]:
+        return list(self._formulas)
+
+    def specs(self) -> list[CognitiveFormulaSpec]:
+        return [f.spec for f in self._formulas.values()]
+
+    def load_directory(self, directory: Path) -> None:
+        if not directory.exists():
+            return
+        for filepath in sorted(directory.iterdir()):
+            if filepath.suffix not in (".json", ".yaml", ".yml"):
+                continue
+            try:
+                formula = self.register(load_formula_spec(filepath))
+                logger.info("Loaded cognitive formula: %s", formula.name)
+            except Exception as e:
+                logger.warning("Failed to load formula %s: %s", filepath.name, e)
@@ -0,0 +1,126 @@
+"""Coupled leader-population simulation.
+
+Elsewhere the leader's action feeds the population response and nothing flows
+back. Here each round the leader decides with its current approval and
+opposition, the population responds to the selected action, and that response
+becomes the leader's approval and opposition for the next round. Every
+leader/population/event row advances together: the layers that read the
+domestic context (belief, context) and the interaction terms are rescored each
+round, the rest are scored once from the engine's cached leader features.
+"""
+
+import numpy as np
+
+from grms.models.events import GeopoliticalEvent
+from grms.models.leader import LeaderProfile
+from grms.models.population import PopulationProfile
+from grms.models.responses import CoupledSimulationResponse, CoupledTrajectory
+from grms.services.baselines import CognitiveOnlyPredictor
+from grms.services.cognitive_engine import ACTIONS, LAYERS, CognitiveDecisionEngine
+from grms.services.cognitive_formula import BELIEF_KEYS
+from grms.services.population_service import PopulationService, action_type_mask, aggregate_segments
+
+APPROVAL_RESPONSE = 0.5  # share of the gap between approval and population support closed each round
+OPPOSITION_RESPONSE = 0.5  # share of the gap between opposition strength and oppose + protest closed each round
+PROTEST_LEVELS = ((0.3, "crisis"), (0.15, "major"), (0.05, "minor"))  # protest likelihood thresholds, else "none"
+
+_DOMESTIC_LAYERS = ("belief", "context")
+_DOMESTIC_LAYER_INDEX = [LAYERS.index(layer) for layer in _DOMESTIC_LAYERS]
+_DOMESTIC_SUPPORT = BELIEF_KEYS.index("domestic_support")
+_SELECTED_ACTION_MASK = np.array([action_type_mask([CognitiveOnlyPredictor.ACTION_TO_TYPE[a]]) for a in ACTIONS])
+
+
+def protest_level(likelihood: np.ndarray) -> np.ndarray:
+    """DomesticPressures.protest_level label for each protest likelihood."""
+    return np.select(
+        [likelihood >= threshold for threshold, _ in PROTEST_LEVELS],
+        [label for _, label in PROTEST_LEVELS],
+        default="none",
+    )
+
+
+class CoupledSimulationService:
+    def __init__(self, engine: CognitiveDecisionEngine, population_service: PopulationService):
+        self.engine = engine
+        self.population_service = population_service
+
+    def simulate(
+        self,
+        leaders: list[LeaderProfile],
+        populations: list[PopulationProfile],
+        events: list[GeopoliticalEvent],
+        rounds: int,
+        days_per_round: float = 7.0,
+        formula_version: str | None = None,
+    ) -> CoupledSimulationResponse:
+        """Run ``leaders[i]`` against ``populations[i]`` for every event, ``rounds`` rounds after the first.
+
+        Round 0 matches the one-way prediction: the cognitive-only decision for the
+        profile's own context, and the population's ``predict`` response to it.
+        """
+        if len(leaders) != len(populations):
+            raise ValueError("Each leader needs exactly one population")
+        formula = self.engine.formulas.get(formula_version)
+        pair_index = np.repeat(np.arange(len(leaders)), len(events))
+        event_index = np.tile(np.arange(len(events)), len(leaders))
+
+        inputs = self.engine.build_inputs(leaders, events, pair_index, event_index)
+        layer_scores = self.engine.layer_scores(inputs, formula)
+        dynamics = self.population_service.dynamics(populations, events, pair_index, event_index)
+        percentage = dynamics.segments.percentage
+
+        n_rows = len(pair_index)
+        shape = (rounds + 1, n_rows)
+        selected_log = np.empty(shape, dtype=int)
+        confidence_log, escalation_log = np.empty(shape), np.empty(shape)
+        approval_log, opposition_log = np.empty(shape), np.empty(shape)
+        protest_level_log = np.empty(shape, dtype=object)
+        support_log, oppose_log, protest_log = np.empty(shape), np.empty(shape), np.empty(shape)
+
+        levels = np.array([l.decision_context.domestic_pressures.protest_level for l in leaders], dtype=object)[pair_index]
+        for r in range(rounds + 1):
+            if r:
+                layer_scores[:, _DOMESTIC_LAYER_INDEX] = self.engine.layer_scores(inputs, formula, _DOMESTIC_LAYERS)
+            final = self.engine.combine(layer_scores, self.engine.interaction_magnitudes(inputs, formula), formula)
+            selected, confidence, escalation = self.engine.summarize(final, inputs.severity, formula)
+
+            segments = dynamics.advance(r * days_per_round, days_per_round if r else 0.0, _SELECTED_ACTION_MASK[selected][:, None])
+            support, oppose, _, protest = aggregate_segments(percentage, *segments)
+
+            selected_log[r], confidence_log[r], escalation_log[r] = selected, confidence, escalation
+            approval_log[r], opposition_log[r], protest_level_log[r] = inputs.approval, inputs.opposition, levels
+            support_log[r], oppose_log[r], protest_log[r] = support, oppose, protest
+
+            inputs.approval = np.clip(inputs.approval + APPROVAL_RESPONSE * (support * 100.0 - inputs.approval), 0.0, 100.0)
+            inputs.opposition = np.clip(
+                inputs.opposition + OPPOSITION_RESPONSE * (np.clip(oppose + protest, 0.0, 1.0) - inputs.opposition), 0.0, 1.0,
+            )
+            inputs.beliefs = inputs.beliefs.copy()
+            inputs.beliefs[:, _DOMESTIC_SUPPORT] = inputs.approval / 100.0
+            levels = protest_level(protest)
+
+        actions = np.array(ACTIONS, dtype=object)[selected_log]
+        return CoupledSimulationResponse(
+            formula_version=formula.name,
+            rounds=rounds,
+            days_per_round=days_per_round,
+            trajectories=[
+                CoupledTrajectory(
+                    leader_id=leaders[pair_index[n]].id,
+                    country=populations[pair_index[n]].country,
+                    period=populations[pair_index[n]].period,
+                    event_id=events[event_index[n]].id,
+                    day=[r * days_per_round for r in range(rounds + 1)],
+                    selected_action=actions[:, n].tolist(),
+                    confidence=confidence_log[:, n].tolist(),
+                    escalation_estimate=escalation_log[:, n].tolist(),
+                    approval_rating=approval_log[:, n].tolist(),
+                    opposition_strength=opposition_log[:, n].tolist(),
+                    protest_level=protest_level_log[:, n].tolist(),
+                    support_leader=support_log[:, n].tolist(),
+                    oppose_leader=oppose_log[:, n].tolist(),
+                    protest_likelihood=protest_log[:, n].tolist(),
+                )
+                for n in range(n_rows)
+            ],
+        )
@@ -0,0 +1,248 @@
+"""Information diffusion over a sparse graph of population nodes and their sources.
+
+Nodes are population segments, or groups of agents sharing a segment and a set
+of information sources. A node hears about an event through the sources it
+follows, in proportion to how engaged it is with each (social_media_activity for
+social media, media_exposure for everything else). Broadcast sources (state TV,
+newspapers, foreign media) carry an event at a rate set by its visibility; peer
+sources (social media, word of mouth, community networks) carry it only as fast
+as their aware audience passes it on. Reach is stepped hour by hour with sparse
+matrix-vector products over the node-source links, so the cost grows with the
+number of links rather than with the square of the node count.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+
+from grms.models.population import PopulationSegment
+from grms.services.agent_population import STATE_ALIGNED_SOURCE_MARKERS, AgentPopulation
+
+BROADCAST_RATE = 0.05  # hourly hazard per broadcast source at full visibility and media exposure
+PEER_RATE = 0.5  # hourly hazard per peer source once its whole audience is aware and amplifying
+PEER_SOURCE_MARKERS = (
+    "social_media", "word_of_mouth", "network", "association", "meeting", "leaders", "church", "agitator", "underground",
+)
+SATURATION_REACH = 0.9  # share of the reachable population that counts as saturated
+VIRAL_WINDOW_HOURS = 24  # viral_probability is the share reached through peer sources by then
+HORIZON_HOURS = 720
+COUNTER_NARRATIVE_REACH = 0.05  # distrustful audience an independent source must reach to carry a counter-narrative
+MAX_COUNTER_NARRATIVES = 3
+CURVE_CACHE_SIZE = 256  # single-event curves kept per graph, keyed by (visibility, severity)
+
+_MAX_DENSE_GROUPS = 1 << 20
+
+
+def is_peer_source(source: str) -> bool:
+    return any(marker in source for marker in PEER_SOURCE_MARKERS)
+
+
+def is_state_aligned_source(source: str) -> bool:
+    return any(marker in source for marker in STATE_ALIGNED_SOURCE_MARKERS)
+
+
+def _incidence(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    sources: tuple[str, ...],
+    media_exposure: np.ndarray,
+    social_media_activity: np.ndarray,
+) -> sparse.csr_array:
+    """(N, K) node-source links weighted by the node's engagement with each source."""
+    social = np.array(["social_media" in s for s in sources], dtype=bool)
+    engagement = np.where(social[cols], social_media_activity[rows], media_exposure[rows])
+    follows = sparse.csr_array((engagement, (rows, cols)), shape=(len(media_exposure), len(sources)))
+    follows.eliminate_zeros()
+    return follows
+
+
+@dataclass
+class DiffusionCurve:
+    """Reach of E events over time, sampled hourly until every event saturates or the horizon."""
+
+    hours: np.ndarray  # (T,)
+    reach: np.ndarray  # (T, E) population share aware of each event
+    peer_reach: np.ndarray  # (T, E) share that first heard through a peer source
+    reachable: np.ndarray  # (E,) share connected to any source that carries the event
+    aware: np.ndarray  # (N, E) share of each node aware at the last step
+
+    def time_to_saturation(self) -> np.ndarray:
+        """Hours until reach first passes SATURATION_REACH of the reachable share, interpolated between steps.
+
+        Events that never saturate within the horizon report the horizon.
+        """
+        target = SATURATION_REACH * self.reachable
+        passed = (self.reach >= target) & (self.reachable > 0)
+        hit = passed.any(axis=0)
+        index = np.where(hit, passed.argmax(axis=0), 0)
+        before = np.maximum(index - 1, 0)
+        columns = np.arange(self.reach.shape[1])
+        low, high = self.reach[before, columns], self.reach[index, columns]
+        fraction = np.where(high > low, (target - low) / np.where(high > low, high - low, 1.0), 0.0)
+        hours = self.hours[before] + fraction * (self.hours[index] - self.hours[before])
+        return np.where(hit, hours, float(HORIZON_HOURS))
+
+    def viral_probability(self) -> np.ndarray:
+        return np.clip(self.peer_reach[min(VIRAL_WINDOW_HOURS, len(self.hours) - 1)], 0.0, 1.0)
+
+
+@dataclass
+class DiffusionGraph:
+    """Population nodes linked to the information sources they follow.
+
+    ``follows`` is a sparse (N, K) matrix of each node's engagement with each
+    source. Node weights sum to the share of the population the graph covers.
+    """
+
+    sources: tuple[str, ...]
+    follows: sparse.csr_array
+    weight: np.ndarray  # (N,) population share of each node
+    amplification: np.ndarray  # (N,) how strongly an aware node passes the event on
+    government_trust: np.ndarray  # (N,)
+
+    def __post_init__(self):
+        peer = np.array([is_peer_source(s) for s in self.sources], dtype=bool)
+        self._peer_follows = self.follows[:, np.flatnonzero(peer)].tocsr()
+        self._peer_audience = self._peer_follows.T.tocsr()
+        self._broadcast_degree = self.follows[:, np.flatnonzero(~peer)].sum(axis=1)
+        self._audience_weight = self._peer_audience @ self.weight
+        self._curves: dict[tuple[float, float], DiffusionCurve] = {}
+
+    @classmethod
+    def from_segments(cls, segments: list[PopulationSegment]) -> "DiffusionGraph":
+        sources = tuple(sorted({src for s in segments for src in s.disposition.information_sources}))
+        index = {src: k for k, src in enumerate(sources)}
+        links = [(i, index[src]) for i, s in enumerate(segments) for src in set(s.disposition.information_sources)]
+        rows, cols = np.array(links, dtype=np.int64).reshape(-1, 2).T
+
+        def column(get) -> np.ndarray:
+            return np.array([get(s) for s in segments], dtype=float)
+
+        social_media = column(lambda s: s.disposition.social_media_activity)
+        return cls(
+            sources=sources,
+            follows=_incidence(rows, cols, sources, column(lambda s: s.disposition.media_exposure), social_media),
+            weight=column(lambda s: s.percentage),
+            amplification=column(lambda s: s.response_params.amplification_factor) * social_media,
+            government_trust=column(lambda s: s.disposition.government_trust),
+        )
+
+    @classmethod
+    def from_agents(cls, agents: AgentPopulation) -> "DiffusionGraph":
+        """Graph over agents, with agents that share a segment and source set merged into one node.
+
+        Every agent in such a group has the same exposure to every source, so the
+        group's aware share evolves exactly as each of its agents would; trust is
+        averaged over the group.
+        """
+        segments = agents.profile.segments
+        n_sources = len(agents.sources)
+        key = (agents.segment.astype(np.int64) << n_sources) | agents.source_mask
+        if len(segments) << n_sources <= _MAX_DENSE_GROUPS:
+            counts = np.bincount(key, minlength=len(segments) << n_sources)
+            trust = np.bincount(key, weights=agents.trust, minlength=len(counts))
+            groups = np.flatnonzero(counts)
+            counts, trust = counts[groups], trust[groups]
+        else:
+            groups, inverse, counts = np.unique(key, return_inverse=True, return_counts=True)
+            trust = np.bincount(inverse, weights=agents.trust)
+
+        segment = groups >> n_sources
+        mask = groups & ((1 << n_sources) - 1)
+        bits = np.arange(n_sources)
+        rows, cols = np.nonzero((mask[:, None] >> bits) & 1)
+
+        def column(get) -> np.ndarray:
+            return np.array([get(s) for s in segments], dtype=float)[segment]
+
+        social_media = column(lambda s: s.disposition.social_media_activity)
+        return cls(
+            sources=agents.sources,
+            follows=_incidence(rows, cols, agents.sources, column(lambda s: s.disposition.media_exposure), social_media),
+            weight=counts / max(len(agents), 1),
+            amplification=column(lambda s: s.response_params.amplification_factor) * social_media,
+            government_trust=trust / 255.0 / counts,
+        )
+
+    def __len__(self) -> int:
+        return len(self.weight)
+
+    def curve(self, visibility: float, severity: float) -> DiffusionCurve:
+        """``spread`` for a single event, memoized: the curve depends on nothing else."""
+        key = (float(visibility), float(severity))
+        cached = self._curves.get(key)
+        if cached is None:
+            if len(self._curves) >= CURVE_CACHE_SIZE:
+                del self._curves[next(iter(self._curves))]
+            cached = self._curves[key] = self.spread(np.array([visibility]), np.array([severity]))
+        return cached
+
+    def spread(self, visibility: np.ndarray, severity: np.ndarray, horizon: int = HORIZON_HOURS) -> DiffusionCurve:
+        """Step the aware share of every node forward hour by hour for E events at once.
+
+        Each hour a node that has not heard yet hears with probability
+        1 - exp(-hazard). The hazard sums the node's engagement with each source
+        times that source's intensity: BROADCAST_RATE * visibility for broadcast
+        sources, and for peer sources PEER_RATE * severity times the aware,
+        amplifying share of the source's engaged audience.
+        """
+        visibility = np.asarray(visibility, dtype=float)
+        severity = np.asarray(severity, dtype=float)
+        n_events = len(visibility)
+        broadcast = self._broadcast_degree[:, None] * (BROADCAST_RATE * visibility)
+        peer_scale = PEER_RATE * severity / np.maximum(self._audience_weight, 1e-12)[:, None]  # (Kp, E)
+        send = (self.weight * self.amplification)[:, None]
+
+        aware = np.zeros((len(self), n_events))
+        reach = [np.zeros(n_events)]
+        peer_reach = [np.zeros(n_events)]
+        reachable = self._reachable(visibility, severity)
+        target = SATURATION_REACH * reachable
+        for hour in range(1, horizon + 1):
+            peer = (self._peer_follows @ (peer_scale * (self._peer_audience @ (send * aware))))
+            hazard = broadcast + peer
+            heard = (1.0 - aware) * -np.expm1(-hazard)
+            aware += heard
+            reach.append(reach[-1] + self.weight @ heard)
+            peer_reach.append(peer_reach[-1] + self.weight @ (heard * np.divide(
+                peer, hazard, out=np.zeros_like(peer), where=hazard > 0,
+            )))
+            if hour >= VIRAL_WINDOW_HOURS and (reach[-1] >= target).all():
+                break
+
+        return DiffusionCurve(
+            hours=np.arange(len(reach), dtype=float),
+            reach=np.array(reach),
+            peer_reach=np.array(peer_reach),
+            reachable=reachable,
+            aware=aware,
+        )
+
+    def counter_narrative_sources(self, aware: np.ndarray) -> list[str]:
+        """Independent sources whose aware, distrustful audience is large enough to push back.
+
+        ``aware`` is one event's (N,) column of ``DiffusionCurve.aware``; sources are
+        ordered by that audience, largest first.
+        """
+        distrust = (self.follows > 0).T @ (self.weight * aware * (1.0 - self.government_trust))
+        ranked = sorted(
+            (
+                (float(share), source)
+                for source, share in zip(self.sources, distrust)
+                if share >= COUNTER_NARRATIVE_REACH and not is_state_aligned_source(source)
+            ),
+            reverse=True,
+        )
+        return [source for _, source in ranked[:MAX_COUNTER_NARRATIVES]]
+
+    def _reachable(self, visibility: np.ndarray, severity: np.ndarray) -> np.ndarray:
+        """Population share that can hear of each event: broadcast followers, then peer audiences they reach."""
+        reached = (self._broadcast_degree > 0)[:, None] & (visibility > 0)
+        amplifies = (self.amplification > 0)[:, None] & (severity > 0)
+        while True:
+            carrying = (self._peer_audience @ (reached & amplifies).astype(float)) > 0
+            extended = reached | ((self._peer_follows @ carrying.astype(float)) > 0)
+            if (extended == reached).all():
+                return self.weight @ reached
+            reached = extended
@@ -1,12 +1,16 @@
 """Leader prediction service - LLM-driven geopolitical response modeling."""
 
+import asyncio
 import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
 
 from grms.llm.base import get_provider
+from grms.llm.cache import cache_key, response_cache
+from grms.llm.scheduler import Priority, Ticket
 from grms.models.events import GeopoliticalEvent
 from grms.models.leader import LeaderProfile
 from grms.models.responses import (
@@ -15,6 +19,7 @@ from grms.models.responses import (
     ResponseReasoning,
     VerbalResponse,
 )
+from grms.services.cognitive_engine import CognitiveDecisionEngine, CognitivePrediction
 
 logger = logging.getLogger("grms.leader_service")
 
@@ -22,27 +27,90 @@ PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 jinja_env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
 
 
-class LeaderService:
-    def __init__(self):
-        self.provider = get_provider()
+@dataclass
+class _Flight:
+    """An LLM call in progress, its place in the scheduler's queue and how many requests are waiting on it."""
+
+    task: asyncio.Task
+    ticket: Ticket
+    waiters: int = 0
 
-    async def predict_hybrid(self, leader: LeaderProfile, event: GeopoliticalEvent) -> LeaderResponse:
-        """Run cognitive engine first, then use its output as a structured prior for the LLM."""
-        from grms.services.cognitive_engine import CognitiveDecisionEngine
 
-        engine = CognitiveDecisionEngine()
-        cognitive_result = engine.predict(leader, event)
+class LeaderService:
+    def __init__(self, cognitive_engine: CognitiveDecisionEngine | None = None):
+        self.provider = get_provider()
+        self.response_cache = response_cache
+        self.cognitive_engine = cognitive_engine or CognitiveDecisionEngine()
+        self._in_flight: dict[str, _Flight] = {}
+        self.llm_calls = 0
+        self.coalesced = 0
+
+    def coalescing_stats(self) -> dict:
+        return {"llm_calls": self.llm_calls, "coalesced": self.coalesced, "in_flight": len(self._in_flight)}
+
+    async def _generate(self, system_prompt: str, user_prompt: str, use_cache: bool, priority: Priority) -> str:
+        """Generate through the response cache, sharing one call among concurrent identical prompts.
+
+        Requests whose rendered prompts hash alike await the call already in
+        flight (unless ``use_cache`` is off, which always makes a fresh call). The
+        call runs at the highest priority of the requests waiting on it, and is
+        cancelled only once every one of them has gone away.
+        """
+        key = cache_key(self.provider, system_prompt, user_prompt)
+        flight = self._in_flight.get(key) if use_cache else None
+        if flight is None:
+            ticket = Ticket(priority)
+            flight = _Flight(asyncio.ensure_future(
+                self.response_cache.generate(self.provider, system_prompt, user_prompt, use_cache, ticket),
+            ), ticket)
+            self.llm_calls += 1
+            if use_cache:
+                self._in_flight[key] = flight
+                flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            flight.ticket.promote(priority)
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                self._forget(key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    async def predict_hybrid(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        formula_version: str | None = None,
+        trace: bool = False,
+        use_cache: bool = True,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> LeaderResponse:
+        """Run cognitive engine first, then use its output as a structured prior for the LLM.
+
+        ``use_cache=False`` skips the LLM response cache and refreshes it.
+        """
+        cognitive_result = self.cognitive_engine.predict_compact(leader, event, formula_version)
 
         system_prompt = self._build_system_prompt(leader)
         hybrid_template = jinja_env.get_template("leader_event_with_prior.jinja2")
         user_prompt = hybrid_template.render(
             context=leader.decision_context,
             event=event,
-            cognitive_result=cognitive_result,
+            cognitive_result=cognitive_result.trace,
         )
 
         try:
-            raw_response = await self.provider.generate(system_prompt, user_prompt)
+            raw_response = await self._generate(system_prompt, user_prompt, use_cache, priority)
         except Exception as e:
             logger.error(f"Hybrid LLM error: {e}")
             return self._fallback_response(leader, event)
@@ -50,7 +118,8 @@ class LeaderService:
         parsed = self._parse_response(raw_response, leader, event)
         validated = self._validate_citations(parsed, leader)
 
-        validated.cognitive_trace = cognitive_result
+        if trace:
+            validated.cognitive_trace = cognitive_result.trace
 
         esc_diff = abs(validated.escalation_risk - cognitive_result.escalation_estimate)
         action_overlap = self._compute_action_overlap(validated, cognitive_result)
@@ -61,7 +130,7 @@ class LeaderService:
 
         return validated
 
-    def _compute_action_overlap(self, response: LeaderResponse, cognitive_result) -> float:
+    def _compute_action_overlap(self, response: LeaderResponse, cognitive_result: CognitivePrediction) -> float:
         """How much the LLM's predicted actions overlap with the cognitive engine's top actions."""
         llm_types = set(a.action_type for a in response.actions)
         action_to_type = {
@@ -72,9 +141,9 @@ class LeaderService:
             "direct_confrontation": "military",
         }
         cognitive_types = set()
-        for action_score in cognitive_result.action_scores[:3]:
-            if action_score.final_score > 0:
-                cognitive_types.add(action_to_type.get(action_score.action, "diplomatic"))
+        for action, final_score in cognitive_result.top_actions(3):
+            if final_score > 0:
+                cognitive_types.add(action_to_type.get(action, "diplomatic"))
 
         if not llm_types or not cognitive_types:
             return 0.5
@@ -82,12 +151,18 @@ class LeaderService:
         union = len(llm_types | cognitive_types)
         return intersection / union if union > 0 else 0.0
 
-    async def predict(self, leader: LeaderProfile, event: GeopoliticalEvent) -> LeaderResponse:
+    async def predict(
+        self,
+        leader: LeaderProfile,
+        event: GeopoliticalEvent,
+        use_cache: bool = True,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> LeaderResponse:
         system_prompt = self._build_system_prompt(leader)
         user_prompt = self._build_event_prompt(leader, event)
 
         try:
-            raw_response = await self.provider.generate(system_prompt, user_prompt)
+            raw_response = await self._generate(system_prompt, user_prompt, use_cache, priority)
         except Exception as e:
             logger.error(f"LLM provider error: {e}")
             return self._fallback_response(leader, event)
@@ -1,93 +1,729 @@
 """Parametric population response model - no LLM, runs in milliseconds."""
 
+import hashlib
 import math
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, fields, replace
 
 import numpy as np
 
+from grms.config import settings
 from grms.models.events import GeopoliticalEvent
-from grms.models.population import PopulationProfile, PopulationSegment
+from grms.models.population import (
+    PopulationProfile,
+    PopulationSegment,
+    PopulationSweepAxis,
+    SegmentDisposition,
+    SegmentResponseParams,
+)
 from grms.models.responses import (
     InformationSpread,
+    PopulationBatchResponse,
     PopulationOverall,
     PopulationResponse,
+    PopulationSimulationStep,
+    PopulationSweepResult,
     PopulationTrajectory,
     SegmentResponse,
 )
+from grms.services.agent_population import AgentPopulation
+from grms.services.information_diffusion import DiffusionGraph
+
+
+VISIBILITY_MULTIPLIER = {"public": 1.0, "leaked": 0.6, "covert": 0.2}
+
+# Time-stepped simulation (``simulate``); rates are per day
+RALLY_DECAY_RATE = 0.05  # rally-around-the-flag effect halves in about two weeks
+ECONOMIC_PAIN_GROWTH = 0.03  # economic pain accumulates towards twice its initial level
+FATIGUE_SCALE = 0.1  # fatigue_rate * 0.1 * log(1 + days), the closed-form trajectory decay
+PROTEST_CONTAGION = 0.5  # weight of other segments' protest, scaled by social media activity
+
+AGENT_SAMPLES_PER_PROFILE = 4  # agent samples of different sizes kept per profile; persisted ones are never dropped
+PROTEST_CONTAGION_RATE = 0.5  # how fast contagion pressure builds
+
+# Alignment of the leader's actions with each segment, by nationalism band:
+# low below 0.3, high above 0.5, mid otherwise
+ACTION_TYPES = ("military", "diplomatic", "economic", "information", "internal")  # LeaderAction.action_type codes
+ACTION_TYPE_ALIGNMENT = {"military": (-0.1, 0.0, 0.0)}  # support shift per band when the leader takes this action type
+DEFENSIVE_NATIONALISM_ALIGNMENT = (0.0, 0.0, 0.1)  # per band, x nationalism, when the event hits self or is irreversible
+
+
+def _alignment_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Offsets (band, action type bitmask, defensive) and nationalism slopes (band, defensive)."""
+    offset = np.zeros((3, 1 << len(ACTION_TYPES), 2))
+    for bit, action_type in enumerate(ACTION_TYPES):
+        shift = np.array(ACTION_TYPE_ALIGNMENT.get(action_type, (0.0, 0.0, 0.0)))
+        has_type = (np.arange(1 << len(ACTION_TYPES)) >> bit) & 1
+        offset += shift[:, None, None] * has_type[None, :, None]
+    slope = np.stack([np.zeros(3), np.array(DEFENSIVE_NATIONALISM_ALIGNMENT)], axis=1)
+    return offset, slope
+
+
+_ALIGNMENT_OFFSET, _ALIGNMENT_SLOPE = _alignment_tables()
+
+
+def action_type_mask(action_types: Iterable[str]) -> int:
+    """Bitmask of the known ACTION_TYPES among ``action_types``; unknown codes are ignored."""
+    return sum(1 << ACTION_TYPES.index(t) for t in set(action_types) if t in ACTION_TYPES)
+
+
+def summary_action_mask(leader_action_summary: str) -> int:
+    """Action types read from a free-text summary, for callers without structured actions."""
+    return action_type_mask(["military"] if "military" in leader_action_summary.lower() else [])
+
+
+def nationalism_band(nationalism: np.ndarray) -> np.ndarray:
+    return (nationalism >= 0.3).astype(np.intp) + (nationalism > 0.5)
+
+
+# Numeric segment fields by path
+SEGMENT_FIELDS = (
+    *(
+        f"{group}.{name}"
+        for group, model in (("disposition", SegmentDisposition), ("response_params", SegmentResponseParams))
+        for name, info in model.model_fields.items()
+        if info.annotation is float
+    ),
+    "demographics.urbanization",
+)
+# The ones the static support and protest model reads, and so can be swept
+SWEEP_FIELDS = (
+    "disposition.government_trust",
+    "disposition.nationalism",
+    "disposition.social_media_activity",
+    "disposition.protest_propensity",
+    "disposition.compliance_baseline",
+    "response_params.rally_around_flag_coefficient",
+    "response_params.economic_sensitivity",
+)
+
+
+def _segment_field(segment: PopulationSegment, path: str) -> float:
+    value = segment
+    for part in path.split("."):
+        value = getattr(value, part)
+    return value
+
+
+@dataclass
+class SegmentColumns:
+    """Per-segment fields the response model reads, one array entry per segment.
+
+    Arrays are (S,) for one profile; ``stack`` pads several profiles to (P, 1, S_max)
+    so they broadcast against per-event factors shaped (E, 1).
+    """
+
+    percentage: np.ndarray
+    government_trust: np.ndarray
+    nationalism: np.ndarray
+    nationalism_band: np.ndarray  # index into the alignment tables
+    compliance_baseline: np.ndarray
+    protest_propensity: np.ndarray
+    rally_around_flag: np.ndarray
+    economic_sensitivity: np.ndarray
+    social_media_activity: np.ndarray
+    fatigue_rate: np.ndarray
+    mobilization: np.ndarray  # clip(urbanization * 0.6 + social_media_activity * 0.4)
+    amplification: np.ndarray  # amplification_factor * social_media_activity
+
+    @classmethod
+    def from_fields(cls, values: dict[str, np.ndarray]) -> "SegmentColumns":
+        """Derive the columns from raw segment fields keyed by path (see ``segment_fields``).
+
+        Arrays may carry leading dimensions, e.g. (G, S) for a grid of parameter values.
+        """
+        nationalism = values["disposition.nationalism"]
+        social_media = values["disposition.social_media_activity"]
+        return cls(
+            percentage=values["percentage"],
+            government_trust=values["disposition.government_trust"],
+            nationalism=nationalism,
+            nationalism_band=nationalism_band(nationalism),
+            compliance_baseline=values["disposition.compliance_baseline"],
+            protest_propensity=values["disposition.protest_propensity"],
+            rally_around_flag=values["response_params.rally_around_flag_coefficient"],
+            economic_sensitivity=values["response_params.economic_sensitivity"],
+            social_media_activity=social_media,
+            fatigue_rate=values["response_params.fatigue_rate"],
+            mobilization=np.clip(values["demographics.urbanization"] * 0.6 + social_media * 0.4, 0.0, 1.0),
+            amplification=values["response_params.amplification_factor"] * social_media,
+        )
+
+    @classmethod
+    def stack(cls, parts: list["SegmentColumns"]) -> "SegmentColumns":
+        """Pad with zero-percentage segments, which add nothing to population aggregates."""
+        width = max((len(p.percentage) for p in parts), default=0)
+        return cls(**{
+            f.name: np.stack([np.pad(getattr(p, f.name), (0, width - len(p.percentage))) for p in parts])[:, None, :]
+            for f in fields(cls)
+        })
+
+
+@dataclass
+class PopulationColumns:
+    """A population profile in columnar form, with its event-independent aggregates."""
+
+    profile: PopulationProfile
+    fingerprint: str
+    names: list[str]
+    fields: dict[str, np.ndarray]  # raw per-segment values keyed by path, e.g. "disposition.nationalism"
+    segments: SegmentColumns
+    concerns: list[list[str]]  # key concerns per segment for non-military events
+    military_concerns: list[list[str]]  # key concerns per segment for military_action events
+    compliance: float  # population-weighted compliance baseline
+    diffusion: DiffusionGraph  # segments linked to their information sources
+    avg_fatigue_rate: float
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_profile(cls, profile: PopulationProfile) -> "PopulationColumns":
+        segments = profile.segments
+
+        def column(get) -> np.ndarray:
+            return np.array([get(s) for s in segments], dtype=float)
+
+        values = {path: column(lambda s: _segment_field(s, path)) for path in ("percentage", *SEGMENT_FIELDS)}
+        return cls(
+            profile=profile,
+            fingerprint=profile_fingerprint(profile),
+            names=[s.name for s in segments],
+            fields=values,
+            segments=SegmentColumns.from_fields(values),
+            concerns=[_segment_concerns(s, military=False) for s in segments],
+            military_concerns=[_segment_concerns(s, military=True) for s in segments],
+            compliance=float(values["percentage"] @ values["disposition.compliance_baseline"]),
+            diffusion=DiffusionGraph.from_segments(segments),
+            avg_fatigue_rate=float(values["response_params.fatigue_rate"].mean()) if segments else 0.1,
+        )
+
+
+@dataclass
+class EventFactors:
+    """Event-dependent inputs to the segment response, arrays of shape (E, 1)."""
+
+    severity: np.ndarray
+    external_threat: np.ndarray  # 1.0 if actor != target
+    economic_impact: np.ndarray
+    defensive: np.ndarray  # bool: target is self or the act is irreversible
+    action_mask: np.ndarray  # int: bitmask of the leader's ACTION_TYPES
+    visibility: np.ndarray  # VISIBILITY_MULTIPLIER of the event
+
+
+@dataclass
+class SimulationState:
+    """Segment responses after one simulation step; arrays are (E, S)."""
+
+    step: int
+    day: float
+    support: np.ndarray
+    oppose: np.ndarray
+    neutral: np.ndarray
+    protest: np.ndarray
+    overall_support: np.ndarray  # (E,)
+    overall_oppose: np.ndarray
+    overall_neutral: np.ndarray
+    overall_protest: np.ndarray
+
+
+class SegmentDynamics:
+    """Time-dependent segment response to events, advanced one step at a time.
+
+    Segment arrays broadcast against event factors: (S,) against (E, 1) for one
+    profile and many events, or (R, S) against (R, 1) for R population/event rows.
+    Rally effects decay, economic pain accumulates and fatigue grows with each
+    segment's fatigue_rate. Protest spreads between segments in proportion to
+    their population share and social media activity.
+    """
+
+    def __init__(self, segments: SegmentColumns, factors: EventFactors):
+        self.segments = segments
+        self.factors = factors
+        self.rally = segments.rally_around_flag * factors.severity * factors.external_threat
+        self.economic_pain = segments.economic_sensitivity * factors.economic_impact
+        self.others_share = np.maximum(segments.percentage.sum(axis=-1, keepdims=True) - segments.percentage, 1e-9)
+        self.contagion = np.zeros(np.broadcast_shapes(self.rally.shape, segments.percentage.shape))
+        self.protest = np.zeros_like(self.contagion)
+
+    def advance(
+        self,
+        day: float,
+        dt: float,
+        action_mask: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Support, oppose, neutral and protest at ``day``, ``dt`` days after the previous step.
+
+        ``action_mask`` overrides the factor of that name, e.g. with the action a
+        leader just selected.
+        """
+        seg = self.segments
+        factors = self.factors if action_mask is None else replace(self.factors, action_mask=action_mask)
+        if dt:
+            weighted = self.protest * seg.percentage
+            exposure = (weighted.sum(axis=-1, keepdims=True) - weighted) / self.others_share
+            target = PROTEST_CONTAGION * seg.social_media_activity * exposure
+            self.contagion += (1.0 - math.exp(-PROTEST_CONTAGION_RATE * dt)) * (target - self.contagion)
+
+        support = np.clip(
+            seg.government_trust
+            + compute_alignment(seg, factors)
+            + self.rally * math.exp(-RALLY_DECAY_RATE * day)
+            - self.economic_pain * (2.0 - math.exp(-ECONOMIC_PAIN_GROWTH * day))
+            - seg.fatigue_rate * FATIGUE_SCALE * math.log1p(day),
+            0.0,
+            1.0,
+        )
+        oppose = np.clip((1.0 - support) * (1.0 - seg.compliance_baseline), 0.0, 1.0)
+        neutral = np.clip(1.0 - support - oppose, 0.0, 1.0)
+        self.protest = np.clip(seg.protest_propensity * oppose * seg.mobilization + self.contagion, 0.0, 1.0)
+        return support, oppose, neutral, self.protest
+
+
+def profile_fingerprint(population: PopulationProfile) -> str:
+    """Content hash of a population profile; changes whenever any modeled field changes."""
+    return hashlib.sha256(population.model_dump_json().encode()).hexdigest()[:16]
 
 
 class PopulationService:
+    def __init__(self):
+        self._columns: dict[tuple[str, str], PopulationColumns] = {}
+        self._agents: OrderedDict[tuple[str, str, int], tuple[AgentPopulation, DiffusionGraph]] = OrderedDict()
+        self._persisted: set[tuple[str, str, int]] = set()
+        self._agent_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._agent_locks_guard = threading.Lock()
+        self._responses: OrderedDict[tuple, PopulationResponse] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def columns(self, population: PopulationProfile) -> PopulationColumns:
+        """Columnar form of a profile, rebuilt only when a different profile object is passed."""
+        key = (population.country, population.period)
+        cached = self._columns.get(key)
+        if cached is None or cached.profile is not population:
+            cached = PopulationColumns.from_profile(population)
+            self._columns[key] = cached
+        return cached
+
+    def invalidate(self, country: str, period: str) -> None:
+        """Drop everything cached for a profile that was replaced."""
+        key = (country, period)
+        self._columns.pop(key, None)
+        for agents_key in [k for k in self._agents if k[:2] == key]:
+            del self._agents[agents_key]
+            self._persisted.discard(agents_key)
+        for cache_key in [k for k in self._responses if k[:2] == key]:
+            del self._responses[cache_key]
+
+    def cache_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._responses),
+            "max_size": settings.population_response_cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+        }
+
+    def agents(self, population: PopulationProfile, n_agents: int | None = None) -> AgentPopulation:
+        """Synthetic agents for a profile, sampled on first use and kept with the profile.
+
+        Defaults to one agent per person up to ``population_max_agents``. Each
+        size is its own sample, so asking for another size never discards the
+        state a persisted sample has accumulated.
+        """
+        with self._agent_lock(population):
+            return self._agent_state(population, n_agents)[1]
+
+    def _agent_lock(self, population: PopulationProfile) -> threading.Lock:
+        """Serialises sampling, responding and persisting for one profile across threadpool workers."""
+        with self._agent_locks_guard:
+            return self._agent_locks.setdefault((population.country, population.period), threading.Lock())
+
+    def _agent_state(
+        self, population: PopulationProfile, n_agents: int | None = None,
+    ) -> tuple[tuple[str, str, int], AgentPopulation, DiffusionGraph]:
+        """Cache key, agents and diffusion graph of one sample; call with the profile's agent lock held."""
+        if n_agents is None:
+            n_agents = min(population.total_population or settings.population_max_agents, settings.population_max_agents)
+        key = (population.country, population.period, n_agents)
+        cached = self._agents.get(key)
+        if cached is None or cached[0].profile is not population:
+            self._persisted.discard(key)
+            agents = AgentPopulation.sample(population, n_agents)
+            cached = self._agents[key] = (agents, DiffusionGraph.from_agents(agents))
+            self._evict_agents(key[:2])
+        self._agents.move_to_end(key)
+        return key, *cached
+
+    def _evict_agents(self, profile_key: tuple[str, str]) -> None:
+        """Drop the least recently used unpersisted samples of a profile beyond ``AGENT_SAMPLES_PER_PROFILE``."""
+        keys = [k for k in self._agents if k[:2] == profile_key]
+        for key in keys[:-1]:
+            if len(keys) <= AGENT_SAMPLES_PER_PROFILE:
+                break
+            if key not in self._persisted:
+                del self._agents[key]
+                keys.remove(key)
+
     def predict(
         self,
         population: PopulationProfile,
         event: GeopoliticalEvent,
         leader_action_summary: str = "",
+        leader_action_types: Sequence[str] | None = None,
     ) -> PopulationResponse:
-        segment_responses = []
-        for segment in population.segments:
-            sr = self._compute_segment_response(segment, event, leader_action_summary)
-            segment_responses.append(sr)
+        """Segment-level response, memoized on the profile and the event fields the model reads.
 
-        overall = self._aggregate(population.segments, segment_responses)
-        info_spread = self._compute_information_spread(population, event, segment_responses)
-        trajectory = self._compute_trajectory(overall, population, event)
+        The leader's actions are read from ``leader_action_types`` (LeaderAction.action_type
+        codes) when given, otherwise from the summary text. Replays of an event differ
+        only in ``event_id``, which is set on the cached copy.
+        """
+        cols = self.columns(population)
+        factors = self._event_factors([event], leader_action_summary, leader_action_types)
+        cache_key = (
+            population.country,
+            population.period,
+            cols.fingerprint,
+            event.event_type,
+            event.severity,
+            tuple(event.structured.model_dump().values()),
+            int(factors.action_mask[0, 0]),
+        )
+        cached = self._responses.get(cache_key)
+        if cached is not None:
+            self.cache_hits += 1
+            self._responses.move_to_end(cache_key)
+            return cached.model_copy(update={"event_id": event.id})
+
+        self.cache_misses += 1
+        response = self._predict(cols, event, factors)
+        if settings.population_response_cache_size > 0:
+            self._responses[cache_key] = response
+            while len(self._responses) > settings.population_response_cache_size:
+                self._responses.popitem(last=False)
+        return response.model_copy()
+
+    def _predict(
+        self,
+        cols: PopulationColumns,
+        event: GeopoliticalEvent,
+        factors: EventFactors,
+    ) -> PopulationResponse:
+        support, oppose, neutral, protest = (a[0] for a in self._segment_arrays(cols.segments, factors))
+
+        overall = self._aggregate(cols, support, oppose, neutral, protest)
+        info_spread = self._compute_information_spread(cols.diffusion, event)
+        trajectory = self._compute_trajectory(overall, cols)
 
         return PopulationResponse(
             event_id=event.id,
-            country=population.country,
+            country=cols.profile.country,
             overall=overall,
-            segment_responses=segment_responses,
+            segment_responses=self._segment_responses(cols, event, support, oppose, neutral, protest),
             information_spread=info_spread,
             trajectory=trajectory,
         )
 
-    def _compute_segment_response(
+    def predict_agents(
         self,
-        segment: PopulationSegment,
+        population: PopulationProfile,
         event: GeopoliticalEvent,
-        leader_action_summary: str,
-    ) -> SegmentResponse:
-        params = segment.response_params
-        disp = segment.disposition
-        baseline = disp.government_trust
+        leader_action_summary: str = "",
+        n_agents: int | None = None,
+        persist: bool = False,
+        leader_action_types: Sequence[str] | None = None,
+    ) -> PopulationResponse:
+        """Agent-level variant of ``predict``: every agent draws a stance, counted back per segment.
 
-        is_external_threat = event.structured.actor != event.structured.target
-        rally_effect = params.rally_around_flag_coefficient * event.severity * (1.0 if is_external_threat else 0.0)
+        With ``persist`` the agents' trust carries the event's effect into later predictions.
+        """
+        cols = self.columns(population)
+        factors = self._event_factors([event], leader_action_summary, leader_action_types)
+        seg = cols.segments
+        defensive = int(factors.defensive[0, 0])
+        with self._agent_lock(population):
+            key, agents, graph = self._agent_state(population, n_agents)
+            support, oppose, neutral, protest = agents.respond(
+                rally=seg.rally_around_flag * float(factors.severity[0, 0] * factors.external_threat[0, 0]),
+                economic_pain=seg.economic_sensitivity * float(factors.economic_impact[0, 0]),
+                alignment_offset=_ALIGNMENT_OFFSET[:, factors.action_mask[0, 0], defensive],
+                alignment_slope=_ALIGNMENT_SLOPE[:, defensive],
+                persist=persist,
+            )
+            if persist:
+                graph = DiffusionGraph.from_agents(agents)  # trust moved, so the counter-narrative audiences did too
+                if key in self._agents:  # not invalidated meanwhile
+                    self._agents[key] = (agents, graph)
+                    self._persisted.add(key)
+            information_spread = self._compute_information_spread(graph, event)
 
-        economic_pain = params.economic_sensitivity * self._event_economic_impact(event)
+        shares = agents.counts / max(len(agents), 1)
+        overall_support, overall_oppose, overall_neutral, overall_protest = (
+            float(v) for v in aggregate_segments(shares, support, oppose, neutral, protest)
+        )
+        overall = PopulationOverall(
+            support_leader=overall_support,
+            oppose_leader=overall_oppose,
+            neutral=overall_neutral,
+            protest_likelihood=overall_protest,
+            compliance_likelihood=float(np.clip(cols.compliance, 0.0, 1.0)),
+        )
 
-        fatigue = 0.0
+        return PopulationResponse(
+            event_id=event.id,
+            country=population.country,
+            overall=overall,
+            segment_responses=self._segment_responses(cols, event, support, oppose, neutral, protest),
+            information_spread=information_spread,
+            trajectory=self._compute_trajectory(overall, cols),
+        )
 
-        action_alignment = self._compute_alignment(segment, event, leader_action_summary)
+    def predict_many(
+        self,
+        populations: list[PopulationProfile],
+        events: list[GeopoliticalEvent],
+        leader_action_summary: str = "",
+        include_segments: bool = False,
+        leader_action_types: Sequence[str] | None = None,
+    ) -> PopulationBatchResponse:
+        """Overall response of every population to every event in one broadcast pass.
 
-        support = np.clip(baseline + rally_effect - economic_pain - fatigue + action_alignment, 0.0, 1.0)
-        oppose = np.clip((1.0 - support) * (1.0 - disp.compliance_baseline), 0.0, 1.0)
-        neutral = np.clip(1.0 - support - oppose, 0.0, 1.0)
+        Matches ``predict`` for each pair; the per-segment breakdown is built only
+        if ``include_segments``.
+        """
+        parts = [self.columns(p) for p in populations]
+        factors = self._event_factors(events, leader_action_summary, leader_action_types)
+        stacked = SegmentColumns.stack([c.segments for c in parts])
+        support, oppose, neutral, protest = self._segment_arrays(stacked, factors)  # (P, E, S)
+
+        overall_support, overall_oppose, overall_neutral, overall_protest = aggregate_segments(
+            stacked.percentage, support, oppose, neutral, protest,
+        )
+        viral = np.array([
+            c.diffusion.spread(factors.visibility[:, 0], factors.severity[:, 0]).viral_probability() for c in parts
+        ]).reshape(len(parts), len(events))
+
+        segment_responses = None
+        if include_segments:
+            segment_responses = [
+                [
+                    self._segment_responses(cols, event, *(a[p, e, :len(cols)] for a in (support, oppose, neutral, protest)))
+                    for e, event in enumerate(events)
+                ]
+                for p, cols in enumerate(parts)
+            ]
+
+        return PopulationBatchResponse(
+            countries=[p.country for p in populations],
+            periods=[p.period for p in populations],
+            event_ids=[e.id for e in events],
+            support_leader=overall_support.tolist(),
+            oppose_leader=overall_oppose.tolist(),
+            neutral=overall_neutral.tolist(),
+            protest_likelihood=overall_protest.tolist(),
+            compliance_likelihood=[float(np.clip(c.compliance, 0.0, 1.0)) for c in parts],
+            viral_probability=viral.tolist(),
+            segment_responses=segment_responses,
+        )
+
+    def sweep(
+        self,
+        population: PopulationProfile,
+        event: GeopoliticalEvent,
+        axes: list[PopulationSweepAxis],
+        leader_action_summary: str = "",
+        leader_action_types: Sequence[str] | None = None,
+    ) -> PopulationSweepResult:
+        """Overall response for every combination of one or two segment parameter values.
+
+        Works on the profile's cached raw fields rather than copies of the profile:
+        each swept field becomes an (n0, n1, S) array over the grid, and the whole
+        grid goes through ``_segment_arrays`` in one pass.
+        """
+        if not 1 <= len(axes) <= 2:
+            raise ValueError("A sweep takes one or two axes")
+        cols = self.columns(population)
+        shape = (len(axes[0].values), len(axes[1].values) if len(axes) == 2 else 1)
+        values = dict(cols.fields)
+        for k, axis in enumerate(axes):
+            if axis.field not in SWEEP_FIELDS:
+                raise ValueError(f"Cannot sweep '{axis.field}'; choose from: {', '.join(SWEEP_FIELDS)}")
+            selected = np.ones(len(cols), dtype=bool)
+            if axis.segments is not None:
+                unknown = sorted(set(axis.segments) - set(cols.names))
+                if unknown:
+                    raise ValueError(f"Unknown segments for {population.country}: {', '.join(unknown)}")
+                selected = np.array([name in axis.segments for name in cols.names], dtype=bool)
+            grid = np.array(axis.values, dtype=float).reshape((-1, 1, 1) if k == 0 else (1, -1, 1))
+            current = values[axis.field]
+            swept = grid * current if axis.mode == "scale" else np.broadcast_to(grid, np.broadcast_shapes(grid.shape, current.shape))
+            values[axis.field] = np.where(selected, np.clip(swept, 0.0, 1.0), current)
+
+        factors = self._event_factors([event], leader_action_summary, leader_action_types)
+        segments = SegmentColumns.from_fields(values)
+        support, oppose, _, protest = (
+            np.broadcast_to(v, shape) for v in aggregate_segments(segments.percentage, *self._segment_arrays(segments, factors))
+        )
+        return PopulationSweepResult(
+            country=population.country,
+            period=population.period,
+            event_id=event.id,
+            axes=axes,
+            baseline=self.predict(population, event, leader_action_summary, leader_action_types).overall,
+            support_leader=support.tolist(),
+            oppose_leader=oppose.tolist(),
+            protest_likelihood=protest.tolist(),
+        )
+
+    def simulate(
+        self,
+        population: PopulationProfile,
+        events: list[GeopoliticalEvent],
+        days: float,
+        steps_per_day: int = 1,
+        leader_action_summary: str = "",
+        leader_action_types: Sequence[str] | None = None,
+    ) -> Iterator[SimulationState]:
+        """Step segment responses forward for ``days``, one state per step, all events at once.
+
+        See ``SegmentDynamics`` for the per-step model. Step 0 is the static
+        ``predict`` response.
+        """
+        cols = self.columns(population)
+        dynamics = SegmentDynamics(cols.segments, self._event_factors(events, leader_action_summary, leader_action_types))
+        dt = 1.0 / steps_per_day
+
+        for step in range(int(round(days * steps_per_day)) + 1):
+            day = step * dt
+            support, oppose, neutral, protest = dynamics.advance(day, dt if step else 0.0)
+            yield SimulationState(step, day, support, oppose, neutral, protest,
+                                  *aggregate_segments(cols.segments.percentage, support, oppose, neutral, protest))
 
-        protest = disp.protest_propensity * oppose * self._mobilization_factor(segment)
-        amplification = params.amplification_factor * disp.social_media_activity
+    def dynamics(
+        self,
+        populations: list[PopulationProfile],
+        events: list[GeopoliticalEvent],
+        population_index: np.ndarray,
+        event_index: np.ndarray,
+        leader_action_summary: str = "",
+        leader_action_types: Sequence[str] | None = None,
+    ) -> SegmentDynamics:
+        """Dynamics for the (populations[population_index[r]], events[event_index[r]]) rows, arrays (R, S_max)."""
+        stacked = SegmentColumns.stack([self.columns(p).segments for p in populations])
+        rows = SegmentColumns(**{f.name: getattr(stacked, f.name)[population_index, 0] for f in fields(SegmentColumns)})
+        factors = self._event_factors(events, leader_action_summary, leader_action_types)
+        return SegmentDynamics(rows, EventFactors(**{f.name: getattr(factors, f.name)[event_index] for f in fields(EventFactors)}))
 
-        concerns = self._infer_concerns(segment, event)
+    def simulation_step(
+        self,
+        population: PopulationProfile,
+        event: GeopoliticalEvent,
+        state: SimulationState,
+        event_index: int = 0,
+        include_segments: bool = False,
+    ) -> PopulationSimulationStep:
+        """Snapshot of one event's row of a simulation state."""
+        cols = self.columns(population)
+        segment_responses = None
+        if include_segments:
+            segment_responses = self._segment_responses(
+                cols, event, *(a[event_index] for a in (state.support, state.oppose, state.neutral, state.protest)),
+            )
+        return PopulationSimulationStep(
+            event_id=event.id,
+            country=population.country,
+            step=state.step,
+            day=state.day,
+            overall=PopulationOverall(
+                support_leader=float(state.overall_support[event_index]),
+                oppose_leader=float(state.overall_oppose[event_index]),
+                neutral=float(state.overall_neutral[event_index]),
+                protest_likelihood=float(state.overall_protest[event_index]),
+                compliance_likelihood=float(np.clip(cols.compliance, 0.0, 1.0)),
+            ),
+            segment_responses=segment_responses,
+        )
 
-        return SegmentResponse(
-            segment_name=segment.name,
-            support=float(support),
-            oppose=float(oppose),
-            neutral=float(neutral),
-            amplification=float(amplification),
-            protest_propensity=float(np.clip(protest, 0.0, 1.0)),
-            key_concerns=concerns,
+    def _event_factors(
+        self,
+        events: list[GeopoliticalEvent],
+        leader_action_summary: str,
+        leader_action_types: Sequence[str] | None = None,
+    ) -> EventFactors:
+        def column(values, dtype=float) -> np.ndarray:
+            return np.array(values, dtype=dtype).reshape(len(events), 1)
+
+        return EventFactors(
+            severity=column([e.severity for e in events]),
+            external_threat=column([e.structured.actor != e.structured.target for e in events]),
+            economic_impact=column([self._event_economic_impact(e) for e in events]),
+            defensive=column(
+                [e.structured.target == "self" or e.structured.reversibility == "irreversible" for e in events], bool,
+            ),
+            action_mask=np.full(
+                (len(events), 1),
+                action_type_mask(leader_action_types) if leader_action_types is not None
+                else summary_action_mask(leader_action_summary),
+            ),
+            visibility=column([VISIBILITY_MULTIPLIER.get(e.structured.visibility, 0.5) for e in events]),
         )
 
+    def _segment_arrays(
+        self,
+        segments: SegmentColumns,
+        factors: EventFactors,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Support, oppose, neutral and protest propensity per event and segment."""
+        rally_effect = segments.rally_around_flag * factors.severity * factors.external_threat
+
+        economic_pain = segments.economic_sensitivity * factors.economic_impact
+
+        action_alignment = compute_alignment(segments, factors)
+
+        support = np.clip(segments.government_trust + rally_effect - economic_pain + action_alignment, 0.0, 1.0)
+        oppose = np.clip((1.0 - support) * (1.0 - segments.compliance_baseline), 0.0, 1.0)
+        neutral = np.clip(1.0 - support - oppose, 0.0, 1.0)
+        protest = np.clip(segments.protest_propensity * oppose * segments.mobilization, 0.0, 1.0)
+        return support, oppose, neutral, protest
+
+    def _segment_responses(
+        self,
+        cols: PopulationColumns,
+        event: GeopoliticalEvent,
+        support: np.ndarray,
+        oppose: np.ndarray,
+        neutral: np.ndarray,
+        protest: np.ndarray,
+    ) -> list[SegmentResponse]:
+        concerns = cols.military_concerns if event.event_type == "military_action" else cols.concerns
+        return [
+            SegmentResponse(
+                segment_name=name,
+                support=s,
+                oppose=o,
+                neutral=n,
+                amplification=a,
+                protest_propensity=p,
+                key_concerns=list(c),
+            )
+            for name, s, o, n, a, p, c in zip(
+                cols.names, support.tolist(), oppose.tolist(), neutral.tolist(),
+                cols.segments.amplification.tolist(), protest.tolist(), concerns,
+            )
+        ]
+
     def _aggregate(
         self,
-        segments: list[PopulationSegment],
-        responses: list[SegmentResponse],
+        cols: PopulationColumns,
+        support: np.ndarray,
+        oppose: np.ndarray,
+        neutral: np.ndarray,
+        protest: np.ndarray,
     ) -> PopulationOverall:
-        support = sum(s.percentage * r.support for s, r in zip(segments, responses))
-        oppose = sum(s.percentage * r.oppose for s, r in zip(segments, responses))
-        neutral = sum(s.percentage * r.neutral for s, r in zip(segments, responses))
-        protest = sum(s.percentage * r.protest_propensity for s, r in zip(segments, responses))
-        compliance = sum(s.percentage * s.disposition.compliance_baseline for s in segments)
+        support, oppose, neutral, protest = (
+            float(cols.segments.percentage @ v) for v in (support, oppose, neutral, protest)
+        )
 
         total = support + oppose + neutral
         if total > 0:
@@ -100,37 +736,26 @@ class PopulationService:
             oppose_leader=float(np.clip(oppose, 0.0, 1.0)),
             neutral=float(np.clip(neutral, 0.0, 1.0)),
             protest_likelihood=float(np.clip(protest, 0.0, 1.0)),
-            compliance_likelihood=float(np.clip(compliance, 0.0, 1.0)),
+            compliance_likelihood=float(np.clip(cols.compliance, 0.0, 1.0)),
         )
 
-    def _compute_information_spread(
-        self,
-        population: PopulationProfile,
-        event: GeopoliticalEvent,
-        responses: list[SegmentResponse],
-    ) -> InformationSpread:
-        max_amplification = max(r.amplification for r in responses) if responses else 0.0
-        visibility_mult = {"public": 1.0, "leaked": 0.6, "covert": 0.2}.get(event.structured.visibility, 0.5)
-        viral_prob = float(np.clip(max_amplification * visibility_mult * event.severity, 0.0, 1.0))
-
-        avg_media = np.mean([s.disposition.media_exposure for s in population.segments]) if population.segments else 0.5
-        base_hours = 48.0
-        saturation = base_hours / max(avg_media * visibility_mult, 0.1)
+    def _compute_information_spread(self, graph: DiffusionGraph, event: GeopoliticalEvent) -> InformationSpread:
+        visibility_mult = VISIBILITY_MULTIPLIER.get(event.structured.visibility, 0.5)
+        curve = graph.curve(visibility_mult, event.severity)
+        saturation = curve.time_to_saturation()[0]
 
         return InformationSpread(
-            viral_probability=viral_prob,
+            viral_probability=float(curve.viral_probability()[0]),
             dominant_narrative=f"Response to {event.structured.actor}'s {event.event_type}",
-            counter_narratives=[],
+            counter_narratives=[
+                f"Skepticism of the official account via {source.replace('_', ' ')}"
+                for source in graph.counter_narrative_sources(curve.aware[:, 0])
+            ],
             time_to_saturation_hours=float(np.clip(saturation, 1.0, 720.0)),
         )
 
-    def _compute_trajectory(
-        self,
-        overall: PopulationOverall,
-        population: PopulationProfile,
-        event: GeopoliticalEvent,
-    ) -> PopulationTrajectory:
-        avg_fatigue_rate = np.mean([s.response_params.fatigue_rate for s in population.segments]) if population.segments else 0.1
+    def _compute_trajectory(self, overall: PopulationOverall, cols: PopulationColumns) -> PopulationTrajectory:
+        avg_fatigue_rate = cols.avg_fatigue_rate
 
         support_7d = overall.support_leader - avg_fatigue_rate * math.log(1 + 7) * 0.1
         support_30d = overall.support_leader - avg_fatigue_rate * math.log(1 + 30) * 0.1
@@ -149,28 +774,54 @@ class PopulationService:
             return event.severity * 0.6
         return event.severity * 0.1
 
-    def _mobilization_factor(self, segment: PopulationSegment) -> float:
-        urban = segment.demographics.urbanization
-        social = segment.disposition.social_media_activity
-        return float(np.clip(urban * 0.6 + social * 0.4, 0.0, 1.0))
-
-    def _compute_alignment(self, segment: PopulationSegment, event: GeopoliticalEvent, leader_action: str) -> float:
-        nationalism = segment.disposition.nationalism
-        is_defensive = event.structured.target == "self" or event.structured.reversibility == "irreversible"
-        if is_defensive and nationalism > 0.5:
-            return 0.1 * nationalism
-        if "military" in leader_action.lower() and nationalism < 0.3:
-            return -0.1
-        return 0.0
-
-    def _infer_concerns(self, segment: PopulationSegment, event: GeopoliticalEvent) -> list[str]:
-        concerns = []
-        if segment.response_params.economic_sensitivity > 0.6:
-            concerns.append("economic impact")
-        if segment.disposition.protest_propensity > 0.4:
-            concerns.append("civil liberties")
-        if event.event_type == "military_action":
-            concerns.append("security")
-        if segment.demographics.economic_class == "lower":
-            concerns.append("basic needs")
-        return concerns[:3]
+
+
+def compute_alignment(segments: SegmentColumns, factors: EventFactors) -> np.ndarray:
+    """Support shift from how the leader's actions and the event sit with each segment's nationalism.
+
+    One lookup per segment into the tables built from ACTION_TYPE_ALIGNMENT and
+    DEFENSIVE_NATIONALISM_ALIGNMENT.
+    """
+    band = segments.nationalism_band
+    defensive = factors.defensive.astype(np.intp)
+    return (
+        _ALIGNMENT_OFFSET[band, factors.action_mask, defensive]
+        + _ALIGNMENT_SLOPE[band, defensive] * segments.nationalism
+    )
+
+
+def aggregate_segments(
+    percentage: np.ndarray,
+    support: np.ndarray,
+    oppose: np.ndarray,
+    neutral: np.ndarray,
+    protest: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Population-weighted support, oppose, neutral and protest over the last (segment) axis.
+
+    Support, oppose and neutral are renormalized to sum to one, as in ``predict``.
+    """
+    support, oppose, neutral, protest = (
+        np.einsum("...s,...s->...", np.broadcast_to(percentage, v.shape), v) for v in (support, oppose, neutral, protest)
+    )
+    total = support + oppose + neutral
+    scale = np.where(total > 0, 1.0 / np.where(total > 0, total, 1.0), 1.0)
+    return (
+        np.clip(support * scale, 0.0, 1.0),
+        np.clip(oppose * scale, 0.0, 1.0),
+        np.clip(neutral * scale, 0.0, 1.0),
+        np.clip(protest, 0.0, 1.0),
+    )
+
+
+def _segment_concerns(segment: PopulationSegment, military: bool) -> list[str]:
+    concerns = []
+    if segment.response_params.economic_sensitivity > 0.6:
+        concerns.append("economic impact")
+    if segment.disposition.protest_propensity > 0.4:
+        concerns.append("civil liberties")
+    if military:
+        concerns.append("security")
+    if segment.demographics.economic_class == "lower":
+        concerns.append("basic needs")
+    return concerns[:3]
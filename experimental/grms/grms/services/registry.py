@@ -0,0 +1,127 @@
+"""In-memory registries of leader and population profiles with secondary indexes.
+
+Every ``put`` (or ``touch`` after an in-place edit) bumps the entry's version and
+notifies subscribers, so caches keyed on a profile can drop what they built from
+the previous version.
+"""
+
+from collections.abc import Callable, Iterator, Mapping
+from itertools import count
+from uuid import UUID
+
+from grms.models.leader import LeaderProfile
+from grms.models.population import PopulationProfile
+
+
+class LeaderRegistry(Mapping[UUID, LeaderProfile]):
+    """Leaders by id, indexed by period and by name (case-insensitive)."""
+
+    def __init__(self):
+        self._profiles: dict[UUID, LeaderProfile] = {}
+        self._versions: dict[UUID, int] = {}
+        self._by_period: dict[str, dict[UUID, None]] = {}  # ordered sets, in registration order
+        self._by_name: dict[str, dict[UUID, None]] = {}
+        self._subscribers: list[Callable[[UUID], None]] = []
+        self._clock = count(1)
+
+    def __getitem__(self, leader_id: UUID) -> LeaderProfile:
+        return self._profiles[leader_id]
+
+    def __iter__(self) -> Iterator[UUID]:
+        return iter(self._profiles)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def subscribe(self, callback: Callable[[UUID], None]) -> None:
+        """Call ``callback(leader_id)`` whenever a stored leader is replaced or touched."""
+        self._subscribers.append(callback)
+
+    def put(self, profile: LeaderProfile) -> int:
+        """Store or replace a leader; returns its new version."""
+        previous = self._profiles.get(profile.id)
+        if previous is not None:
+            self._unindex(previous)
+        self._profiles[profile.id] = profile
+        self._by_period.setdefault(profile.period, {})[profile.id] = None
+        self._by_name.setdefault(profile.name.casefold(), {})[profile.id] = None
+        return self._bump(profile.id, notify=previous is not None)
+
+    def touch(self, leader_id: UUID) -> int:
+        """Record an in-place edit of a stored leader (e.g. its decision context)."""
+        return self._bump(leader_id, notify=True)
+
+    def version(self, leader_id: UUID) -> int:
+        return self._versions[leader_id]
+
+    def by_period(self, period: str) -> list[LeaderProfile]:
+        return [self._profiles[i] for i in self._by_period.get(period, ())]
+
+    def by_name(self, name: str) -> list[LeaderProfile]:
+        return [self._profiles[i] for i in self._by_name.get(name.casefold(), ())]
+
+    def _unindex(self, profile: LeaderProfile) -> None:
+        for index, key in ((self._by_period, profile.period), (self._by_name, profile.name.casefold())):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(profile.id, None)
+                if not ids:
+                    del index[key]
+
+    def _bump(self, leader_id: UUID, notify: bool) -> int:
+        self._versions[leader_id] = version = next(self._clock)
+        if notify:
+            for callback in self._subscribers:
+                callback(leader_id)
+        return version
+
+
+class PopulationRegistry(Mapping[tuple[str, str], PopulationProfile]):
+    """Populations by (country, period), indexed by country."""
+
+    def __init__(self):
+        self._profiles: dict[tuple[str, str], PopulationProfile] = {}
+        self._versions: dict[tuple[str, str], int] = {}
+        self._periods: dict[str, dict[str, None]] = {}  # country -> periods in registration order
+        self._subscribers: list[Callable[[str, str], None]] = []
+        self._clock = count(1)
+
+    def __getitem__(self, key: tuple[str, str]) -> PopulationProfile:
+        return self._profiles[key]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self._profiles)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def subscribe(self, callback: Callable[[str, str], None]) -> None:
+        """Call ``callback(country, period)`` whenever a stored profile is replaced."""
+        self._subscribers.append(callback)
+
+    def put(self, profile: PopulationProfile) -> int:
+        """Store or replace the profile for its (country, period); returns its new version."""
+        key = (profile.country, profile.period)
+        replaced = key in self._profiles
+        self._profiles[key] = profile
+        self._periods.setdefault(profile.country, {})[profile.period] = None
+        self._versions[key] = version = next(self._clock)
+        if replaced:
+            for callback in self._subscribers:
+                callback(*key)
+        return version
+
+    def version(self, country: str, period: str) -> int:
+        return self._versions[(country, period)]
+
+    def periods(self, country: str) -> list[str]:
+        return list(self._periods.get(country, ()))
+
+    def resolve(self, country: str, period: str = "current", fallback: bool = True) -> PopulationProfile | None:
+        """The profile for (country, period), else with ``fallback`` the country's first registered period."""
+        profile = self._profiles.get((country, period))
+        if profile is None and fallback:
+            periods = self._periods.get(country)
+            if periods:
+                profile = self._profiles[(country, next(iter(periods)))]
+        return profile
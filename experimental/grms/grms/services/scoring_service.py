@@ -4,6 +4,7 @@ Batch runs still produce aggregate metrics (RMSE, bias, accuracy) for the scorin
 table, but each individual case also creates/updates a SavedPrediction with its score.
 """
 
+import asyncio
 import logging
 import math
 
@@ -19,6 +20,7 @@ from grms.models.scoring import (
     ScoreDimension,
     ScoringCase,
 )
+from grms.llm.scheduler import Priority
 from grms.prompt_hash import compute_prompt_hash
 from grms.services.leader_service import LeaderService
 
@@ -55,10 +57,12 @@ DIMENSION_WEIGHTS = {
 
 
 class ScoringService:
-    def __init__(self):
-        self.leader_service = LeaderService()
+    def __init__(self, leader_service: LeaderService | None = None):
+        self.leader_service = leader_service or LeaderService()
 
-    async def run_ablation(self, cases: list[ScoringCase], include_generic_llm: bool = True) -> AblationResult:
+    async def run_ablation(
+        self, cases: list[ScoringCase], include_generic_llm: bool = True, use_cache: bool = True,
+    ) -> AblationResult:
         """Run all baselines + full model side-by-side to demonstrate value-add."""
         from grms.services.baselines import (
             CognitiveOnlyPredictor,
@@ -73,14 +77,14 @@ class ScoringService:
             "cognitive_only": CognitiveOnlyPredictor(),
         }
         if include_generic_llm:
-            baselines["generic_llm"] = GenericLLMPredictor()
+            baselines["generic_llm"] = GenericLLMPredictor(use_cache, Priority.BATCH)
 
         full_scores: list[float] = []
         baseline_scores: dict[str, list[float]] = {name: [] for name in baselines}
         case_results: list[AblationCaseResult] = []
 
         for case in cases:
-            full_result = await self._score_case(case)
+            full_result = await self._score_case(case, use_cache)
             full_scores.append(full_result.overall_score)
 
             case_baseline_scores = {}
@@ -160,17 +164,20 @@ class ScoringService:
         total_weight = sum(DIMENSION_WEIGHTS.get(d.dimension, 1.0) for d in dimensions)
         return sum(d.score * DIMENSION_WEIGHTS.get(d.dimension, 1.0) for d in dimensions) / max(total_weight, 0.01)
 
-    async def run_batch(self, cases: list[ScoringCase]) -> BatchRunResult:
+    async def run_batch(self, cases: list[ScoringCase], use_cache: bool = True) -> BatchRunResult:
+        """Score every case, all submitted at once at batch priority; the LLM scheduler paces the calls."""
         results: list[CaseResult] = []
         failures: list[str] = []
 
-        for case in cases:
-            try:
-                result = await self._score_case(case)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to score case '{case.label}': {e}")
-                failures.append(f"{case.label}: {e}")
+        outcomes = await asyncio.gather(
+            *(self._score_case(case, use_cache) for case in cases), return_exceptions=True,
+        )
+        for case, outcome in zip(cases, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to score case '{case.label}': {outcome}")
+                failures.append(f"{case.label}: {outcome}")
+            else:
+                results.append(outcome)
 
         aggregate_score = sum(r.overall_score for r in results) / max(len(results), 1)
 
@@ -278,8 +285,8 @@ class ScoringService:
         except Exception as e:
             logger.warning("Failed to persist scoring run: %s", e)
 
-    async def _score_case(self, case: ScoringCase) -> CaseResult:
-        response = await self.leader_service.predict(case.leader, case.event)
+    async def _score_case(self, case: ScoringCase, use_cache: bool = True) -> CaseResult:
+        response = await self.leader_service.predict(case.leader, case.event, use_cache, Priority.BATCH)
 
         dimensions: list[ScoreDimension] = []
         known = case.known_outcome